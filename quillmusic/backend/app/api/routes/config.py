@@ -1,11 +1,13 @@
 """
 Config and feature flags API routes
 """
-from fastapi import APIRouter
+from functools import lru_cache
+from fastapi import APIRouter, Header, Response
 from pydantic import BaseModel, Field
 from typing import Literal, Optional
 
-from app.core.config import settings
+from app.core.config import settings, InstrumentalEngineConfig
+from app.core.http_cache import STATIC_CACHE_CONTROL, etag_matches, make_etag
 
 router = APIRouter(prefix="/config", tags=["config"])
 
@@ -39,29 +41,83 @@ class AppConfig(BaseModel):
     features: FeatureFlags = Field(..., description="Feature flags")
 
 
+def _settings_version() -> tuple:
+    """
+    Snapshot the settings values the app config depends on.
+
+    Used as the memoization key, so swapping or overriding settings
+    produces a fresh config instead of a stale cached one.
+    """
+    return (
+        settings.APP_NAME,
+        settings.APP_VERSION,
+        settings.AUDIO_PROVIDER,
+        settings.AUDIO_API_BASE_URL,
+        settings.AUDIO_API_KEY,
+        tuple(settings.instrumental_engines),
+    )
+
+
+def _get_cached_config() -> tuple[AppConfig, str]:
+    """Get the application config and its ETag for the current settings."""
+    return _build_app_config(*_settings_version())
+
+
 @router.get("/", response_model=AppConfig)
-async def get_config():
+async def get_config(
+    response: Response,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+):
     """
     Get application configuration and feature flags.
 
     This endpoint allows the frontend to discover what features are available
-    based on backend configuration.
+    based on backend configuration. Clients that send back the ETag in
+    If-None-Match receive an empty 304 response.
+    """
+    app_config, etag = _get_cached_config()
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL},
+        )
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+    return app_config
+
+
+@lru_cache(maxsize=1)
+def _build_app_config(
+    app_name: str,
+    app_version: str,
+    audio_provider: Optional[str],
+    audio_api_base_url: Optional[str],
+    audio_api_key: Optional[str],
+    engines: tuple[InstrumentalEngineConfig, ...],
+) -> tuple[AppConfig, str]:
+    """
+    Build the application config and its ETag.
+
+    The result is a pure function of the settings snapshot, so it is memoized:
+    repeat requests reuse the same (immutable) AppConfig instead of rebuilding
+    the nested models on every call.
     """
     # Check if external audio is properly configured (legacy)
     external_available = (
-        settings.AUDIO_PROVIDER == "stable_audio_http"
-        and settings.AUDIO_API_BASE_URL is not None
-        and settings.AUDIO_API_KEY is not None
+        audio_provider == "stable_audio_http"
+        and audio_api_base_url is not None
+        and audio_api_key is not None
     )
 
     # Determine available models based on provider (legacy)
     available_models = []
-    if settings.AUDIO_PROVIDER == "stable_audio_http":
+    if audio_provider == "stable_audio_http":
         available_models = [
             "Stable Audio 2.0",
             "Stable Audio Open",
         ]
-    elif settings.AUDIO_PROVIDER == "musicgen":
+    elif audio_provider == "musicgen":
         available_models = [
             "MusicGen Small",
             "MusicGen Medium",
@@ -70,7 +126,7 @@ async def get_config():
 
     # Build list of instrumental engines from config
     instrumental_engines = []
-    for engine_config in settings.instrumental_engines:
+    for engine_config in engines:
         # Engine is available if it's fake or has base_url configured
         is_available = (
             engine_config.engine_type == "fake" or
@@ -90,16 +146,17 @@ async def get_config():
         for e in instrumental_engines
     )
 
-    return AppConfig(
-        app_name=settings.APP_NAME,
-        app_version=settings.APP_VERSION,
+    app_config = AppConfig(
+        app_name=app_name,
+        app_version=app_version,
         features=FeatureFlags(
             external_instrumental_available=external_available or any_external_available,
             audio_provider=AudioProviderInfo(
-                provider=settings.AUDIO_PROVIDER or "fake",
+                provider=audio_provider or "fake",
                 available=external_available,
                 models=available_models,
             ),
             instrumental_engines=instrumental_engines,
         ),
     )
+    return app_config, make_etag(app_config)
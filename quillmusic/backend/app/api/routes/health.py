@@ -1,19 +1,45 @@
 """
 Health check endpoint
 """
-from fastapi import APIRouter
+from typing import Optional
+from fastapi import APIRouter, Header, Response
 
 from app.core.config import settings
+from app.core.http_cache import STATIC_CACHE_CONTROL, etag_matches, make_etag
 from app.schemas.health import HealthResponse
 
 router = APIRouter()
 
+# Cached (settings, response, etag) for the active settings instance
+_health_cache: Optional[tuple[object, HealthResponse, str]] = None
+
+
+def _get_cached_health() -> tuple[HealthResponse, str]:
+    """Get the health response and its ETag, building them once per settings instance."""
+    global _health_cache
+    if _health_cache is None or _health_cache[0] is not settings:
+        health = HealthResponse(
+            status="ok",
+            service=settings.APP_NAME,
+            version=settings.APP_VERSION,
+        )
+        _health_cache = (settings, health, make_etag(health))
+    return _health_cache[1], _health_cache[2]
+
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(
+    response: Response,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+):
     """Health check endpoint."""
-    return HealthResponse(
-        status="ok",
-        service=settings.APP_NAME,
-        version=settings.APP_VERSION,
-    )
+    health, etag = _get_cached_health()
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL},
+        )
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+    return health
@@ -2,82 +2,226 @@
 HitMaker API routes for song analysis and AI-driven improvement suggestions.
 """
 
-import json
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Union
+
+from fastapi import APIRouter, Body, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.database import get_db
+from app.core.dependencies import get_hitmaker_engine
+from app.core.responses import ModelJSONResponse
 from app.models.blueprint import SongBlueprintModel
-from app.models.manual import ManualProjectModel
+from app.models.manual import ManualProjectModel, PatternModel, TrackModel
 from app.schemas.hitmaker import (
     HitMakerAnalysis,
     HitMakerInfluenceRequest,
     HitMakerInfluenceResponse,
+    HitMakerRequest,
 )
 from app.schemas.song import SongBlueprintResponse
+from app.services.hitmaker_cache import analysis_key, cache_analysis, get_cached_analysis
 from app.services.hitmaker_engine import HitMakerEngine
 
 router = APIRouter()
 
 
+def _load_blueprint(db: Session, blueprint_id: str) -> SongBlueprintResponse:
+    """Load a stored blueprint, raising 404 if it does not exist."""
+    blueprint_model = db.get(SongBlueprintModel, blueprint_id)
+
+    if not blueprint_model:
+        raise HTTPException(status_code=404, detail=f"Blueprint {blueprint_id} not found")
+
+    return SongBlueprintResponse.model_validate_json(blueprint_model.blueprint_json)
+
+
+def _load_manual_project(db: Session, manual_project_id: str) -> ManualProjectModel:
+    """Load a manual project with all relations, raising 404 if it does not exist."""
+    # Eager-load the whole graph so the engine never triggers lazy loads
+    project = db.get(
+        ManualProjectModel,
+        manual_project_id,
+        options=[
+            selectinload(ManualProjectModel.tracks)
+            .selectinload(TrackModel.patterns)
+            .selectinload(PatternModel.notes)
+        ],
+    )
+
+    if not project:
+        raise HTTPException(status_code=404, detail=f"Manual project {manual_project_id} not found")
+
+    return project
+
+
+def _cached_analysis(key: str, analyze) -> Union[HitMakerAnalysis, bytes]:
+    """Return the cached analysis JSON for key, or run analyze() and cache its result."""
+    cached = get_cached_analysis(key)
+    if cached is not None:
+        return cached
+
+    analysis = analyze()
+    cache_analysis(key, analysis)
+    return analysis
+
+
+def _as_analysis(analysis: Union[HitMakerAnalysis, bytes]) -> HitMakerAnalysis:
+    """Parse a cached analysis, passing fresh ones through."""
+    if isinstance(analysis, bytes):
+        return HitMakerAnalysis.model_validate_json(analysis)
+    return analysis
+
+
+def _cached_blueprint_analysis(
+    db: Session, engine: HitMakerEngine, blueprint_id: str
+) -> Union[HitMakerAnalysis, bytes]:
+    """Analyze a blueprint, or return the cached analysis JSON if there is one."""
+    return _cached_analysis(
+        analysis_key("blueprint", blueprint_id),
+        lambda: engine.analyze_blueprint(_load_blueprint(db, blueprint_id)),
+    )
+
+
+def _manual_analysis_key(db: Session, manual_project_id: str) -> str:
+    """
+    Build the analysis cache key for a manual project's current revision.
+
+    Only the project's updated_at is read, so the key costs one small query
+    and the full graph need only be loaded on a cache miss.
+    """
+    updated_at = db.scalar(
+        select(ManualProjectModel.updated_at).where(ManualProjectModel.id == manual_project_id)
+    )
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail=f"Manual project {manual_project_id} not found")
+
+    return analysis_key("manual_project", manual_project_id, updated_at)
+
+
+def _cached_manual_analysis(
+    db: Session, engine: HitMakerEngine, manual_project_id: str
+) -> Union[HitMakerAnalysis, bytes]:
+    """Analyze a manual project, or return the cached analysis JSON if there is one."""
+    return _cached_analysis(
+        _manual_analysis_key(db, manual_project_id),
+        lambda: engine.analyze_manual_project(_load_manual_project(db, manual_project_id)),
+    )
+
+
+def _analyze_blueprint(request, db: Session, engine: HitMakerEngine) -> Union[HitMakerAnalysis, bytes]:
+    return _cached_blueprint_analysis(db, engine, request.blueprint_id)
+
+
+def _analyze_manual(request, db: Session, engine: HitMakerEngine) -> Union[HitMakerAnalysis, bytes]:
+    return _cached_manual_analysis(db, engine, request.manual_project_id)
+
+
+# Influence requests start from the same cached analysis as the analyze
+# endpoints, so only the suggestions are computed for an unchanged source
+
+def _influence_blueprint(
+    request: HitMakerInfluenceRequest, db: Session, engine: HitMakerEngine
+) -> HitMakerInfluenceResponse:
+    blueprint = _load_blueprint(db, request.source_blueprint_id)
+    analysis = _cached_analysis(
+        analysis_key("blueprint", request.source_blueprint_id),
+        lambda: engine.analyze_blueprint(blueprint),
+    )
+    return engine.apply_influences_to_blueprint(
+        blueprint,
+        request.influences,
+        request.target_mood,
+        request.target_genre,
+        current_analysis=_as_analysis(analysis),
+    )
+
+
+def _influence_manual(
+    request: HitMakerInfluenceRequest, db: Session, engine: HitMakerEngine
+) -> HitMakerInfluenceResponse:
+    manual_project_id = request.source_manual_project_id
+    key = _manual_analysis_key(db, manual_project_id)
+    cached = get_cached_analysis(key)
+    if cached is not None:
+        # Influences applied to an existing analysis only read the project
+        # row itself, so its tracks, patterns and notes are not loaded
+        project = db.get(ManualProjectModel, manual_project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail=f"Manual project {manual_project_id} not found")
+        analysis = HitMakerAnalysis.model_validate_json(cached)
+    else:
+        project = _load_manual_project(db, manual_project_id)
+        analysis = engine.analyze_manual_project(project)
+        cache_analysis(key, analysis)
+
+    return engine.apply_influences_to_project(
+        project,
+        request.influences,
+        request.target_mood,
+        request.target_genre,
+        current_analysis=analysis,
+    )
+
+
+# Handlers for the unified endpoint, keyed by request "kind"
+_HANDLERS = {
+    "analyze_blueprint": _analyze_blueprint,
+    "analyze_manual": _analyze_manual,
+    "influence_blueprint": _influence_blueprint,
+    "influence_manual": _influence_manual,
+}
+
+
+@router.post("/analyze", response_model=Union[HitMakerAnalysis, HitMakerInfluenceResponse])
+def run_hitmaker(
+    request: HitMakerRequest = Body(..., discriminator="kind"),
+    db: Session = Depends(get_db),
+    engine: HitMakerEngine = Depends(get_hitmaker_engine),
+):
+    """
+    Run any HitMaker operation through a single endpoint.
+
+    The request "kind" selects the operation (analyze_blueprint,
+    analyze_manual, influence_blueprint, influence_manual); the remaining
+    fields match the dedicated endpoints below.
+    """
+    return ModelJSONResponse(_HANDLERS[request.kind](request, db, engine))
+
+
 @router.post("/analyze/blueprint", response_model=HitMakerAnalysis)
 def analyze_blueprint(
     blueprint_id: str,
     db: Session = Depends(get_db),
+    engine: HitMakerEngine = Depends(get_hitmaker_engine),
 ):
     """
     Analyze an AI-generated song blueprint for hit potential.
 
     Returns DNA profile, HitScore breakdown, and actionable insights.
     """
-    # Load blueprint from database
-    blueprint_model = db.query(SongBlueprintModel).filter(
-        SongBlueprintModel.id == blueprint_id
-    ).first()
-
-    if not blueprint_model:
-        raise HTTPException(status_code=404, detail=f"Blueprint {blueprint_id} not found")
-
-    # Parse blueprint JSON
-    blueprint_data = json.loads(blueprint_model.blueprint_json)
-    blueprint = SongBlueprintResponse(**blueprint_data)
-
-    # Analyze
-    engine = HitMakerEngine()
-    analysis = engine.analyze_blueprint(blueprint)
-
-    return analysis
+    return ModelJSONResponse(_cached_blueprint_analysis(db, engine, blueprint_id))
 
 
 @router.post("/analyze/manual", response_model=HitMakerAnalysis)
 def analyze_manual_project(
     manual_project_id: str,
     db: Session = Depends(get_db),
+    engine: HitMakerEngine = Depends(get_hitmaker_engine),
 ):
     """
     Analyze a Manual Creator project for hit potential.
 
     Returns DNA profile, HitScore breakdown, and actionable insights.
     """
-    # Load project with all relations
-    project = db.query(ManualProjectModel).filter(
-        ManualProjectModel.id == manual_project_id
-    ).first()
-
-    if not project:
-        raise HTTPException(status_code=404, detail=f"Manual project {manual_project_id} not found")
-
-    # Analyze
-    engine = HitMakerEngine()
-    analysis = engine.analyze_manual_project(project)
-
-    return analysis
+    return ModelJSONResponse(_cached_manual_analysis(db, engine, manual_project_id))
 
 
 @router.post("/influence/blueprint", response_model=HitMakerInfluenceResponse)
 def apply_influences_to_blueprint(
     request: HitMakerInfluenceRequest,
     db: Session = Depends(get_db),
+    engine: HitMakerEngine = Depends(get_hitmaker_engine),
 ):
     """
     Apply artistic influences to an AI blueprint.
@@ -88,45 +232,14 @@ def apply_influences_to_blueprint(
     if not request.source_blueprint_id:
         raise HTTPException(status_code=400, detail="source_blueprint_id is required")
 
-    # Load blueprint
-    blueprint_model = db.query(SongBlueprintModel).filter(
-        SongBlueprintModel.id == request.source_blueprint_id
-    ).first()
-
-    if not blueprint_model:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Blueprint {request.source_blueprint_id} not found"
-        )
-
-    # Parse blueprint
-    blueprint_data = json.loads(blueprint_model.blueprint_json)
-    blueprint = SongBlueprintResponse(**blueprint_data)
-
-    # Validate influences
-    total_weight = sum(inf.weight for inf in request.influences)
-    if total_weight > 1.2:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Total influence weight {total_weight:.2f} exceeds 1.2"
-        )
-
-    # Apply influences
-    engine = HitMakerEngine()
-    response = engine.apply_influences_to_blueprint(
-        blueprint,
-        request.influences,
-        request.target_mood,
-        request.target_genre,
-    )
-
-    return response
+    return ModelJSONResponse(_influence_blueprint(request, db, engine))
 
 
 @router.post("/influence/manual", response_model=HitMakerInfluenceResponse)
 def apply_influences_to_manual(
     request: HitMakerInfluenceRequest,
     db: Session = Depends(get_db),
+    engine: HitMakerEngine = Depends(get_hitmaker_engine),
 ):
     """
     Apply artistic influences to a Manual Creator project.
@@ -137,32 +250,4 @@ def apply_influences_to_manual(
     if not request.source_manual_project_id:
         raise HTTPException(status_code=400, detail="source_manual_project_id is required")
 
-    # Load project
-    project = db.query(ManualProjectModel).filter(
-        ManualProjectModel.id == request.source_manual_project_id
-    ).first()
-
-    if not project:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Manual project {request.source_manual_project_id} not found"
-        )
-
-    # Validate influences
-    total_weight = sum(inf.weight for inf in request.influences)
-    if total_weight > 1.2:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Total influence weight {total_weight:.2f} exceeds 1.2"
-        )
-
-    # Apply influences
-    engine = HitMakerEngine()
-    response = engine.apply_influences_to_project(
-        project,
-        request.influences,
-        request.target_mood,
-        request.target_genre,
-    )
-
-    return response
+    return ModelJSONResponse(_influence_manual(request, db, engine))
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.responses import ModelJSONResponse
 from app.schemas.instrumental import InstrumentalRenderRequest, InstrumentalRenderStatus
 from app.services.instrumental_render_service import create_instrumental_job, get_instrumental_job
 
@@ -24,7 +25,7 @@ def render_instrumental(
     """
     try:
         status = create_instrumental_job(request, db)
-        return status
+        return ModelJSONResponse(status)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -39,7 +40,7 @@ def get_job_status(
     """Get the status of an instrumental render job."""
     try:
         status = get_instrumental_job(job_id, db)
-        return status
+        return ModelJSONResponse(status)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
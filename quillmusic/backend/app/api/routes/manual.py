@@ -1,17 +1,27 @@
 """
 Manual Creator API routes - DAW-style manual song projects
 """
-import uuid
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Literal, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import bindparam, delete, insert, select, update as sql_update
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.database import get_db
+from app.core.http_cache import no_store
+from app.core.responses import ModelJSONResponse
 from app.models.manual import (
     ManualProjectModel,
     TrackModel,
     PatternModel,
     NoteModel,
+    generate_id,
 )
 from app.schemas.manual import (
     ManualProjectCreate,
@@ -25,74 +35,102 @@ from app.schemas.manual import (
     Pattern,
     NoteCreate,
     Note,
+    NotesColumnar,
+    NotesPacked,
+    MANUAL_PROJECT_LIST,
+    NOTE_CREATE_LIST,
+    NOTE_LIST,
 )
 
 router = APIRouter(prefix="/manual", tags=["manual"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_BATCH_SIZE = 500
 
-# ========== Helper Functions ==========
-
-def model_to_project(model: ManualProjectModel) -> ManualProject:
-    """Convert ManualProjectModel to ManualProject schema."""
-    return ManualProject(
-        id=model.id,
-        name=model.name,
-        tempo_bpm=model.tempo_bpm,
-        time_signature=model.time_signature,
-        key=model.key,
-        description=model.description,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
-    )
-
-
-def model_to_track(model: TrackModel) -> Track:
-    """Convert TrackModel to Track schema."""
-    return Track(
-        id=model.id,
-        project_id=model.project_id,
-        name=model.name,
-        instrument_type=model.instrument_type,
-        channel_index=model.channel_index,
-        volume=model.volume,
-        pan=model.pan,
-        muted=model.muted,
-        solo=model.solo,
+# Note statements are built once with bound parameters so every request reuses
+# the same compiled SQL from the engine's statement cache
+_PATTERN_EXISTS = select(PatternModel.id).where(PatternModel.id == bindparam("pattern_id"))
+_SELECT_PATTERN_NOTES = (
+    select(NoteModel)
+    .where(NoteModel.pattern_id == bindparam("pattern_id"))
+    .order_by(NoteModel.step_index)
+)
+# Streamed notes are read as plain rows of the Note response fields; rows from
+# the database need no validation, so they are encoded without building ORM
+# objects or Note models
+_SELECT_PATTERN_NOTE_ROWS = (
+    select(*(NoteModel.__table__.c[field] for field in Note.model_fields))
+    .where(NoteModel.pattern_id == bindparam("pattern_id"))
+    .order_by(NoteModel.step_index)
+)
+# A project's notes in project detail order (track channel, pattern start, step)
+_SELECT_PROJECT_NOTE_ROWS = (
+    select(*(NoteModel.__table__.c[field] for field in Note.model_fields))
+    .join(PatternModel, NoteModel.pattern_id == PatternModel.id)
+    .join(TrackModel, PatternModel.track_id == TrackModel.id)
+    .where(TrackModel.project_id == bindparam("project_id"))
+    .order_by(TrackModel.channel_index, PatternModel.start_bar, NoteModel.step_index)
+)
+_DELETE_PATTERN_NOTES = delete(NoteModel).where(NoteModel.pattern_id == bindparam("pattern_id"))
+
+
+def _update_returning(db: Session, model, row_id: str, values: dict):
+    """
+    Apply a partial update to a row and return it in a single statement.
+
+    Only the given columns are written, so callers pass just the fields the
+    client set. Returns None if no row with the given id exists. With nothing
+    to change, the row is simply loaded.
+    """
+    if not values:
+        return db.get(model, row_id)
+
+    return db.scalars(
+        sql_update(model)
+        .where(model.id == row_id)
+        .values(**values)
+        .returning(model)
+    ).first()
+
+
+def _touch_project(db: Session, project_id) -> Optional[str]:
+    """
+    Bump a project's updated_at, marking a change anywhere in its tree.
+
+    project_id may be a scalar subquery resolving a child row to its project.
+    Returns the project id, or None if no project matched.
+    """
+    return db.scalar(
+        sql_update(ManualProjectModel)
+        .where(ManualProjectModel.id == project_id)
+        .values(updated_at=datetime.utcnow())
+        .returning(ManualProjectModel.id),
+        execution_options={"synchronize_session": False},
     )
 
 
-def model_to_pattern(model: PatternModel) -> Pattern:
-    """Convert PatternModel to Pattern schema."""
-    return Pattern(
-        id=model.id,
-        track_id=model.track_id,
-        name=model.name,
-        length_bars=model.length_bars,
-        start_bar=model.start_bar,
-    )
+def _project_of_track(track_id: str):
+    return select(TrackModel.project_id).where(TrackModel.id == track_id).scalar_subquery()
 
 
-def model_to_note(model: NoteModel) -> Note:
-    """Convert NoteModel to Note schema."""
-    return Note(
-        id=model.id,
-        pattern_id=model.pattern_id,
-        step_index=model.step_index,
-        pitch=model.pitch,
-        velocity=model.velocity,
+def _project_of_pattern(pattern_id: str):
+    return (
+        select(TrackModel.project_id)
+        .join(PatternModel, PatternModel.track_id == TrackModel.id)
+        .where(PatternModel.id == pattern_id)
+        .scalar_subquery()
     )
 
 
 # ========== Project Endpoints ==========
 
-@router.post("/projects", response_model=ManualProject)
+@router.post("/projects", response_model=ManualProject, dependencies=[Depends(no_store)])
 def create_project(
     project: ManualProjectCreate,
     db: Session = Depends(get_db),
 ):
     """Create a new manual project."""
     db_project = ManualProjectModel(
-        id=str(uuid.uuid4()),
         name=project.name,
         tempo_bpm=project.tempo_bpm,
         time_signature=project.time_signature,
@@ -101,69 +139,126 @@ def create_project(
     )
     db.add(db_project)
     db.commit()
-    db.refresh(db_project)
-    return model_to_project(db_project)
+    return ManualProject.model_validate(db_project)
 
 
 @router.get("/projects", response_model=List[ManualProject])
 def list_projects(db: Session = Depends(get_db)):
     """List all manual projects."""
     projects = db.query(ManualProjectModel).order_by(ManualProjectModel.updated_at.desc()).all()
-    return [model_to_project(p) for p in projects]
+    return ModelJSONResponse(MANUAL_PROJECT_LIST.dump_json([ManualProject.from_row(p) for p in projects]))
+
+
+# Builders for each project detail notes_layout
+_NOTE_LAYOUTS = {
+    "rows": lambda notes: [Note.from_row(n) for n in notes],
+    "columnar": NotesColumnar.from_rows,
+    "packed": NotesPacked.from_rows,
+}
 
 
 @router.get("/projects/{project_id}", response_model=ManualProjectDetail)
 def get_project_detail(
     project_id: str,
+    notes_layout: Literal["rows", "columnar", "packed"] = "rows",
+    stream: bool = False,
     db: Session = Depends(get_db),
 ):
-    """Get detailed project information including all tracks, patterns, and notes."""
-    # Fetch project
-    project = db.query(ManualProjectModel).filter(ManualProjectModel.id == project_id).first()
+    """
+    Get detailed project information including all tracks, patterns, and notes.
+
+    Unset optional fields (e.g. a project without a key) are omitted from the
+    response rather than sent as null, keeping large project payloads small.
+    The rows are already schema-correct, so the response is built without
+    validation and serialized once.
+
+    With notes_layout=columnar the notes are sent as parallel lists (see
+    NotesColumnar) rather than one object per note; notes_layout=packed also
+    packs step, pitch and velocity into 6 bytes per note (see NotesPacked).
+
+    With stream=true (rows layout only) the same document is streamed, with
+    the notes encoded batch by batch as they are fetched instead of being
+    loaded into memory all at once.
+    """
+    if stream and notes_layout != "rows":
+        raise HTTPException(status_code=400, detail="stream requires notes_layout=rows")
+
+    # Fetch project with its whole track/pattern/note graph eagerly loaded;
+    # streamed notes are read separately, so only tracks and patterns then
+    relations = selectinload(ManualProjectModel.tracks).selectinload(TrackModel.patterns)
+    if not stream:
+        relations = relations.selectinload(PatternModel.notes)
+    project = db.get(ManualProjectModel, project_id, options=[relations])
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Fetch all tracks for this project
-    tracks = db.query(TrackModel).filter(TrackModel.project_id == project_id).order_by(TrackModel.channel_index).all()
-    track_ids = [t.id for t in tracks]
-
-    # Fetch all patterns for these tracks
-    patterns = []
-    if track_ids:
-        patterns = db.query(PatternModel).filter(PatternModel.track_id.in_(track_ids)).all()
-    pattern_ids = [p.id for p in patterns]
-
-    # Fetch all notes for these patterns
-    notes = []
-    if pattern_ids:
-        notes = db.query(NoteModel).filter(NoteModel.pattern_id.in_(pattern_ids)).all()
-
-    return ManualProjectDetail(
-        project=model_to_project(project),
-        tracks=[model_to_track(t) for t in tracks],
-        patterns=[model_to_pattern(p) for p in patterns],
-        notes=[model_to_note(n) for n in notes],
+    tracks = project.tracks
+    patterns = [p for t in tracks for p in t.patterns]
+
+    if stream:
+        head = ManualProjectDetail.model_construct(
+            project=ManualProject.from_row(project),
+            tracks=[Track.from_row(t) for t in tracks],
+            patterns=[Pattern.from_row(p) for p in patterns],
+            notes=[],
+        ).model_dump_json(exclude_none=True)
+        return StreamingResponse(
+            _stream_project_notes(db, head, {"project_id": project_id}),
+            media_type="application/json",
+        )
+
+    notes = [n for p in patterns for n in p.notes]
+
+    detail = ManualProjectDetail.model_construct(
+        project=ManualProject.from_row(project),
+        tracks=[Track.from_row(t) for t in tracks],
+        patterns=[Pattern.from_row(p) for p in patterns],
+        notes=_NOTE_LAYOUTS[notes_layout](notes),
     )
+    return Response(content=detail.model_dump_json(exclude_none=True), media_type="application/json")
+
 
+def _stream_project_notes(db: Session, head: str, params: dict):
+    """
+    Yield a project detail document, streaming its notes in batches.
 
-@router.delete("/projects/{project_id}")
+    head is the detail serialized with no notes; notes is its last field, so
+    the document is head up to the empty notes array, the note batches, and
+    the closing brackets.
+    """
+    yield head[:-len("]}")].encode("utf-8")
+    rows = db.execute(
+        _SELECT_PROJECT_NOTE_ROWS, params, execution_options={"yield_per": NDJSON_BATCH_SIZE}
+    )
+    separator = b""
+    for batch in rows.partitions():
+        yield separator + orjson.dumps([row._asdict() for row in batch])[1:-1]
+        separator = b","
+    yield b"]}"
+
+
+@router.delete("/projects/{project_id}", dependencies=[Depends(no_store)])
 def delete_project(
     project_id: str,
     db: Session = Depends(get_db),
 ):
     """Delete a project and all its related data."""
-    project = db.query(ManualProjectModel).filter(ManualProjectModel.id == project_id).first()
-    if not project:
+    # Tracks, patterns and notes are removed by the ON DELETE CASCADE foreign keys
+    result = db.execute(
+        delete(ManualProjectModel)
+        .where(ManualProjectModel.id == project_id)
+        .returning(ManualProjectModel.id)
+    )
+    if result.scalar() is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    db.delete(project)
     db.commit()
     return {"message": "Project deleted successfully"}
 
 
 # ========== Track Endpoints ==========
 
-@router.post("/projects/{project_id}/tracks", response_model=Track)
+@router.post("/projects/{project_id}/tracks", response_model=Track, dependencies=[Depends(no_store)])
 def create_track(
     project_id: str,
     track: TrackCreate,
@@ -171,12 +266,10 @@ def create_track(
 ):
     """Create a new track for a project."""
     # Verify project exists
-    project = db.query(ManualProjectModel).filter(ManualProjectModel.id == project_id).first()
-    if not project:
+    if _touch_project(db, project_id) is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
     db_track = TrackModel(
-        id=str(uuid.uuid4()),
         project_id=project_id,
         name=track.name,
         instrument_type=track.instrument_type,
@@ -184,58 +277,47 @@ def create_track(
     )
     db.add(db_track)
     db.commit()
-    db.refresh(db_track)
-    return model_to_track(db_track)
+    return Track.model_validate(db_track)
 
 
-@router.patch("/tracks/{track_id}", response_model=Track)
+@router.patch("/tracks/{track_id}", response_model=Track, dependencies=[Depends(no_store)])
 def update_track(
     track_id: str,
     update: TrackUpdate,
     db: Session = Depends(get_db),
 ):
     """Update track properties."""
-    track = db.query(TrackModel).filter(TrackModel.id == track_id).first()
-    if not track:
+    changed = update.model_dump(exclude_unset=True, exclude_none=True)
+    track = _update_returning(db, TrackModel, track_id, changed)
+    if track is None:
         raise HTTPException(status_code=404, detail="Track not found")
-
-    # Update fields if provided
-    if update.name is not None:
-        track.name = update.name
-    if update.volume is not None:
-        track.volume = update.volume
-    if update.pan is not None:
-        track.pan = update.pan
-    if update.muted is not None:
-        track.muted = update.muted
-    if update.solo is not None:
-        track.solo = update.solo
-    if update.channel_index is not None:
-        track.channel_index = update.channel_index
+    if changed:
+        _touch_project(db, track.project_id)
 
     db.commit()
-    db.refresh(track)
-    return model_to_track(track)
+    return Track.model_validate(track)
 
 
-@router.delete("/tracks/{track_id}")
+@router.delete("/tracks/{track_id}", dependencies=[Depends(no_store)])
 def delete_track(
     track_id: str,
     db: Session = Depends(get_db),
 ):
     """Delete a track and all its patterns/notes."""
-    track = db.query(TrackModel).filter(TrackModel.id == track_id).first()
-    if not track:
+    _touch_project(db, _project_of_track(track_id))
+    result = db.execute(
+        delete(TrackModel).where(TrackModel.id == track_id).returning(TrackModel.id)
+    )
+    if result.scalar() is None:
         raise HTTPException(status_code=404, detail="Track not found")
 
-    db.delete(track)
     db.commit()
     return {"message": "Track deleted successfully"}
 
 
 # ========== Pattern Endpoints ==========
 
-@router.post("/tracks/{track_id}/patterns", response_model=Pattern)
+@router.post("/tracks/{track_id}/patterns", response_model=Pattern, dependencies=[Depends(no_store)])
 def create_pattern(
     track_id: str,
     pattern: PatternCreate,
@@ -243,12 +325,10 @@ def create_pattern(
 ):
     """Create a new pattern for a track."""
     # Verify track exists
-    track = db.query(TrackModel).filter(TrackModel.id == track_id).first()
-    if not track:
+    if _touch_project(db, _project_of_track(track_id)) is None:
         raise HTTPException(status_code=404, detail="Track not found")
 
     db_pattern = PatternModel(
-        id=str(uuid.uuid4()),
         track_id=track_id,
         name=pattern.name,
         length_bars=pattern.length_bars,
@@ -256,45 +336,40 @@ def create_pattern(
     )
     db.add(db_pattern)
     db.commit()
-    db.refresh(db_pattern)
-    return model_to_pattern(db_pattern)
+    return Pattern.model_validate(db_pattern)
 
 
-@router.patch("/patterns/{pattern_id}", response_model=Pattern)
+@router.patch("/patterns/{pattern_id}", response_model=Pattern, dependencies=[Depends(no_store)])
 def update_pattern(
     pattern_id: str,
     update: PatternUpdate,
     db: Session = Depends(get_db),
 ):
     """Update pattern properties."""
-    pattern = db.query(PatternModel).filter(PatternModel.id == pattern_id).first()
-    if not pattern:
+    changed = update.model_dump(exclude_unset=True, exclude_none=True)
+    pattern = _update_returning(db, PatternModel, pattern_id, changed)
+    if pattern is None:
         raise HTTPException(status_code=404, detail="Pattern not found")
-
-    # Update fields if provided
-    if update.name is not None:
-        pattern.name = update.name
-    if update.length_bars is not None:
-        pattern.length_bars = update.length_bars
-    if update.start_bar is not None:
-        pattern.start_bar = update.start_bar
+    if changed:
+        _touch_project(db, _project_of_pattern(pattern_id))
 
     db.commit()
-    db.refresh(pattern)
-    return model_to_pattern(pattern)
+    return Pattern.model_validate(pattern)
 
 
-@router.delete("/patterns/{pattern_id}")
+@router.delete("/patterns/{pattern_id}", dependencies=[Depends(no_store)])
 def delete_pattern(
     pattern_id: str,
     db: Session = Depends(get_db),
 ):
     """Delete a pattern and all its notes."""
-    pattern = db.query(PatternModel).filter(PatternModel.id == pattern_id).first()
-    if not pattern:
+    _touch_project(db, _project_of_pattern(pattern_id))
+    result = db.execute(
+        delete(PatternModel).where(PatternModel.id == pattern_id).returning(PatternModel.id)
+    )
+    if result.scalar() is None:
         raise HTTPException(status_code=404, detail="Pattern not found")
 
-    db.delete(pattern)
     db.commit()
     return {"message": "Pattern deleted successfully"}
 
@@ -305,47 +380,96 @@ def delete_pattern(
 def get_pattern_notes(
     pattern_id: str,
     db: Session = Depends(get_db),
+    accept: Optional[str] = Header(None),
 ):
-    """Get all notes for a pattern."""
+    """
+    Get all notes for a pattern.
+
+    Clients sending "Accept: application/x-ndjson" receive the notes streamed
+    as one JSON object per line, written as rows are fetched.
+    """
+    params = {"pattern_id": pattern_id}
+
     # Verify pattern exists
-    pattern = db.query(PatternModel).filter(PatternModel.id == pattern_id).first()
-    if not pattern:
+    if db.scalar(_PATTERN_EXISTS, params) is None:
         raise HTTPException(status_code=404, detail="Pattern not found")
 
-    notes = db.query(NoteModel).filter(NoteModel.pattern_id == pattern_id).order_by(NoteModel.step_index).all()
-    return [model_to_note(n) for n in notes]
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(_stream_notes(db, params), media_type=NDJSON_MEDIA_TYPE)
+
+    notes = db.scalars(_SELECT_PATTERN_NOTES, params).all()
+    return ModelJSONResponse(NOTE_LIST.dump_json([Note.from_row(n) for n in notes]))
 
 
-@router.post("/patterns/{pattern_id}/notes/bulk", response_model=List[Note])
-def replace_pattern_notes(
+def _stream_notes(db: Session, params: dict):
+    """Yield NDJSON lines for a pattern's notes, fetched in batches."""
+    rows = db.execute(
+        _SELECT_PATTERN_NOTE_ROWS, params, execution_options={"yield_per": NDJSON_BATCH_SIZE}
+    )
+    for row in rows:
+        yield orjson.dumps(row._asdict()) + b"\n"
+
+
+@router.post(
+    "/patterns/{pattern_id}/notes/bulk",
+    response_model=List[Note],
+    dependencies=[Depends(no_store)],
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {
+            "schema": {"type": "array", "items": NoteCreate.model_json_schema()},
+        }},
+    }},
+)
+async def replace_pattern_notes(
     pattern_id: str,
-    notes: List[NoteCreate],
+    request: Request,
     db: Session = Depends(get_db),
 ):
-    """Replace all notes for a pattern (bulk update)."""
+    """
+    Replace all notes for a pattern (bulk update).
+
+    The body is a JSON array of NoteCreate. It is parsed and validated from
+    the raw bytes in one pydantic-core pass rather than decoded to Python
+    objects first, which matters for large grids; the database work then
+    runs in the threadpool.
+    """
+    try:
+        notes = NOTE_CREATE_LIST.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        ) from exc
+
+    return await run_in_threadpool(_replace_pattern_notes, db, pattern_id, notes)
+
+
+def _replace_pattern_notes(db: Session, pattern_id: str, notes: List[NoteCreate]) -> List[Note]:
+    """Replace a pattern's notes with already-validated new notes."""
+    params = {"pattern_id": pattern_id}
+
     # Verify pattern exists
-    pattern = db.query(PatternModel).filter(PatternModel.id == pattern_id).first()
-    if not pattern:
+    if _touch_project(db, _project_of_pattern(pattern_id)) is None:
         raise HTTPException(status_code=404, detail="Pattern not found")
 
     # Delete all existing notes for this pattern
-    db.query(NoteModel).filter(NoteModel.pattern_id == pattern_id).delete()
-
-    # Create new notes
-    db_notes = []
-    for note in notes:
-        db_note = NoteModel(
-            id=str(uuid.uuid4()),
-            pattern_id=pattern_id,
-            step_index=note.step_index,
-            pitch=note.pitch,
-            velocity=note.velocity,
-        )
-        db.add(db_note)
-        db_notes.append(db_note)
-
+    db.execute(_DELETE_PATTERN_NOTES, params, execution_options={"synchronize_session": False})
+
+    # Insert the new notes in a single executemany. Every column is known up
+    # front and was validated with the request, so the response is built from
+    # the inserted values without reading the rows back or validating again.
+    mappings = [
+        {
+            "id": generate_id(),
+            "pattern_id": pattern_id,
+            "step_index": note.step_index,
+            "pitch": note.pitch,
+            "velocity": note.velocity,
+        }
+        for note in notes
+    ]
+    if mappings:
+        db.execute(insert(NoteModel), mappings)
     db.commit()
-    for db_note in db_notes:
-        db.refresh(db_note)
 
-    return [model_to_note(n) for n in db_notes]
+    return [Note.model_construct(**m) for m in mappings]
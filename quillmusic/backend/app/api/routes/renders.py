@@ -3,6 +3,7 @@ Render Job API endpoints
 """
 from fastapi import APIRouter, HTTPException
 
+from app.core.responses import ModelJSONResponse
 from app.schemas.render import RenderJobCreate, RenderJobStatus
 from app.services.render_engine import get_render_engine
 
@@ -15,13 +16,16 @@ async def create_render_job(request: RenderJobCreate):
     Create a new render job.
 
     Submits a song blueprint for rendering (instrumental, vocals, or full mix).
-    Returns job status with job_id for tracking.
+    Returns job status with job_id for tracking. audio_url and error are
+    omitted rather than sent as null while they are unset. The status is
+    built by the render engine, so it is serialized directly rather than
+    validated again by FastAPI.
     """
     try:
         engine = get_render_engine()
         job_id = engine.submit(request.song_id, request.render_type)
         status = engine.status(job_id)
-        return status
+        return ModelJSONResponse(status.model_dump_json(exclude_none=True).encode())
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -39,7 +43,7 @@ async def get_render_status(job_id: str):
     try:
         engine = get_render_engine()
         status = engine.status(job_id)
-        return status
+        return ModelJSONResponse(status.model_dump_json(exclude_none=True).encode())
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1,8 +1,13 @@
 """
 Song Blueprint API endpoints
 """
-import json
-from fastapi import APIRouter, HTTPException, Depends
+import time
+from datetime import timezone
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.schemas.song import SongBlueprintRequest, SongBlueprintResponse
@@ -10,15 +15,16 @@ from app.services.song_blueprint_service import SongBlueprintEngine
 from app.core.dependencies import get_song_blueprint_engine
 from app.core.database import get_db
 from app.models.blueprint import SongBlueprintModel
+from app.services import blueprint_cache
 
 router = APIRouter()
 
 
 @router.post("/song/blueprint", response_model=SongBlueprintResponse)
-async def create_song_blueprint(
+def create_song_blueprint(
     request: SongBlueprintRequest,
-    engine: SongBlueprintEngine = Depends(get_song_blueprint_engine),
     db: Session = Depends(get_db),
+    engine: SongBlueprintEngine = Depends(get_song_blueprint_engine),
 ):
     """
     Generate a song blueprint from a high-level description.
@@ -30,53 +36,112 @@ async def create_song_blueprint(
     The engine used (fake or LLM-powered) depends on the SONG_ENGINE_MODE
     configuration setting.
 
-    The generated blueprint is stored in the database for later use in
-    instrumental rendering.
+    The blueprint is committed to the database before the response is sent,
+    since instrumental rendering and HitMaker read it from there as soon as
+    the client has its ID. It is then cached and added to the Redis recency
+    index, so listings made right after the response include it.
     """
     try:
         blueprint = engine.generate_blueprint(request)
-
-        # Store blueprint in database for instrumental rendering
-        blueprint_model = SongBlueprintModel(
-            id=blueprint.song_id,
-            title=blueprint.title,
-            genre=blueprint.genre,
-            mood=blueprint.mood,
-            bpm=blueprint.bpm,
-            key=blueprint.key,
-            blueprint_json=json.dumps(blueprint.model_dump()),
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to generate blueprint: {str(e)}",
         )
-        db.add(blueprint_model)
-        db.commit()
 
-        return blueprint
+    blueprint_json = blueprint.model_dump_json()
+    try:
+        _persist_blueprints(db, [(blueprint, blueprint_json)])
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to generate blueprint: {str(e)}",
+            detail=f"Failed to store blueprint: {str(e)}",
         )
 
+    blueprint_cache.store_blueprint_json(blueprint.song_id, blueprint_json, time.time())
+
+    # Respond with the JSON already serialized for Redis rather than letting
+    # FastAPI validate and encode the blueprint again
+    return Response(content=blueprint_json, media_type="application/json")
+
+
+def _persist_blueprints(
+    db: Session,
+    blueprints: list[tuple[SongBlueprintResponse, str]],
+) -> None:
+    """
+    Store the durable copies of generated blueprints for instrumental rendering.
+
+    All rows go in with a single executemany INSERT and one commit, so a
+    batch costs one journal sync however many blueprints it holds.
+
+    Args:
+        db: Database session
+        blueprints: Pairs of blueprint and its serialized JSON
+    """
+    try:
+        db.execute(insert(SongBlueprintModel), [
+            {
+                "id": blueprint.song_id,
+                "title": blueprint.title,
+                "genre": blueprint.genre,
+                "mood": blueprint.mood,
+                "bpm": blueprint.bpm,
+                "key": blueprint.key,
+                "blueprint_json": blueprint_json,
+            }
+            for blueprint, blueprint_json in blueprints
+        ])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
 
 @router.get("/song/blueprints", response_model=list[SongBlueprintResponse])
-async def list_blueprints(
+def list_blueprints(
     db: Session = Depends(get_db),
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=blueprint_cache.BLUEPRINT_INDEX_SIZE),
 ):
     """
     List recently generated song blueprints.
 
     This allows users to see their previously generated blueprints
     for use in the Instrumental Studio.
+
+    Like single-blueprint reads, the stored documents are already valid
+    SongBlueprintResponse JSON, so they are joined into the response array
+    without being parsed and re-encoded.
     """
     try:
-        blueprints = db.query(SongBlueprintModel).order_by(
-            SongBlueprintModel.created_at.desc()
-        ).limit(limit).all()
-
-        return [
-            SongBlueprintResponse(**json.loads(bp.blueprint_json))
-            for bp in blueprints
+        # Resolve the ordering from the Redis recency index, then read the
+        # documents from Redis, loading only the misses from the database.
+        # An index shorter than the page (e.g. refilled after a flush) may be
+        # missing older blueprints, so the database decides the page then.
+        blueprint_ids = blueprint_cache.get_recent_blueprint_ids(limit)
+        if blueprint_ids is None or len(blueprint_ids) < limit:
+            blueprint_ids = _load_recent_blueprint_ids(db, limit)
+        cached = blueprint_cache.get_many_blueprint_json(blueprint_ids)
+
+        missing = [bp_id for bp_id, bp_json in zip(blueprint_ids, cached) if bp_json is None]
+        loaded = {}
+        if missing:
+            loaded = dict(db.execute(
+                select(SongBlueprintModel.id, SongBlueprintModel.blueprint_json)
+                .where(SongBlueprintModel.id.in_(missing))
+            ).all())
+            blueprint_cache.cache_blueprint_json(loaded)
+
+        blueprint_jsons = [
+            bp_json if bp_json is not None else loaded[bp_id]
+            for bp_id, bp_json in zip(blueprint_ids, cached)
+            if bp_json is not None or bp_id in loaded
         ]
+
+        return Response(
+            content="[" + ",".join(blueprint_jsons) + "]",
+            media_type="application/json",
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -84,21 +149,49 @@ async def list_blueprints(
         )
 
 
+def _load_recent_blueprint_ids(db: Session, limit: int) -> list[str]:
+    """
+    Load the most recent blueprint IDs from the database.
+
+    Used when Redis is unavailable or its index holds fewer IDs than were
+    asked for (e.g. after a flush); the rows found are added back to the
+    index.
+    """
+    rows = db.execute(
+        select(SongBlueprintModel.id, SongBlueprintModel.created_at)
+        .order_by(SongBlueprintModel.created_at.desc())
+        .limit(limit)
+    ).all()
+    blueprint_cache.index_blueprints({
+        bp_id: created_at.replace(tzinfo=timezone.utc).timestamp()
+        for bp_id, created_at in rows
+    })
+    return [bp_id for bp_id, _ in rows]
+
+
 @router.get("/song/blueprints/{blueprint_id}", response_model=SongBlueprintResponse)
 async def get_blueprint(
     blueprint_id: str,
     db: Session = Depends(get_db),
 ):
-    """Get a specific blueprint by ID."""
+    """
+    Get a specific blueprint by ID.
+
+    The stored JSON was written from a SongBlueprintResponse, so it is sent
+    as-is instead of being parsed and re-encoded. Blueprints never change
+    once created, so cache hits are served straight from Redis on the event
+    loop; only misses go to the database, in the threadpool.
+    """
     try:
-        blueprint = db.query(SongBlueprintModel).filter(
-            SongBlueprintModel.id == blueprint_id
-        ).first()
+        blueprint_json = await blueprint_cache.aget_blueprint_json(blueprint_id)
+
+        if blueprint_json is None:
+            blueprint_json = await run_in_threadpool(_load_blueprint_json, db, blueprint_id)
 
-        if not blueprint:
-            raise HTTPException(status_code=404, detail="Blueprint not found")
+            if blueprint_json is None:
+                raise HTTPException(status_code=404, detail="Blueprint not found")
 
-        return SongBlueprintResponse(**json.loads(blueprint.blueprint_json))
+        return Response(content=blueprint_json, media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -106,3 +199,14 @@ async def get_blueprint(
             status_code=500,
             detail=f"Failed to get blueprint: {str(e)}",
         )
+
+
+def _load_blueprint_json(db: Session, blueprint_id: str) -> Optional[str]:
+    """Load a stored blueprint's JSON from the database and backfill the cache."""
+    blueprint_json = db.scalar(
+        select(SongBlueprintModel.blueprint_json)
+        .where(SongBlueprintModel.id == blueprint_id)
+    )
+    if blueprint_json is not None:
+        blueprint_cache.cache_blueprint_json({blueprint_id: blueprint_json})
+    return blueprint_json
@@ -1,20 +1,22 @@
 """
 Vocals API routes for ElevenLabs TTS integration
 """
-import io
 import logging
-from typing import Optional
-from fastapi import APIRouter, HTTPException
+from typing import AsyncGenerator, AsyncIterator, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, constr
 
-from app.core.config import settings
+from app.core.dependencies import get_elevenlabs_client
 from app.providers.elevenlabs_tts import ElevenLabsClient, ElevenLabsTTSError
+from app.services import vocal_preview_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/vocals", tags=["vocals"])
 
+PREVIEW_HEADERS = {"Content-Disposition": 'inline; filename="vocal-preview.mp3"'}
+
 
 class VocalPreviewRequest(BaseModel):
     """Request schema for vocal preview generation."""
@@ -34,15 +36,21 @@ class VocalPreviewRequest(BaseModel):
 
 
 @router.post("/preview")
-async def preview_vocals(payload: VocalPreviewRequest) -> StreamingResponse:
+async def preview_vocals(
+    payload: VocalPreviewRequest,
+    client: Optional[ElevenLabsClient] = Depends(get_elevenlabs_client),
+) -> StreamingResponse:
     """
     Generate a vocal preview using ElevenLabs TTS.
 
     This endpoint takes text/lyrics and a voice ID, calls the ElevenLabs API,
-    and streams back the generated audio as MP3.
+    and streams back the generated audio as MP3 while it is being generated.
+    Completed previews are cached, so repeating an identical request returns
+    the stored audio without calling ElevenLabs.
 
     Args:
         payload: Vocal preview request with text, voice_id, and optional model_id
+        client: Shared ElevenLabs client (None if no API key is configured)
 
     Returns:
         StreamingResponse with audio/mpeg content
@@ -51,43 +59,53 @@ async def preview_vocals(payload: VocalPreviewRequest) -> StreamingResponse:
         HTTPException: If ElevenLabs API is not configured or if generation fails
     """
     # Check if ElevenLabs is configured
-    if not settings.ELEVENLABS_API_KEY:
+    if client is None:
         logger.error("ElevenLabs API key not configured")
         raise HTTPException(
             status_code=500,
             detail="ElevenLabs API key not configured. Please set QUILLMUSIC_ELEVENLABS_API_KEY."
         )
 
-    # Create client
-    client = ElevenLabsClient(
-        api_key=settings.ELEVENLABS_API_KEY,
-        base_url=settings.ELEVENLABS_BASE_URL,
-        default_model=settings.ELEVENLABS_DEFAULT_MODEL,
-    )
+    # Resolve the model once so the cache key, the log line and the request
+    # to ElevenLabs all agree on it
+    model_id = payload.model_id or client.default_model
+    cache_key = vocal_preview_cache.preview_key(payload.text, payload.voice_id, model_id)
+
+    cached_audio = await vocal_preview_cache.get_preview_audio(cache_key)
+    if cached_audio is not None:
+        return Response(content=cached_audio, media_type="audio/mpeg", headers=PREVIEW_HEADERS)
 
     # Generate speech
     try:
         logger.info(
             f"Generating vocal preview: voice_id={payload.voice_id}, "
-            f"model={payload.model_id or settings.ELEVENLABS_DEFAULT_MODEL}, "
+            f"model={model_id}, "
             f"text_length={len(payload.text)}"
         )
 
-        audio_bytes = await client.generate_speech(
+        audio_stream = client.stream_speech(
             text=payload.text,
             voice_id=payload.voice_id,
-            model_id=payload.model_id,
+            model_id=model_id,
         )
 
-        # Stream audio back to client
+        # Pull the first chunk before responding, so upstream failures still
+        # map to an error status instead of a truncated 200 response
+        first_chunk = await audio_stream.__anext__()
+
+        # Forward the rest of the audio as ElevenLabs produces it
         return StreamingResponse(
-            io.BytesIO(audio_bytes),
+            _stream_and_cache(first_chunk, audio_stream, cache_key),
             media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": 'inline; filename="vocal-preview.mp3"',
-            },
+            headers=PREVIEW_HEADERS,
         )
 
+    except StopAsyncIteration:
+        logger.error("ElevenLabs TTS returned no audio")
+        raise HTTPException(
+            status_code=502,
+            detail="Failed to generate vocals: no audio returned"
+        )
     except ElevenLabsTTSError as exc:
         logger.error(f"ElevenLabs TTS error: {exc}")
         raise HTTPException(
@@ -100,3 +118,26 @@ async def preview_vocals(payload: VocalPreviewRequest) -> StreamingResponse:
             status_code=500,
             detail="An unexpected error occurred while generating vocals"
         )
+
+
+async def _stream_and_cache(
+    first_chunk: bytes, rest: AsyncGenerator[bytes, None], cache_key: str
+) -> AsyncIterator[bytes]:
+    """
+    Yield an already-read chunk followed by the remainder of a stream, then
+    cache the complete audio. Interrupted streams are not cached.
+
+    If the client disconnects mid-stream, the upstream generator is closed
+    so the ElevenLabs response and its pooled connection are released at
+    once instead of whenever the generator is garbage collected.
+    """
+    chunks = [first_chunk]
+    try:
+        yield first_chunk
+        async for chunk in rest:
+            chunks.append(chunk)
+            yield chunk
+    finally:
+        await rest.aclose()
+
+    await vocal_preview_cache.cache_preview_audio(cache_key, b"".join(chunks))
@@ -0,0 +1,32 @@
+"""
+Response compression middleware
+"""
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware:
+    """
+    GZip responses except for paths that serve already-compressed media.
+
+    Audio streams (e.g. MP3 vocal previews) gain nothing from gzip and would
+    be delayed by its buffering, so requests under the excluded path prefixes
+    bypass compression entirely.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude_paths: tuple[str, ...] = (),
+        minimum_size: int = 1000,
+        compresslevel: int = 5,
+    ) -> None:
+        self.app = app
+        self.exclude_paths = exclude_paths
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not scope["path"].startswith(self.exclude_paths):
+            await self.gzip_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -1,14 +1,18 @@
 """
 QuillMusic Backend Configuration
 """
+from functools import cached_property, lru_cache
 from typing import Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 
 
 class InstrumentalEngineConfig(BaseModel):
     """Configuration for a single instrumental engine."""
+
+    model_config = ConfigDict(frozen=True)
+
     name: str
     label: str
     engine_type: str  # "fake" or "external_http"
@@ -30,9 +34,20 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./quillmusic.db"
+    # Compiled SQL statements kept per engine (SQLAlchemy's LRU statement cache)
+    DB_QUERY_CACHE_SIZE: int = 1200
+
+    # Worker threads available to sync (def) routes doing blocking DB work
+    THREADPOOL_MAX_WORKERS: int = 100
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 50
+    # Seconds to wait on Redis before a cache read gives up and degrades to a
+    # miss: to connect, for a reply, and for a free pooled connection
+    REDIS_CONNECT_TIMEOUT: float = 0.5
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    REDIS_POOL_TIMEOUT: float = 1.0
 
     # CORS
     CORS_ORIGINS: list[str] = [
@@ -40,9 +55,9 @@ class Settings(BaseSettings):
         "http://localhost:5000",
         "http://localhost:3000",
         "http://localhost:8000",
-        "https://*.replit.dev",
-        "https://*.repl.co",
     ]
+    # Replit preview domains; CORS_ORIGINS entries are exact matches only
+    CORS_ORIGIN_REGEX: str = r"https://.*\.(replit\.dev|repl\.co)$"
 
     # Song Blueprint Engine Configuration
     SONG_ENGINE_MODE: Literal["fake", "llm"] = "fake"
@@ -87,6 +102,8 @@ class Settings(BaseSettings):
     REPLICATE_API_TOKEN: Optional[str] = None
     REPLICATE_BASE_URL: str = "https://api.replicate.com"
     REPLICATE_MUSICGEN_VERSION: Optional[str] = None
+    # Maximum predictions being created at once per process
+    REPLICATE_MAX_CONCURRENT: int = 10
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -105,11 +122,14 @@ class Settings(BaseSettings):
             return os.getenv('REPLICATE_API_TOKEN')
         return v
 
-    @property
+    @cached_property
     def instrumental_engines(self) -> list[InstrumentalEngineConfig]:
         """
         Build list of available instrumental engines based on configuration.
 
+        Settings are fixed once loaded, so the list is built on first access
+        and reused afterwards.
+
         Returns:
             List of configured instrumental engines
         """
@@ -173,6 +193,11 @@ class Settings(BaseSettings):
 
         return engines
 
+    @cached_property
+    def _engines_by_name(self) -> dict[str, InstrumentalEngineConfig]:
+        """Configured instrumental engines keyed by name."""
+        return {engine.name: engine for engine in self.instrumental_engines}
+
     def get_engine_config(self, engine_name: str) -> Optional[InstrumentalEngineConfig]:
         """
         Get configuration for a specific engine by name.
@@ -183,10 +208,24 @@ class Settings(BaseSettings):
         Returns:
             Engine configuration or None if not found
         """
-        for engine in self.instrumental_engines:
-            if engine.name == engine_name:
-                return engine
-        return None
+        return self._engines_by_name.get(engine_name)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings.
+
+    The environment is parsed once and the same instance is returned on every
+    call, so app startup and the module-level settings alias share one
+    object. No route depends on this; code reads the settings alias
+    directly, so tests patch that name in the module under test.
+
+    Returns:
+        Settings: The process-wide settings instance
+    """
+    return Settings()
 
 
-settings = Settings()
+# Module-level alias for code that reads settings outside a request
+settings = get_settings()
@@ -1,7 +1,7 @@
 """
 Database setup and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
 
 from app.core.config import settings
@@ -10,10 +10,29 @@ from app.core.config import settings
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite_connection(dbapi_connection, connection_record):
+        """
+        Enforce ON DELETE CASCADE, which SQLite ignores by default, and use
+        WAL journaling so readers don't block the writer. With WAL,
+        synchronous=NORMAL only syncs at checkpoints rather than on every
+        commit, and remains safe against corruption.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+# Create session factory. Sessions live for one request, so objects are not
+# expired on commit; the identity map then serves repeat lookups of the same
+# row within a request without another SELECT.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Create declarative base for models
 Base = declarative_base()
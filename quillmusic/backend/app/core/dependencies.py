@@ -1,30 +1,76 @@
 """
 QuillMusic Backend Dependencies
 """
+from functools import lru_cache
 from typing import Generator, Optional
 import logging
 import redis
+from fastapi import Request
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from rq import Queue
 
-from app.core.config import settings, Settings
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-# Redis connection pool (singleton pattern)
-_redis_client: Optional[Redis] = None
+@lru_cache(maxsize=1)
+def get_redis() -> Redis:
+    """
+    Get the process-wide Redis client.
 
+    The client sits on one explicitly sized connection pool. Once the pool is
+    exhausted callers wait for a free connection instead of erroring, which
+    matters with a large worker threadpool. TCP keepalive and periodic health
+    checks keep idle pooled connections usable.
 
-def get_redis() -> Redis:
-    """Get Redis connection."""
-    global _redis_client
-    if _redis_client is None:
-        _redis_client = redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-        )
-    return _redis_client
+    Connecting, replies and the wait for a pooled connection are all bounded
+    by short timeouts, so a slow or unreachable Redis raises quickly and the
+    caches fall back to the database instead of stalling the request. Long
+    blocking commands (e.g. an RQ worker's BLPOP) need their own connection.
+
+    Returns:
+        Redis: Shared client backed by the connection pool
+    """
+    pool = redis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        decode_responses=True,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
+    return Redis(connection_pool=pool)
+
+
+@lru_cache(maxsize=2)
+def get_async_redis(decode_responses: bool = True) -> AsyncRedis:
+    """
+    Get a process-wide asyncio Redis client.
+
+    For use inside async def routes, where the blocking client from
+    get_redis() would stall the event loop. RQ queues keep using get_redis().
+    The same short connect and reply timeouts apply; an exhausted pool raises
+    at once rather than waiting.
+
+    Args:
+        decode_responses: Return str values; pass False for binary payloads
+
+    Returns:
+        AsyncRedis: Shared asyncio client with its own connection pool
+    """
+    return AsyncRedis.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        decode_responses=decode_responses,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
 
 
 def get_render_queue() -> Queue:
@@ -39,9 +85,55 @@ def get_blueprint_queue() -> Queue:
     return Queue("blueprints", connection=redis_conn)
 
 
-def get_settings() -> Settings:
-    """Get application settings."""
-    return settings
+@lru_cache(maxsize=1)
+def get_hitmaker_engine():
+    """
+    Get the shared HitMaker engine.
+
+    The engine is stateless (pure heuristics over its inputs), so a single
+    instance is created once and reused across requests.
+
+    Returns:
+        HitMakerEngine: The process-wide engine instance
+    """
+    from app.services.hitmaker_engine import HitMakerEngine
+
+    return HitMakerEngine()
+
+
+def create_elevenlabs_client():
+    """
+    Build the ElevenLabs TTS client from settings.
+
+    Called once by the app lifespan, which keeps the client on app.state and
+    closes it on shutdown.
+
+    Returns:
+        Optional[ElevenLabsClient]: The client, or None if no API key is configured
+    """
+    from app.providers.elevenlabs_tts import ElevenLabsClient
+
+    if not settings.ELEVENLABS_API_KEY:
+        return None
+
+    return ElevenLabsClient(
+        api_key=settings.ELEVENLABS_API_KEY,
+        base_url=settings.ELEVENLABS_BASE_URL,
+        default_model=settings.ELEVENLABS_DEFAULT_MODEL,
+    )
+
+
+async def get_elevenlabs_client(request: Request):
+    """
+    Get the shared ElevenLabs TTS client, or None if no API key is configured.
+
+    The client is built once at startup (see create_elevenlabs_client), so
+    its pooled HTTPS connections are reused across requests.
+
+    Returns:
+        Optional[ElevenLabsClient]: The process-wide client
+    """
+    return getattr(request.app.state, "elevenlabs_client", None)
 
 
 def get_song_blueprint_engine():
@@ -49,11 +141,31 @@ def get_song_blueprint_engine():
     Get the configured song blueprint engine.
 
     This is a dependency injection function for FastAPI routes.
-    Returns the appropriate engine based on configuration.
+    Returns the appropriate engine based on configuration. The engine (and
+    its LLM client with its HTTP connection pool) is built once per distinct
+    configuration and reused across requests.
 
     Returns:
         SongBlueprintEngine: Either FakeSongBlueprintEngine or LLMSongBlueprintEngine
     """
+    return _build_song_blueprint_engine(
+        settings.SONG_ENGINE_MODE,
+        settings.LLM_API_KEY,
+        settings.LLM_MODEL_NAME,
+        settings.LLM_API_BASE,
+        settings.LLM_PROVIDER,
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_song_blueprint_engine(
+    mode: str,
+    api_key: Optional[str],
+    model_name: str,
+    api_base: Optional[str],
+    provider: str,
+):
+    """Build the song blueprint engine for the given engine settings."""
     from app.services.song_blueprint_service import (
         FakeSongBlueprintEngine,
         LLMSongBlueprintEngine,
@@ -62,12 +174,12 @@ def get_song_blueprint_engine():
     from app.services.llm_client import create_llm_client
 
     # Default to fake engine
-    if settings.SONG_ENGINE_MODE != "llm":
-        logger.info("Using FakeSongBlueprintEngine (mode=%s)", settings.SONG_ENGINE_MODE)
+    if mode != "llm":
+        logger.info("Using FakeSongBlueprintEngine (mode=%s)", mode)
         return FakeSongBlueprintEngine()
 
     # Check if LLM configuration is present
-    if not settings.LLM_API_KEY:
+    if not api_key:
         logger.warning(
             "SONG_ENGINE_MODE is 'llm' but no LLM_API_KEY configured. "
             "Falling back to FakeSongBlueprintEngine."
@@ -78,15 +190,15 @@ def get_song_blueprint_engine():
     try:
         logger.info(
             "Creating LLMSongBlueprintEngine (provider=%s, model=%s)",
-            settings.LLM_PROVIDER,
-            settings.LLM_MODEL_NAME,
+            provider,
+            model_name,
         )
 
         llm_client = create_llm_client(
-            api_key=settings.LLM_API_KEY,
-            model_name=settings.LLM_MODEL_NAME,
-            api_base=settings.LLM_API_BASE,
-            provider=settings.LLM_PROVIDER,
+            api_key=api_key,
+            model_name=model_name,
+            api_base=api_base,
+            provider=provider,
         )
 
         return LLMSongBlueprintEngine(
@@ -0,0 +1,51 @@
+"""
+HTTP caching helpers (ETag generation, conditional requests and Cache-Control)
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+
+# For data that only changes on deploy/config change: caches may serve it for
+# 30s without asking, then serve stale while revalidating for another 5 min.
+STATIC_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=300"
+
+
+def make_etag(model: BaseModel) -> str:
+    """
+    Compute a strong ETag for a response model.
+
+    Args:
+        model: The response model the ETag should identify
+
+    Returns:
+        Quoted ETag string suitable for the ETag response header
+    """
+    digest = hashlib.md5(model.model_dump_json().encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match request header against the current ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may list several tags)
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client already holds the current representation
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def no_store(response: Response) -> None:
+    """Dependency marking a response as uncacheable (used on mutating routes)."""
+    response.headers["Cache-Control"] = "no-store"
@@ -0,0 +1,28 @@
+"""
+Response classes
+"""
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(ORJSONResponse):
+    """
+    JSON response that serializes a Pydantic model directly with pydantic-core.
+
+    Returning a model from a route makes FastAPI dump it to a dict, validate
+    that dict against the response_model again and dump it once more before
+    encoding. Routes whose result is already an instance of their
+    response_model return it wrapped in this class instead, which skips all
+    of that and writes the JSON in a single pass. Bytes are taken to be
+    already-serialized JSON (e.g. from a cache) and written as-is. Other
+    content falls back to orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
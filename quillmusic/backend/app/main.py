@@ -1,35 +1,89 @@
 """
 QuillMusic Backend - FastAPI Application
 """
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from app.core.config import settings
-from app.core.database import init_db
+from app.core.compression import SelectiveGZipMiddleware
+from app.core.config import get_settings
+from app.core.database import engine, init_db
+from app.core.dependencies import create_elevenlabs_client, get_hitmaker_engine
+from app.providers.http_clients import aclose_http_clients, aclose_sync_http_clients
 from app.api.routes import health, song_blueprints, renders, manual, instrumental, hitmaker, config, vocals
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Sync (def) routes run their blocking DB work in AnyIO's worker threads;
+    # raise the default 40-thread cap so DB-bound requests don't queue up.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = get_settings().THREADPOOL_MAX_WORKERS
+
+    await anyio.to_thread.run_sync(_warm_up)
+
+    # One ElevenLabs client for the app's lifetime, read by get_elevenlabs_client
+    app.state.elevenlabs_client = create_elevenlabs_client()
+
+    yield
+
+    # Close pooled connections held by shared API clients; the clients are
+    # independent, so their TLS shutdowns overlap
+    closing = [aclose_http_clients(), aclose_sync_http_clients()]
+    if app.state.elevenlabs_client is not None:
+        closing.append(app.state.elevenlabs_client.aclose())
+    await asyncio.gather(*closing)
+
+
+def _warm_up() -> None:
+    """
+    Pay one-off first-request costs at startup instead of on live traffic.
+
+    Pydantic schemas are already compiled at import time; what remains lazy
+    is the shared HitMaker engine and the first pooled database connection.
+    """
+    get_hitmaker_engine()
+    with engine.connect():
+        pass
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    settings = get_settings()
+
     app = FastAPI(
         title=settings.APP_NAME,
         version=settings.APP_VERSION,
         debug=settings.DEBUG,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
-        allow_origin_regex=r"https://.*\.(replit\.dev|repl\.co)",
-        allow_origins=["http://localhost:5000", "http://localhost:5173", "http://localhost:3000", "http://localhost:8000"],
+        allow_origins=settings.CORS_ORIGINS,
+        allow_origin_regex=settings.CORS_ORIGIN_REGEX,
         allow_credentials=True,
-        allow_methods=["*"],
+        allow_methods=["GET", "POST", "PATCH", "DELETE"],
         allow_headers=["*"],
     )
 
+    # Compress JSON responses; MP3 vocal previews are already compressed
+    app.add_middleware(
+        SelectiveGZipMiddleware,
+        exclude_paths=(f"{settings.API_PREFIX}/vocals/",),
+        minimum_size=1000,
+        compresslevel=5,
+    )
+
     # Initialize database
     init_db()
 
@@ -1,11 +1,37 @@
 """
 SQLAlchemy models for storing song blueprints
 """
+import zlib
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Text, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary
+from sqlalchemy.types import TypeDecorator
 
 from app.core.database import Base
 
+BLUEPRINT_COMPRESSION_LEVEL = 3
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text stored as a zlib-compressed BLOB.
+
+    Values are plain strings in Python. Rows written before the column was
+    compressed come back from SQLite as TEXT and are returned unchanged.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.compress(value.encode("utf-8"), BLUEPRINT_COMPRESSION_LEVEL)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return zlib.decompress(value).decode("utf-8")
+
 
 class SongBlueprintModel(Base):
     """Song blueprint storage model."""
@@ -18,5 +44,8 @@ class SongBlueprintModel(Base):
     mood = Column(String(100), nullable=False)
     bpm = Column(Integer, nullable=False)
     key = Column(String(10), nullable=False)
-    blueprint_json = Column(Text, nullable=False)  # Full blueprint as JSON
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Full blueprint document as serialized JSON, (de)serialized by pydantic-core.
+    # Stored compressed: the section and lyric arrays shrink several-fold.
+    blueprint_json = Column(CompressedText, nullable=False)
+    # Indexed for the newest-first listing (scanned backwards for ORDER BY ... DESC)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
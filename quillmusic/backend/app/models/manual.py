@@ -1,19 +1,25 @@
 """
 SQLAlchemy models for Manual Creator (DAW Lite)
 """
+import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
 
+def generate_id() -> str:
+    """Generate a primary key for a new manual project row."""
+    return str(uuid.uuid4())
+
+
 class ManualProjectModel(Base):
     """Manual project database model."""
 
     __tablename__ = "manual_projects"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True, index=True, default=generate_id)
     name = Column(String(200), nullable=False)
     tempo_bpm = Column(Integer, nullable=False)
     time_signature = Column(String(10), nullable=False, default="4/4")
@@ -22,17 +28,28 @@ class ManualProjectModel(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # Relationships
-    tracks = relationship("TrackModel", back_populates="project", cascade="all, delete-orphan")
+    # Relationships. passive_deletes leaves child rows to the ON DELETE CASCADE
+    # foreign keys instead of loading them and deleting one by one.
+    tracks = relationship(
+        "TrackModel",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="TrackModel.channel_index",
+    )
 
 
 class TrackModel(Base):
     """Track database model."""
 
     __tablename__ = "tracks"
+    __table_args__ = (
+        # Serves project track listings ordered by channel without a sort step
+        Index("ix_tracks_project_channel", "project_id", "channel_index"),
+    )
 
-    id = Column(String, primary_key=True, index=True)
-    project_id = Column(String, ForeignKey("manual_projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(String, primary_key=True, index=True, default=generate_id)
+    project_id = Column(String, ForeignKey("manual_projects.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False)
     instrument_type = Column(String(20), nullable=False)  # drums, bass, chords, lead, fx, vocal
     channel_index = Column(Integer, nullable=False)
@@ -43,32 +60,52 @@ class TrackModel(Base):
 
     # Relationships
     project = relationship("ManualProjectModel", back_populates="tracks")
-    patterns = relationship("PatternModel", back_populates="track", cascade="all, delete-orphan")
+    patterns = relationship(
+        "PatternModel",
+        back_populates="track",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="PatternModel.start_bar",
+    )
 
 
 class PatternModel(Base):
     """Pattern database model."""
 
     __tablename__ = "patterns"
+    __table_args__ = (
+        # Serves per-track pattern listings ordered by position without a sort step
+        Index("ix_patterns_track_start", "track_id", "start_bar"),
+    )
 
-    id = Column(String, primary_key=True, index=True)
-    track_id = Column(String, ForeignKey("tracks.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(String, primary_key=True, index=True, default=generate_id)
+    track_id = Column(String, ForeignKey("tracks.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False)
     length_bars = Column(Integer, nullable=False)
     start_bar = Column(Integer, nullable=False)
 
     # Relationships
     track = relationship("TrackModel", back_populates="patterns")
-    notes = relationship("NoteModel", back_populates="pattern", cascade="all, delete-orphan")
+    notes = relationship(
+        "NoteModel",
+        back_populates="pattern",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="NoteModel.step_index",
+    )
 
 
 class NoteModel(Base):
     """Note database model."""
 
     __tablename__ = "notes"
+    __table_args__ = (
+        # Serves per-pattern note listings ordered by step without a sort step
+        Index("ix_notes_pattern_step", "pattern_id", "step_index"),
+    )
 
-    id = Column(String, primary_key=True, index=True)
-    pattern_id = Column(String, ForeignKey("patterns.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(String, primary_key=True, index=True, default=generate_id)
+    pattern_id = Column(String, ForeignKey("patterns.id", ondelete="CASCADE"), nullable=False)
     step_index = Column(Integer, nullable=False)
     pitch = Column(Integer, nullable=False)
     velocity = Column(Integer, nullable=False)
@@ -7,11 +7,21 @@ high-quality AI vocals from text.
 API Documentation: https://elevenlabs.io/docs/api-reference/text-to-speech
 """
 import logging
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 import httpx
 
+from app.providers.http_clients import send_with_retry
+
 logger = logging.getLogger(__name__)
 
+# Read size when buffering a whole clip; streaming keeps smaller chunks so the
+# first audio reaches the client sooner
+AUDIO_READ_CHUNK_SIZE = 64 * 1024
+
+# Shared format for request logs; arguments are only interpolated if INFO is enabled
+TTS_REQUEST_LOG = "Voice ID: %s, Model: %s, Text length: %d chars"
+
 
 class ElevenLabsTTSError(Exception):
     """Raised when ElevenLabs TTS API request fails."""
@@ -38,6 +48,78 @@ class ElevenLabsClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.default_model = default_model
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client, creating it on first use.
+
+        Keeping one client per ElevenLabsClient lets requests reuse open
+        HTTPS connections instead of paying a new TLS handshake each time.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300),
+            )
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    @asynccontextmanager
+    async def _open_stream(self, url: str, payload: dict) -> AsyncIterator[httpx.Response]:
+        """
+        Start a streaming TTS request and close it when done.
+
+        Failures that mean the request was not processed (connection errors,
+        429 and 503) are retried before any audio is read; the request is a
+        billed POST, so it is not resent after it may have reached the server.
+        """
+        client = self._get_http_client()
+        request = client.build_request("POST", url, headers=self._headers(), json=payload)
+        response = await send_with_retry(lambda: client.send(request, stream=True))
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    def _build_request(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: Optional[str],
+        stream: bool = False,
+    ) -> tuple[str, dict]:
+        """Validate inputs and build the TTS request URL and payload."""
+        if not text or not text.strip():
+            raise ElevenLabsTTSError("Text cannot be empty")
+
+        if not voice_id or not voice_id.strip():
+            raise ElevenLabsTTSError("Voice ID cannot be empty")
+
+        # Build request URL
+        url = f"{self.base_url}/v1/text-to-speech/{voice_id}"
+        if stream:
+            url += "/stream"
+
+        # Use provided model or fallback to default
+        payload = {
+            "model_id": model_id or self.default_model,
+            "text": text,
+        }
+        return url, payload
+
+    def _headers(self) -> dict[str, str]:
+        """Request headers for the TTS endpoints."""
+        return {
+            "xi-api-key": self.api_key,
+            "Content-Type": "application/json",
+            "Accept": "audio/mpeg",
+        }
 
     async def generate_speech(
         self,
@@ -59,59 +141,87 @@ class ElevenLabsClient:
         Raises:
             ElevenLabsTTSError: If API request fails
         """
-        if not text or not text.strip():
-            raise ElevenLabsTTSError("Text cannot be empty")
+        url, payload = self._build_request(text, voice_id, model_id)
+        model = payload["model_id"]
 
-        if not voice_id or not voice_id.strip():
-            raise ElevenLabsTTSError("Voice ID cannot be empty")
+        logger.info("Calling ElevenLabs TTS API: %s", url)
+        logger.info(TTS_REQUEST_LOG, voice_id, model, len(text))
 
-        # Build request URL
-        url = f"{self.base_url}/v1/text-to-speech/{voice_id}"
+        try:
+            # Read the body incrementally into one buffer rather than letting
+            # httpx assemble it from many small reads
+            async with self._open_stream(url, payload) as response:
+                # Check HTTP status
+                if response.status_code != 200:
+                    body = await response.aread()
+                    error_text = body[:200].decode(errors="replace") if body else "No error details"
+                    error_msg = f"ElevenLabs API returned status {response.status_code}: {error_text}"
+                    logger.error(error_msg)
+                    raise ElevenLabsTTSError(error_msg)
 
-        # Use provided model or fallback to default
-        model = model_id or self.default_model
+                audio = bytearray()
+                async for chunk in response.aiter_bytes(AUDIO_READ_CHUNK_SIZE):
+                    audio.extend(chunk)
 
-        # Build request payload
-        payload = {
-            "model_id": model,
-            "text": text,
-        }
+            # Return audio bytes
+            audio_bytes = bytes(audio)
+            logger.info("ElevenLabs TTS succeeded: %d bytes generated", len(audio_bytes))
+            return audio_bytes
 
-        logger.info(f"Calling ElevenLabs TTS API: {url}")
-        logger.info(f"Voice ID: {voice_id}, Model: {model}, Text length: {len(text)} chars")
+        except httpx.HTTPError as http_err:
+            error_msg = f"HTTP error calling ElevenLabs API: {http_err}"
+            logger.error(error_msg)
+            raise ElevenLabsTTSError(error_msg) from http_err
 
-        try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    url,
-                    headers={
-                        "xi-api-key": self.api_key,
-                        "Content-Type": "application/json",
-                        "Accept": "audio/mpeg",
-                    },
-                    json=payload,
-                )
+    async def stream_speech(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: Optional[str] = None,
+        chunk_size: int = 8192,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech audio from text using the ElevenLabs streaming endpoint.
+
+        Audio chunks are yielded as ElevenLabs produces them, so callers can
+        forward the first bytes before the whole clip has been generated.
+        Errors (including a non-200 status) are raised before the first chunk.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs voice ID
+            model_id: Optional model ID (defaults to client's default_model)
+            chunk_size: Size of the chunks read from the response
+
+        Yields:
+            Audio byte chunks (MP3 format)
 
+        Raises:
+            ElevenLabsTTSError: If API request fails
+        """
+        url, payload = self._build_request(text, voice_id, model_id, stream=True)
+
+        logger.info("Streaming from ElevenLabs TTS API: %s", url)
+        logger.info(TTS_REQUEST_LOG, voice_id, payload["model_id"], len(text))
+
+        try:
+            async with self._open_stream(url, payload) as response:
                 # Check HTTP status
                 if response.status_code != 200:
-                    error_text = response.text[:200] if response.text else "No error details"
+                    body = await response.aread()
+                    error_text = body[:200].decode(errors="replace") if body else "No error details"
                     error_msg = f"ElevenLabs API returned status {response.status_code}: {error_text}"
                     logger.error(error_msg)
                     raise ElevenLabsTTSError(error_msg)
 
-                # Return audio bytes
-                audio_bytes = response.content
-                logger.info(f"ElevenLabs TTS succeeded: {len(audio_bytes)} bytes generated")
-                return audio_bytes
+                total_bytes = 0
+                async for chunk in response.aiter_bytes(chunk_size):
+                    total_bytes += len(chunk)
+                    yield chunk
+
+                logger.info("ElevenLabs TTS stream finished: %d bytes streamed", total_bytes)
 
         except httpx.HTTPError as http_err:
             error_msg = f"HTTP error calling ElevenLabs API: {http_err}"
             logger.error(error_msg)
             raise ElevenLabsTTSError(error_msg) from http_err
-        except ElevenLabsTTSError:
-            # Re-raise our custom errors
-            raise
-        except Exception as exc:
-            error_msg = f"Unexpected error calling ElevenLabs API: {exc}"
-            logger.error(error_msg)
-            raise ElevenLabsTTSError(error_msg) from exc
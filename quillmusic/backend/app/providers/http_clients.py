@@ -0,0 +1,206 @@
+"""
+Shared HTTP clients for hosted audio providers.
+
+Each provider gets one long-lived httpx.AsyncClient so sequential calls
+reuse open HTTPS connections instead of paying a TCP + TLS handshake every
+time. Connections belong to the event loop that opened them, so clients are
+kept per running loop. Async routes use the API's loop; sync callers (e.g.
+instrumental renders) go through run_sync(), which runs every call on one
+persistent background loop, so their clients also live across calls.
+"""
+import asyncio
+import importlib.util
+import logging
+import random
+import threading
+import weakref
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Upstream statuses worth retrying: rate limiting and gateway/availability errors
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# The subset that means the request was turned away without being processed,
+# so it is safe to resend even a non-idempotent request (e.g. a paid POST)
+REJECTED_STATUS_CODES = frozenset({429, 503})
+# Transport errors raised before the request could reach the server
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+PROVIDER_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+PROVIDER_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=5.0)
+
+# Per-provider overrides of PROVIDER_LIMITS
+_LIMITS_BY_PROVIDER = {
+    # Few but long-running (up to 120s) requests; a small warm pool suffices
+    "stable_audio": httpx.Limits(max_connections=50, max_keepalive_connections=10),
+    # Jobs poll every second or so for minutes, so concurrent jobs need many
+    # keep-alive slots, held longer than the poll interval, for each poll to
+    # reuse the previous poll's socket
+    "replicate": httpx.Limits(
+        max_connections=1000,
+        max_keepalive_connections=100,
+        keepalive_expiry=30.0,
+    ),
+}
+
+# Providers whose clients negotiate HTTP/2, so concurrent requests (e.g. polls
+# for several Replicate predictions) share one connection. Needs the optional
+# h2 package (httpx[http2]); without it these clients stay on HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_HTTP2_PROVIDERS = frozenset({"replicate"})
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_semaphores: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, int], asyncio.Semaphore]]"
+) = weakref.WeakKeyDictionary()
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """
+    Get the shared client for a provider on the running event loop.
+
+    Args:
+        name: Provider name (e.g. "stable_audio", "replicate")
+
+    Returns:
+        httpx.AsyncClient: Pooled client, created on first use
+    """
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=_LIMITS_BY_PROVIDER.get(name, PROVIDER_LIMITS),
+            timeout=PROVIDER_TIMEOUT,
+            http2=HTTP2_AVAILABLE and name in _HTTP2_PROVIDERS,
+        )
+        clients[name] = client
+    return client
+
+
+def get_provider_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding concurrent calls to a provider on the running loop.
+
+    Sync callers all run on run_sync()'s single background loop, so for them
+    the semaphore is shared process-wide.
+
+    Args:
+        name: Provider name
+        limit: Maximum concurrent holders
+
+    Returns:
+        asyncio.Semaphore: Shared semaphore for the provider and limit
+    """
+    semaphores = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    key = (name, limit)
+    if key not in semaphores:
+        semaphores[key] = asyncio.Semaphore(limit)
+    return semaphores[key]
+
+
+async def aclose_http_clients() -> None:
+    """Close every shared client opened on the running event loop, concurrently."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(client.aclose() for client in clients.values()))
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Read a Retry-After header given in seconds, if present."""
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    idempotent: bool = False,
+    retries: int = 3,
+    base: float = 0.25,
+    cap: float = 5.0,
+) -> httpx.Response:
+    """
+    Send a provider request, retrying transient failures.
+
+    Idempotent requests (e.g. status polls) are retried after any transport
+    error or RETRYABLE_STATUS_CODES response. Other requests (e.g. creating a
+    paid job) may already have reached the server after a timeout or broken
+    connection, so they are only retried when it is certain they were not
+    processed: UNSENT_ERRORS or REJECTED_STATUS_CODES responses. Retries wait
+    a jittered exponential delay, or the delay given by Retry-After. Other
+    responses are returned as-is for the caller to check. Once retries run
+    out, the last error is raised or the last response returned.
+
+    Args:
+        send: Callable starting a fresh attempt of the request
+        idempotent: Whether the request is safe to repeat after any failure
+        retries: Maximum number of retries after the first attempt
+        base: Delay before the first retry, in seconds (before jitter)
+        cap: Upper bound on the computed delay, in seconds
+
+    Returns:
+        httpx.Response: The final response
+    """
+    retryable_statuses = RETRYABLE_STATUS_CODES if idempotent else REJECTED_STATUS_CODES
+    for attempt in range(retries + 1):
+        try:
+            response = await send()
+        except httpx.TransportError as exc:
+            if attempt == retries or not (idempotent or isinstance(exc, UNSENT_ERRORS)):
+                raise
+            delay = None
+            reason = repr(exc)
+        else:
+            if response.status_code not in retryable_statuses or attempt == retries:
+                return response
+            delay = parse_retry_after(response)
+            reason = f"status {response.status_code}"
+            await response.aclose()
+
+        if delay is None:
+            delay = min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+        logger.warning("Retrying provider request in %.2fs after %s", delay, reason)
+        await asyncio.sleep(delay)
+
+
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Get the background loop for run_sync(), starting its thread on first use."""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="provider-loop", daemon=True).start()
+            _sync_loop = loop
+        return _sync_loop
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Run a provider call from synchronous code, blocking until it finishes.
+
+    Every call runs on the same background event loop, so the shared clients
+    and provider semaphores it uses persist from one call to the next.
+    """
+    async def _run() -> T:
+        return await awaitable
+
+    return asyncio.run_coroutine_threadsafe(_run(), _get_sync_loop()).result()
+
+
+async def aclose_sync_http_clients() -> None:
+    """Close the shared clients opened by run_sync() calls, if any."""
+    if _sync_loop is not None:
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(aclose_http_clients(), _sync_loop)
+        )
@@ -8,19 +8,44 @@ API Documentation: https://replicate.com/docs/reference/http
 """
 import logging
 import asyncio
+import time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 import httpx
+import orjson
 
 from app.core.config import Settings
+from app.providers.http_clients import (
+    get_http_client,
+    get_provider_semaphore,
+    parse_retry_after,
+    send_with_retry,
+)
 
 logger = logging.getLogger(__name__)
 
+# Poll interval growth per attempt while a prediction is still running
+POLL_BACKOFF_FACTOR = 1.5
+
 
 class ReplicateMusicGenError(Exception):
     """Raised when Replicate MusicGen API request fails."""
     pass
 
 
+@lru_cache(maxsize=256)
+def _serialize_payload(version: str, prompt: str, duration_seconds: int) -> bytes:
+    """Encode the prediction request body, reusing it for repeated identical requests."""
+    return orjson.dumps({
+        "version": version,
+        "input": {
+            "prompt": prompt,
+            "duration": duration_seconds,
+        },
+    })
+
+
 class ReplicateMusicGenClient:
     """Client for Replicate MusicGen API."""
 
@@ -35,6 +60,7 @@ class ReplicateMusicGenClient:
         self.base_url = settings.REPLICATE_BASE_URL.rstrip("/")
         self.api_token = settings.REPLICATE_API_TOKEN
         self.version = settings.REPLICATE_MUSICGEN_VERSION
+        self.max_concurrent = settings.REPLICATE_MAX_CONCURRENT
 
         if not self.api_token:
             raise ReplicateMusicGenError("Replicate API token is not configured")
@@ -42,13 +68,20 @@ class ReplicateMusicGenClient:
         if not self.version:
             raise ReplicateMusicGenError("Replicate MusicGen version is not configured")
 
-        logger.info(f"ReplicateMusicGenClient initialized with base_url: {self.base_url}")
+        # The token is fixed for the client's lifetime, so headers are built once
+        self._headers = MappingProxyType({
+            "Authorization": f"Token {self.api_token}",
+            "Content-Type": "application/json",
+        })
+
+        logger.info("ReplicateMusicGenClient initialized with base_url: %s", self.base_url)
 
     async def generate_audio(
         self,
         prompt: str,
         duration_seconds: Optional[int] = None,
-        poll_interval: float = 1.0,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 5.0,
         timeout: float = 90.0,
     ) -> str:
         """
@@ -56,13 +89,15 @@ class ReplicateMusicGenClient:
 
         This method:
         1. Creates a prediction via POST /v1/predictions
-        2. Polls GET /v1/predictions/{id} until succeeded/failed
+        2. Polls GET /v1/predictions/{id} until succeeded/failed, backing off
+           geometrically so long jobs are polled far less often than short ones
         3. Returns the audio URL from the prediction output
 
         Args:
             prompt: Text description of the music to generate
             duration_seconds: Desired duration in seconds (default: 30)
-            poll_interval: Seconds to wait between polls (default: 1.0)
+            poll_interval: Seconds to wait before the second poll (default: 0.5)
+            max_poll_interval: Upper bound on the wait between polls (default: 5.0)
             timeout: Maximum seconds to wait for completion (default: 90.0)
 
         Returns:
@@ -74,124 +109,120 @@ class ReplicateMusicGenClient:
         if duration_seconds is None:
             duration_seconds = 30
 
-        # Build request payload for prediction creation
-        payload = {
-            "version": self.version,
-            "input": {
-                "prompt": prompt,
-                "duration": duration_seconds,
-            }
-        }
+        headers = self._headers
 
-        headers = {
-            "Authorization": f"Token {self.api_token}",
-            "Content-Type": "application/json",
-        }
-
-        logger.info(f"Creating Replicate prediction: prompt='{prompt}', duration={duration_seconds}s")
+        logger.info("Creating Replicate prediction: prompt='%s', duration=%ss", prompt, duration_seconds)
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                # Step 1: Create prediction
-                create_url = f"{self.base_url}/v1/predictions"
-                response = await client.post(create_url, headers=headers, json=payload)
-
-                if response.status_code != 201:
-                    error_msg = f"Replicate API returned status {response.status_code}: {response.text}"
+            client = get_http_client("replicate")
+            # Step 1: Create prediction
+            create_url = f"{self.base_url}/v1/predictions"
+            # Bound how many predictions this process starts at once; polling
+            # an existing prediction is not limited
+            async with get_provider_semaphore("replicate", self.max_concurrent):
+                response = await send_with_retry(lambda: client.post(
+                    create_url,
+                    headers=headers,
+                    content=_serialize_payload(self.version, prompt, duration_seconds),
+                    timeout=timeout,
+                ))
+
+            if response.status_code != 201:
+                error_msg = f"Replicate API returned status {response.status_code}: {response.text}"
+                logger.error(error_msg)
+                raise ReplicateMusicGenError(error_msg)
+
+            try:
+                prediction = orjson.loads(response.content)
+            except orjson.JSONDecodeError as parse_err:
+                error_msg = f"Failed to parse Replicate API response as JSON: {parse_err}"
+                logger.error(error_msg)
+                raise ReplicateMusicGenError(error_msg) from parse_err
+
+            prediction_id = prediction.get("id") if isinstance(prediction, dict) else None
+            if not prediction_id:
+                error_msg = f"Replicate API response missing 'id' field: {prediction}"
+                logger.error(error_msg)
+                raise ReplicateMusicGenError(error_msg)
+
+            logger.info("Created prediction %s, status: %s", prediction_id, prediction.get("status"))
+
+            # Step 2: Poll for completion
+            deadline = time.monotonic() + timeout
+            get_url = f"{self.base_url}/v1/predictions/{prediction_id}"
+            current_interval = poll_interval
+
+            while True:
+                # Check timeout
+                if time.monotonic() >= deadline:
+                    error_msg = f"Replicate prediction {prediction_id} timed out after {timeout}s"
                     logger.error(error_msg)
                     raise ReplicateMusicGenError(error_msg)
 
-                try:
-                    prediction = response.json()
-                except Exception as parse_err:
-                    error_msg = f"Failed to parse Replicate API response as JSON: {parse_err}"
-                    logger.error(error_msg)
-                    raise ReplicateMusicGenError(error_msg) from parse_err
+                # Poll prediction status
+                poll_response = await send_with_retry(
+                    lambda: client.get(get_url, headers=headers, timeout=timeout),
+                    idempotent=True,
+                )
 
-                prediction_id = prediction.get("id")
-                if not prediction_id:
-                    error_msg = f"Replicate API response missing 'id' field: {prediction}"
+                if poll_response.status_code != 200:
+                    error_msg = f"Replicate API poll returned status {poll_response.status_code}: {poll_response.text}"
                     logger.error(error_msg)
                     raise ReplicateMusicGenError(error_msg)
 
-                logger.info(f"Created prediction {prediction_id}, status: {prediction.get('status')}")
+                try:
+                    prediction = orjson.loads(poll_response.content)
+                except orjson.JSONDecodeError as parse_err:
+                    error_msg = f"Failed to parse Replicate poll response as JSON: {parse_err}"
+                    logger.error(error_msg)
+                    raise ReplicateMusicGenError(error_msg) from parse_err
 
-                # Step 2: Poll for completion
-                start_time = asyncio.get_event_loop().time()
-                get_url = f"{self.base_url}/v1/predictions/{prediction_id}"
+                status = prediction.get("status") if isinstance(prediction, dict) else None
+                logger.debug("Prediction %s status: %s", prediction_id, status)
 
-                while True:
-                    # Check timeout
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    if elapsed > timeout:
-                        error_msg = f"Replicate prediction {prediction_id} timed out after {timeout}s"
+                if status == "succeeded":
+                    # Extract audio URL from output
+                    output = prediction.get("output")
+                    if not output:
+                        error_msg = f"Replicate prediction succeeded but output is empty: {prediction}"
                         logger.error(error_msg)
                         raise ReplicateMusicGenError(error_msg)
 
-                    # Poll prediction status
-                    poll_response = await client.get(get_url, headers=headers)
-
-                    if poll_response.status_code != 200:
-                        error_msg = f"Replicate API poll returned status {poll_response.status_code}: {poll_response.text}"
+                    # Output can be a string URL or a list with a URL
+                    if isinstance(output, str):
+                        audio_url = output
+                    elif isinstance(output, list) and len(output) > 0:
+                        audio_url = output[0]
+                    else:
+                        error_msg = f"Replicate prediction output has unexpected format: {output}"
                         logger.error(error_msg)
                         raise ReplicateMusicGenError(error_msg)
 
-                    try:
-                        prediction = poll_response.json()
-                    except Exception as parse_err:
-                        error_msg = f"Failed to parse Replicate poll response as JSON: {parse_err}"
-                        logger.error(error_msg)
-                        raise ReplicateMusicGenError(error_msg) from parse_err
-
-                    status = prediction.get("status")
-                    logger.debug(f"Prediction {prediction_id} status: {status}")
-
-                    if status == "succeeded":
-                        # Extract audio URL from output
-                        output = prediction.get("output")
-                        if not output:
-                            error_msg = f"Replicate prediction succeeded but output is empty: {prediction}"
-                            logger.error(error_msg)
-                            raise ReplicateMusicGenError(error_msg)
-
-                        # Output can be a string URL or a list with a URL
-                        if isinstance(output, str):
-                            audio_url = output
-                        elif isinstance(output, list) and len(output) > 0:
-                            audio_url = output[0]
-                        else:
-                            error_msg = f"Replicate prediction output has unexpected format: {output}"
-                            logger.error(error_msg)
-                            raise ReplicateMusicGenError(error_msg)
-
-                        logger.info(f"Replicate prediction succeeded: {audio_url}")
-                        return audio_url
-
-                    elif status in ["failed", "canceled"]:
-                        error = prediction.get("error", "Unknown error")
-                        error_msg = f"Replicate prediction {status}: {error}"
-                        logger.error(error_msg)
-                        raise ReplicateMusicGenError(error_msg)
+                    logger.info("Replicate prediction succeeded: %s", audio_url)
+                    return audio_url
 
-                    elif status in ["starting", "processing"]:
-                        # Continue polling
-                        await asyncio.sleep(poll_interval)
-                        continue
+                elif status in ["failed", "canceled"]:
+                    error = prediction.get("error", "Unknown error")
+                    error_msg = f"Replicate prediction {status}: {error}"
+                    logger.error(error_msg)
+                    raise ReplicateMusicGenError(error_msg)
 
-                    else:
-                        # Unknown status - treat as error
-                        error_msg = f"Replicate prediction has unknown status: {status}"
-                        logger.error(error_msg)
-                        raise ReplicateMusicGenError(error_msg)
+                elif status in ["starting", "processing"]:
+                    # Continue polling, waiting at least as long as Replicate
+                    # asks but never past the deadline
+                    retry_after = parse_retry_after(poll_response)
+                    wait = max(current_interval, retry_after or 0.0)
+                    await asyncio.sleep(max(0.0, min(wait, deadline - time.monotonic())))
+                    current_interval = min(current_interval * POLL_BACKOFF_FACTOR, max_poll_interval)
+                    continue
+
+                else:
+                    # Unknown status - treat as error
+                    error_msg = f"Replicate prediction has unknown status: {status}"
+                    logger.error(error_msg)
+                    raise ReplicateMusicGenError(error_msg)
 
         except httpx.HTTPError as http_err:
             error_msg = f"HTTP error calling Replicate API: {http_err}"
             logger.error(error_msg)
             raise ReplicateMusicGenError(error_msg) from http_err
-        except ReplicateMusicGenError:
-            # Re-raise our custom errors
-            raise
-        except Exception as exc:
-            error_msg = f"Unexpected error calling Replicate API: {exc}"
-            logger.error(error_msg)
-            raise ReplicateMusicGenError(error_msg) from exc
@@ -7,10 +7,13 @@ for generating high-quality music using hosted models.
 API Documentation: https://stability.ai/stable-audio
 """
 import logging
+from functools import lru_cache
 from typing import Optional
 import httpx
+import orjson
 
 from app.core.config import InstrumentalEngineConfig
+from app.providers.http_clients import get_http_client, send_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,16 @@ class StableAudioAPIError(Exception):
     pass
 
 
+@lru_cache(maxsize=256)
+def _serialize_payload(model: str, prompt: str, duration_seconds: int) -> bytes:
+    """Encode the request body, reusing it for repeated identical requests."""
+    return orjson.dumps({
+        "model": model,
+        "prompt": prompt,
+        "seconds_total": duration_seconds,
+    })
+
+
 async def generate_stable_audio(
     engine_config: InstrumentalEngineConfig,
     prompt: str,
@@ -65,59 +78,46 @@ async def generate_stable_audio(
     if duration_seconds is None:
         duration_seconds = 30
 
-    # Build request payload
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "seconds_total": duration_seconds,
-    }
-
-    logger.info(f"Calling Stable Audio API: {url}")
-    logger.info(f"Model: {model}, Prompt: {prompt}, Duration: {duration_seconds}s")
+    logger.info("Calling Stable Audio API: %s", url)
+    logger.info("Model: %s, Prompt: %s, Duration: %ss", model, prompt, duration_seconds)
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                url,
-                headers={
-                    "Authorization": f"Bearer {engine_config.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-
-            # Check HTTP status
-            if response.status_code != 200:
-                error_msg = f"Stable Audio API returned status {response.status_code}: {response.text}"
-                logger.error(error_msg)
-                raise StableAudioAPIError(error_msg)
-
-            # Parse JSON response
-            try:
-                data = response.json()
-            except Exception as parse_err:
-                error_msg = f"Failed to parse Stable Audio API response as JSON: {parse_err}"
-                logger.error(error_msg)
-                raise StableAudioAPIError(error_msg) from parse_err
-
-            # Extract audio URL
-            if data.get("status") == "ready" and data.get("audio_url"):
-                audio_url = data["audio_url"]
-                logger.info(f"Stable Audio API succeeded: {audio_url}")
-                return audio_url
-            else:
-                error_msg = f"Stable Audio API returned unexpected response: {data}"
-                logger.error(error_msg)
-                raise StableAudioAPIError(error_msg)
+        client = get_http_client("stable_audio")
+        response = await send_with_retry(lambda: client.post(
+            url,
+            headers={
+                "Authorization": f"Bearer {engine_config.api_key}",
+                "Content-Type": "application/json",
+            },
+            content=_serialize_payload(model, prompt, duration_seconds),
+            timeout=120.0,
+        ))
+
+        # Check HTTP status
+        if response.status_code != 200:
+            error_msg = f"Stable Audio API returned status {response.status_code}: {response.text}"
+            logger.error(error_msg)
+            raise StableAudioAPIError(error_msg)
+
+        # Parse JSON response
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as parse_err:
+            error_msg = f"Failed to parse Stable Audio API response as JSON: {parse_err}"
+            logger.error(error_msg)
+            raise StableAudioAPIError(error_msg) from parse_err
+
+        # Extract audio URL
+        if isinstance(data, dict) and data.get("status") == "ready" and data.get("audio_url"):
+            audio_url = data["audio_url"]
+            logger.info("Stable Audio API succeeded: %s", audio_url)
+            return audio_url
+        else:
+            error_msg = f"Stable Audio API returned unexpected response: {data}"
+            logger.error(error_msg)
+            raise StableAudioAPIError(error_msg)
 
     except httpx.HTTPError as http_err:
         error_msg = f"HTTP error calling Stable Audio API: {http_err}"
         logger.error(error_msg)
         raise StableAudioAPIError(error_msg) from http_err
-    except StableAudioAPIError:
-        # Re-raise our custom errors
-        raise
-    except Exception as exc:
-        error_msg = f"Unexpected error calling Stable Audio API: {exc}"
-        logger.error(error_msg)
-        raise StableAudioAPIError(error_msg) from exc
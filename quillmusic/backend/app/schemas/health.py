@@ -1,12 +1,14 @@
 """
 Health check schemas
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str
     service: str
     version: str
@@ -7,13 +7,15 @@ This module provides Pydantic models for:
 - Influence-based rewriting and suggestions
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class SectionEnergy(BaseModel):
     """Energy and tension analysis for a specific song section."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Section name (e.g., 'Intro', 'Verse 1', 'Chorus')")
     position_index: int = Field(..., ge=0, description="0-based index in the song")
     energy: float = Field(..., ge=0.0, le=1.0, description="Energy level (0.0-1.0)")
@@ -38,6 +40,8 @@ class SongDNA(BaseModel):
 class HitScoreBreakdown(BaseModel):
     """Detailed breakdown of song's commercial potential."""
 
+    model_config = ConfigDict(frozen=True)
+
     overall: float = Field(..., ge=0.0, le=100.0, description="Overall hit potential (0-100)")
     hook_strength: float = Field(..., ge=0.0, le=100.0, description="Catchiness of hooks (0-100)")
     structure: float = Field(..., ge=0.0, le=100.0, description="Song structure quality (0-100)")
@@ -60,6 +64,8 @@ class HitMakerAnalysis(BaseModel):
 class InfluenceDescriptor(BaseModel):
     """Description of an artistic influence to apply."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Artist or style name (e.g., 'The Weeknd', 'Billie Eilish')")
     weight: float = Field(..., ge=0.0, le=1.0, description="Influence strength (0.0-1.0)")
 
@@ -73,6 +79,14 @@ class HitMakerInfluenceRequest(BaseModel):
     target_mood: Optional[str] = Field(None, description="Desired mood shift")
     target_genre: Optional[str] = Field(None, description="Desired genre shift")
 
+    @model_validator(mode="after")
+    def check_total_weight(self) -> "HitMakerInfluenceRequest":
+        """Reject influence sets whose combined weight exceeds 1.2."""
+        total_weight = sum(inf.weight for inf in self.influences)
+        if total_weight > 1.2:
+            raise ValueError(f"Total influence weight {total_weight:.2f} exceeds 1.2")
+        return self
+
 
 class HitMakerInfluenceResponse(BaseModel):
     """Response with influence-adjusted DNA and creative suggestions."""
@@ -83,3 +97,40 @@ class HitMakerInfluenceResponse(BaseModel):
     structure_suggestions: list[str] = Field(..., description="Structural changes (e.g., 'Move the drop earlier')")
     instrumentation_ideas: list[str] = Field(..., description="Instrumentation recommendations")
     vocal_style_notes: list[str] = Field(..., description="Vocal delivery suggestions")
+
+
+class AnalyzeBlueprintRequest(BaseModel):
+    """Unified request: analyze an AI blueprint."""
+
+    kind: Literal["analyze_blueprint"]
+    blueprint_id: str = Field(..., description="Blueprint ID to analyze")
+
+
+class AnalyzeManualRequest(BaseModel):
+    """Unified request: analyze a Manual Creator project."""
+
+    kind: Literal["analyze_manual"]
+    manual_project_id: str = Field(..., description="Manual project ID to analyze")
+
+
+class InfluenceBlueprintRequest(HitMakerInfluenceRequest):
+    """Unified request: apply influences to an AI blueprint."""
+
+    kind: Literal["influence_blueprint"]
+    source_blueprint_id: str = Field(..., description="Source blueprint ID")
+
+
+class InfluenceManualRequest(HitMakerInfluenceRequest):
+    """Unified request: apply influences to a Manual Creator project."""
+
+    kind: Literal["influence_manual"]
+    source_manual_project_id: str = Field(..., description="Source manual project ID")
+
+
+# Body of the unified /hitmaker/analyze endpoint, discriminated on "kind"
+HitMakerRequest = Union[
+    AnalyzeBlueprintRequest,
+    AnalyzeManualRequest,
+    InfluenceBlueprintRequest,
+    InfluenceManualRequest,
+]
@@ -3,7 +3,7 @@ Instrumental rendering schemas
 """
 from datetime import datetime
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Engine and source types
@@ -14,6 +14,8 @@ InstrumentalSourceType = Literal["blueprint", "manual_project"]
 class InstrumentalRenderRequest(BaseModel):
     """Request schema for rendering an instrumental."""
 
+    model_config = ConfigDict(frozen=True)
+
     source_type: InstrumentalSourceType = Field(..., description="Type of source (blueprint or manual_project)")
     source_id: str = Field(..., description="ID of the blueprint or manual project")
     engine_type: InstrumentalEngineType = Field(default="fake", description="Engine to use for rendering")
@@ -1,14 +1,38 @@
 """
 Manual Creator schemas - DAW-style manual song projects
 """
+import base64
+import struct
 from datetime import datetime
-from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from typing import Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 # Instrument types for tracks
 InstrumentType = Literal["drums", "bass", "chords", "lead", "fx", "vocal"]
 
+# One packed note: little-endian step_index (uint32), pitch (uint8), velocity (uint8)
+NOTE_RECORD = struct.Struct("<IBB")
+# Largest step_index a note record can hold
+NOTE_STEP_MAX = 2**32 - 1
+
+
+class RowSchema(BaseModel):
+    """Response schema populated from a database row."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Build the schema from a trusted database row without validation.
+
+        Stored rows already match the schema, so this copies the field
+        attributes straight across instead of validating each one again.
+        Use model_validate for anything that did not come from the database.
+        """
+        return cls.model_construct(**{field: getattr(row, field) for field in cls.model_fields})
+
 
 # ========== Project Schemas ==========
 
@@ -22,7 +46,7 @@ class ManualProjectCreate(BaseModel):
     description: Optional[str] = Field(None, description="Project description")
 
 
-class ManualProject(BaseModel):
+class ManualProject(RowSchema):
     """Response schema for a manual project."""
 
     id: str = Field(..., description="Unique project identifier")
@@ -56,9 +80,11 @@ class TrackUpdate(BaseModel):
     channel_index: Optional[int] = Field(None, description="Channel index", ge=0)
 
 
-class Track(BaseModel):
+class Track(RowSchema):
     """Response schema for a track."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique track identifier")
     project_id: str = Field(..., description="Parent project ID")
     name: str = Field(..., description="Track name")
@@ -88,9 +114,11 @@ class PatternUpdate(BaseModel):
     start_bar: Optional[int] = Field(None, description="Start bar position", ge=0)
 
 
-class Pattern(BaseModel):
+class Pattern(RowSchema):
     """Response schema for a pattern."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique pattern identifier")
     track_id: str = Field(..., description="Parent track ID")
     name: str = Field(..., description="Pattern name")
@@ -104,14 +132,16 @@ class NoteCreate(BaseModel):
     """Request schema for creating a note."""
 
     pattern_id: str = Field(..., description="Parent pattern ID")
-    step_index: int = Field(..., description="Grid step index (0-based)", ge=0)
+    step_index: int = Field(..., description="Grid step index (0-based)", ge=0, le=NOTE_STEP_MAX)
     pitch: int = Field(..., description="MIDI pitch (0-127)", ge=0, le=127)
     velocity: int = Field(..., description="Velocity (0-127)", ge=0, le=127)
 
 
-class Note(BaseModel):
+class Note(RowSchema):
     """Response schema for a note."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique note identifier")
     pattern_id: str = Field(..., description="Parent pattern ID")
     step_index: int = Field(..., description="Grid step index (0-based)")
@@ -119,6 +149,55 @@ class Note(BaseModel):
     velocity: int = Field(..., description="Velocity (0-127)")
 
 
+class NotesColumnar(BaseModel):
+    """
+    Notes as parallel columns, one list per Note field.
+
+    Entry i of every list describes the same note. Large grids are far
+    smaller on the wire this way, since field names are not repeated per note.
+    """
+
+    id: list[str] = Field(default_factory=list, description="Note identifiers")
+    pattern_id: list[str] = Field(default_factory=list, description="Parent pattern IDs")
+    step_index: list[int] = Field(default_factory=list, description="Grid step indexes (0-based)")
+    pitch: list[int] = Field(default_factory=list, description="MIDI pitches (0-127)")
+    velocity: list[int] = Field(default_factory=list, description="Velocities (0-127)")
+
+    @classmethod
+    def from_rows(cls, rows) -> "NotesColumnar":
+        """Build the columns from trusted database rows without validation."""
+        columns = {field: [] for field in cls.model_fields}
+        for row in rows:
+            for field, column in columns.items():
+                column.append(getattr(row, field))
+        return cls.model_construct(**columns)
+
+
+class NotesPacked(BaseModel):
+    """
+    Notes with their numeric fields packed into one binary buffer.
+
+    records is base64 of one NOTE_RECORD (6 bytes) per note, in the same order
+    as id and pattern_id; decode with e.g. a DataView or
+    numpy.frombuffer(dtype=[("step_index", "<u4"), ("pitch", "u1"), ("velocity", "u1")]).
+    """
+
+    id: list[str] = Field(default_factory=list, description="Note identifiers")
+    pattern_id: list[str] = Field(default_factory=list, description="Parent pattern IDs")
+    records: str = Field("", description="Base64 of packed (step_index, pitch, velocity) records")
+
+    @classmethod
+    def from_rows(cls, rows) -> "NotesPacked":
+        """Pack trusted database rows without validation."""
+        rows = list(rows)
+        records = b"".join(NOTE_RECORD.pack(n.step_index, n.pitch, n.velocity) for n in rows)
+        return cls.model_construct(
+            id=[n.id for n in rows],
+            pattern_id=[n.pattern_id for n in rows],
+            records=base64.b64encode(records).decode("ascii"),
+        )
+
+
 # ========== Composite Response Schemas ==========
 
 class ManualProjectDetail(BaseModel):
@@ -127,4 +206,14 @@ class ManualProjectDetail(BaseModel):
     project: ManualProject = Field(..., description="Project information")
     tracks: list[Track] = Field(default_factory=list, description="All tracks in the project")
     patterns: list[Pattern] = Field(default_factory=list, description="All patterns across all tracks")
-    notes: list[Note] = Field(default_factory=list, description="All notes across all patterns")
+    notes: Union[list[Note], NotesColumnar, NotesPacked] = Field(
+        default_factory=list,
+        description="All notes across all patterns, laid out as chosen by notes_layout",
+    )
+
+
+# List adapters built once at import, for routes that validate or serialize
+# whole lists in a single pydantic-core call
+MANUAL_PROJECT_LIST = TypeAdapter(list[ManualProject])
+NOTE_CREATE_LIST = TypeAdapter(list[NoteCreate])
+NOTE_LIST = TypeAdapter(list[Note])
@@ -2,7 +2,7 @@
 Song blueprint schemas
 """
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Section types for song structure
@@ -21,6 +21,8 @@ SectionType = Literal[
 class SectionSchema(BaseModel):
     """Schema for a song section."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique identifier for the section")
     type: SectionType = Field(..., description="Type of section")
     name: str = Field(..., description="Display name for the section")
@@ -35,6 +37,8 @@ class SectionSchema(BaseModel):
 class VocalStyleSchema(BaseModel):
     """Schema for vocal style configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     gender: Literal["male", "female", "mixed", "auto"] = Field(
         ..., description="Vocal gender"
     )
@@ -0,0 +1,158 @@
+"""
+Blueprint Cache Service
+
+Redis cache for blueprint JSON. Newly generated blueprints are written here
+as soon as they are committed (bp:{id} for the document, the bp:index sorted
+set for recency), so hot reads never touch the database. SQLite keeps the
+durable copy that renders and HitMaker read, and older rows are cached from
+it on demand. Every document expires after BLUEPRINT_CACHE_TTL_SECONDS and
+the index only keeps the newest BLUEPRINT_INDEX_SIZE entries, so memory use
+stays bounded. Blueprints are immutable once written, so entries never need
+invalidating. Redis is optional: if it is unreachable every call degrades to
+a miss and callers fall back to the database.
+"""
+import logging
+from typing import Optional
+
+import redis
+
+from app.core.dependencies import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+BLUEPRINT_CACHE_TTL_SECONDS = 3600
+BLUEPRINT_INDEX_KEY = "bp:index"
+# Largest page the blueprint listing serves from the index
+BLUEPRINT_INDEX_SIZE = 100
+
+
+def _key(blueprint_id: str) -> str:
+    return f"bp:{blueprint_id}"
+
+
+def get_blueprint_json(blueprint_id: str) -> Optional[str]:
+    """
+    Get a cached blueprint document.
+
+    Args:
+        blueprint_id: The blueprint (song) ID
+
+    Returns:
+        The stored blueprint JSON, or None on a miss or Redis failure
+    """
+    try:
+        return get_redis().get(_key(blueprint_id))
+    except redis.RedisError as exc:
+        logger.debug("Blueprint cache unavailable: %s", exc)
+        return None
+
+
+async def aget_blueprint_json(blueprint_id: str) -> Optional[str]:
+    """
+    Get a cached blueprint document without blocking the event loop.
+
+    Args:
+        blueprint_id: The blueprint (song) ID
+
+    Returns:
+        The stored blueprint JSON, or None on a miss or Redis failure
+    """
+    try:
+        return await get_async_redis().get(_key(blueprint_id))
+    except redis.RedisError as exc:
+        logger.debug("Blueprint cache unavailable: %s", exc)
+        return None
+
+
+def get_recent_blueprint_ids(limit: int) -> Optional[list[str]]:
+    """
+    Get the IDs of the most recently created blueprints.
+
+    Args:
+        limit: Maximum number of IDs to return
+
+    Returns:
+        IDs newest first, or None if Redis is unavailable
+    """
+    try:
+        return get_redis().zrevrange(BLUEPRINT_INDEX_KEY, 0, limit - 1)
+    except redis.RedisError as exc:
+        logger.debug("Blueprint cache unavailable: %s", exc)
+        return None
+
+
+def get_many_blueprint_json(blueprint_ids: list[str]) -> list[Optional[str]]:
+    """
+    Get several cached blueprint documents in one round-trip.
+
+    Args:
+        blueprint_ids: Blueprint IDs to look up
+
+    Returns:
+        Cached JSON per ID, in the same order (None for misses)
+    """
+    if not blueprint_ids:
+        return []
+
+    try:
+        return get_redis().mget([_key(bp_id) for bp_id in blueprint_ids])
+    except redis.RedisError as exc:
+        logger.debug("Blueprint cache unavailable: %s", exc)
+        return [None] * len(blueprint_ids)
+
+
+def cache_blueprint_json(blueprints: dict[str, str]) -> None:
+    """
+    Store blueprint documents in the cache.
+
+    Args:
+        blueprints: Mapping of blueprint ID to its stored JSON
+    """
+    if not blueprints:
+        return
+
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for blueprint_id, blueprint_json in blueprints.items():
+            pipe.setex(_key(blueprint_id), BLUEPRINT_CACHE_TTL_SECONDS, blueprint_json)
+        pipe.execute()
+    except redis.RedisError as exc:
+        logger.debug("Blueprint cache unavailable: %s", exc)
+
+
+def store_blueprint_json(blueprint_id: str, blueprint_json: str, created_at: float) -> None:
+    """
+    Cache a new blueprint and add it to the recency index.
+
+    The document expires like any cached copy, and the index is trimmed to
+    the newest BLUEPRINT_INDEX_SIZE entries.
+
+    Args:
+        blueprint_id: The blueprint (song) ID
+        blueprint_json: The blueprint document
+        created_at: Creation time as a Unix timestamp
+    """
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.setex(_key(blueprint_id), BLUEPRINT_CACHE_TTL_SECONDS, blueprint_json)
+        pipe.zadd(BLUEPRINT_INDEX_KEY, {blueprint_id: created_at})
+        pipe.zremrangebyrank(BLUEPRINT_INDEX_KEY, 0, -BLUEPRINT_INDEX_SIZE - 1)
+        pipe.execute()
+    except redis.RedisError as exc:
+        logger.debug("Blueprint cache unavailable: %s", exc)
+
+
+def index_blueprints(created_at: dict[str, float]) -> None:
+    """
+    Add existing blueprints to the recency index.
+
+    Args:
+        created_at: Mapping of blueprint ID to its creation Unix timestamp
+    """
+    if not created_at:
+        return
+
+    try:
+        get_redis().zadd(BLUEPRINT_INDEX_KEY, created_at)
+    except redis.RedisError as exc:
+        logger.debug("Blueprint cache unavailable: %s", exc)
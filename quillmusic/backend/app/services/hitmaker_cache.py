@@ -0,0 +1,61 @@
+"""
+HitMaker Analysis Cache Service
+
+Redis cache for HitMaker analyses. The engine is deterministic in its input,
+so an analysis is stored as JSON under a hash of the source it was computed
+from. Blueprints never change once written, so their id is enough; manual
+projects add their updated_at, which every edit to the project's tracks,
+patterns or notes bumps, so a stale analysis is simply never looked up again.
+Redis is optional: if it is unreachable every call degrades to a miss.
+"""
+import hashlib
+import logging
+from datetime import datetime
+from typing import Optional
+
+import redis
+
+from app.core.dependencies import get_redis
+from app.schemas.hitmaker import HitMakerAnalysis
+
+logger = logging.getLogger(__name__)
+
+HITMAKER_CACHE_TTL_SECONDS = 86400
+
+
+def analysis_key(source_type: str, source_id: str, revision: Optional[datetime] = None) -> str:
+    """Build the cache key for an analysis of the given source revision."""
+    parts = f"{source_type}|{source_id}|{revision.isoformat() if revision else ''}"
+    return "hm:" + hashlib.blake2b(parts.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_cached_analysis(key: str) -> Optional[bytes]:
+    """
+    Get a cached analysis.
+
+    Args:
+        key: Key from analysis_key()
+
+    Returns:
+        The HitMakerAnalysis JSON, or None on a miss or Redis failure
+    """
+    try:
+        cached = get_redis().get(key)
+    except redis.RedisError as exc:
+        logger.debug("HitMaker cache unavailable: %s", exc)
+        return None
+    return cached.encode("utf-8") if cached is not None else None
+
+
+def cache_analysis(key: str, analysis: HitMakerAnalysis) -> None:
+    """
+    Store a computed analysis.
+
+    Args:
+        key: Key from analysis_key()
+        analysis: The analysis to store
+    """
+    try:
+        get_redis().set(key, analysis.model_dump_json(), ex=HITMAKER_CACHE_TTL_SECONDS)
+    except redis.RedisError as exc:
+        logger.debug("HitMaker cache unavailable: %s", exc)
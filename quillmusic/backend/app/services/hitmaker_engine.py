@@ -7,6 +7,7 @@ including energy curves, tension, hooks, and predicts commercial viability.
 """
 
 import re
+from collections import Counter
 from typing import Optional
 from app.schemas.hitmaker import (
     SectionEnergy,
@@ -41,6 +42,17 @@ class HitMakerEngine:
         "ballad": (60, 90),
     }
 
+    # Base energy by section name keyword, checked in order (first match wins);
+    # other sections get 0.5
+    SECTION_BASE_ENERGY = (
+        ("intro", 0.3),
+        ("verse", 0.5),
+        ("chorus", 0.8),
+        ("bridge", 0.6),
+        ("outro", 0.4),
+        ("drop", 0.9),
+    )
+
     # Emotional keywords for lyrics analysis
     EMOTIONAL_KEYWORDS = {
         "positive": ["love", "happy", "joy", "bright", "smile", "free", "dream", "shine"],
@@ -49,6 +61,54 @@ class HitMakerEngine:
         "calm": ["soft", "gentle", "quiet", "peace", "still", "whisper", "calm"],
     }
 
+    # Category of each keyword, and one pattern matching any keyword, so lyrics
+    # are scanned once rather than once per keyword
+    KEYWORD_CATEGORIES = {
+        word: category for category, words in EMOTIONAL_KEYWORDS.items() for word in words
+    }
+    KEYWORD_PATTERN = re.compile("|".join(map(re.escape, KEYWORD_CATEGORIES)))
+
+    # Artists with tailored influence suggestions, by the name fragments that
+    # identify them. An influence is resolved to an artist once, by the first
+    # fragment found in its lowercased name, and the suggestion tables below
+    # are keyed by that artist.
+    INFLUENCE_ARTISTS = {
+        "weeknd": "weeknd",
+        "billie": "billie_eilish",
+        "eilish": "billie_eilish",
+        "drake": "drake",
+        "taylor": "taylor_swift",
+        "swift": "taylor_swift",
+        "adele": "adele",
+        "tame": "tame_impala",
+        "impala": "tame_impala",
+    }
+    INFLUENCE_PATTERN = re.compile("|".join(map(re.escape, INFLUENCE_ARTISTS)))
+
+    HOOK_SUGGESTIONS = {
+        "weeknd": ["Use falsetto runs on sustained notes", "Layer dark, atmospheric vocal ad-libs"],
+        "billie_eilish": ["Whispered, intimate delivery in verses", "Minimal, bass-heavy production"],
+        "drake": ["Melodic rap verses with sung hooks", "Introspective, emotional lyrics"],
+    }
+    CHORUS_IDEAS = {
+        "taylor_swift": [
+            "Use storytelling bridge that reveals emotional climax",
+            "Add personal, confessional details in pre-chorus",
+        ],
+        "weeknd": ["Build tension with dark, moody pre-chorus", "Release in soaring, melismatic chorus"],
+    }
+    INSTRUMENTATION_IDEAS = {
+        "billie_eilish": ["Minimal production: sub-bass, sparse beats, intimate vocals"],
+        "weeknd": ["80s-inspired synths with modern R&B drums", "Heavy reverb and atmospheric pads"],
+        "drake": ["Trap-influenced hi-hats with melodic piano"],
+        "tame_impala": ["Psychedelic synths, phaser effects, vintage drum machines"],
+    }
+    VOCAL_STYLE_NOTES = {
+        "billie_eilish": ["Breathy, close-mic'd delivery in verses", "Occasional powerful belts for contrast"],
+        "weeknd": ["Falsetto runs and melismatic phrases", "Dark, emotional tone throughout"],
+        "adele": ["Power vocals with emotional vulnerability", "Strong belting in chorus"],
+    }
+
     def analyze_blueprint(
         self,
         blueprint: SongBlueprintResponse,
@@ -62,13 +122,15 @@ class HitMakerEngine:
         # Build energy/tension curves
         energy_curve = [s.energy for s in sections]
         tension_curve = [s.tension for s in sections]
+        # Chorus sections are found once, for the structure notes and hook score
+        chorus_energies = [s.energy for s in sections if "chorus" in s.name.lower()]
 
         # Determine mood and genre
         dominant_mood = self._infer_mood_from_blueprint(blueprint)
         genre_guess = self._infer_genre_from_blueprint(blueprint)
 
         # Generate structure notes
-        structure_notes = self._generate_structure_notes_blueprint(blueprint, sections)
+        structure_notes = self._generate_structure_notes_blueprint(blueprint, sections, chorus_energies)
 
         # Build DNA
         dna = SongDNA(
@@ -83,7 +145,7 @@ class HitMakerEngine:
         )
 
         # Calculate HitScore
-        score = self._calculate_hitscore_blueprint(blueprint, sections)
+        score = self._calculate_hitscore_blueprint(blueprint, sections, energy_curve, chorus_energies)
 
         # Generate insights
         commentary = self._generate_commentary(dna, score)
@@ -128,7 +190,7 @@ class HitMakerEngine:
         )
 
         # Calculate HitScore
-        score = self._calculate_hitscore_manual(project, sections)
+        score = self._calculate_hitscore_manual(project, sections, energy_curve)
 
         # Generate insights
         commentary = self._generate_commentary(dna, score)
@@ -149,11 +211,18 @@ class HitMakerEngine:
         influences: list[InfluenceDescriptor],
         target_mood: Optional[str] = None,
         target_genre: Optional[str] = None,
+        current_analysis: Optional[HitMakerAnalysis] = None,
     ) -> HitMakerInfluenceResponse:
-        """Apply artistic influences to adjust a blueprint."""
+        """
+        Apply artistic influences to adjust a blueprint.
+
+        current_analysis may pass in an existing analysis of the same blueprint
+        (e.g. a cached one), which is then adjusted instead of re-analyzing.
+        """
 
         # Analyze current state
-        current_analysis = self.analyze_blueprint(blueprint)
+        if current_analysis is None:
+            current_analysis = self.analyze_blueprint(blueprint)
         adjusted_dna = current_analysis.dna
 
         # Modify DNA based on influences
@@ -162,25 +231,31 @@ class HitMakerEngine:
         if target_genre:
             adjusted_dna.genre_guess = target_genre
 
-        # Adjust energy curves based on influences
-        for influence in influences:
-            if "weeknd" in influence.name.lower():
+        artists = self._resolve_influences(influences)
+
+        # Adjust energy curves based on influences. The per-influence factors
+        # are combined first so each curve is rescaled in a single pass.
+        energy_scale = 1.0
+        tension_scale = 1.0
+        for influence, artist in artists:
+            if artist == "weeknd":
                 # Apply dark, moody R&B characteristics
-                adjusted_dna.global_energy_curve = [
-                    e * (0.7 + 0.3 * (1 - influence.weight)) for e in adjusted_dna.global_energy_curve
-                ]
-            elif "billie" in influence.name.lower() or "eilish" in influence.name.lower():
+                energy_scale *= 0.7 + 0.3 * (1 - influence.weight)
+            elif artist == "billie_eilish":
                 # Apply minimalist, tension-based characteristics
-                adjusted_dna.global_tension_curve = [
-                    t * (1.0 + 0.3 * influence.weight) for t in adjusted_dna.global_tension_curve
-                ]
+                tension_scale *= 1.0 + 0.3 * influence.weight
+
+        if energy_scale != 1.0:
+            adjusted_dna.global_energy_curve = [e * energy_scale for e in adjusted_dna.global_energy_curve]
+        if tension_scale != 1.0:
+            adjusted_dna.global_tension_curve = [t * tension_scale for t in adjusted_dna.global_tension_curve]
 
         # Generate creative suggestions
-        hook_suggestions = self._generate_hook_suggestions(blueprint, influences)
-        chorus_rewrite_ideas = self._generate_chorus_ideas(blueprint, influences)
+        hook_suggestions = self._generate_hook_suggestions(blueprint, artists)
+        chorus_rewrite_ideas = self._generate_chorus_ideas(blueprint, artists)
         structure_suggestions = self._generate_structure_suggestions(current_analysis.dna, influences)
-        instrumentation_ideas = self._generate_instrumentation_ideas(influences, target_genre)
-        vocal_style_notes = self._generate_vocal_style_notes(influences)
+        instrumentation_ideas = self._generate_instrumentation_ideas(artists, target_genre)
+        vocal_style_notes = self._generate_vocal_style_notes(artists)
 
         return HitMakerInfluenceResponse(
             adjusted_dna=adjusted_dna,
@@ -197,11 +272,18 @@ class HitMakerEngine:
         influences: list[InfluenceDescriptor],
         target_mood: Optional[str] = None,
         target_genre: Optional[str] = None,
+        current_analysis: Optional[HitMakerAnalysis] = None,
     ) -> HitMakerInfluenceResponse:
-        """Apply artistic influences to adjust a manual project."""
+        """
+        Apply artistic influences to adjust a manual project.
+
+        current_analysis may pass in an existing analysis of the same project
+        (e.g. a cached one), which is then adjusted instead of re-analyzing.
+        """
 
         # Analyze current state
-        current_analysis = self.analyze_manual_project(project)
+        if current_analysis is None:
+            current_analysis = self.analyze_manual_project(project)
         adjusted_dna = current_analysis.dna
 
         # Modify DNA based on influences
@@ -211,11 +293,12 @@ class HitMakerEngine:
             adjusted_dna.genre_guess = target_genre
 
         # Generate suggestions (similar to blueprint but adapted for manual)
+        artists = self._resolve_influences(influences)
         hook_suggestions = self._generate_hook_suggestions_manual(project, influences)
         chorus_rewrite_ideas = self._generate_chorus_ideas_manual(project, influences)
         structure_suggestions = self._generate_structure_suggestions(current_analysis.dna, influences)
-        instrumentation_ideas = self._generate_instrumentation_ideas(influences, target_genre)
-        vocal_style_notes = self._generate_vocal_style_notes(influences)
+        instrumentation_ideas = self._generate_instrumentation_ideas(artists, target_genre)
+        vocal_style_notes = self._generate_vocal_style_notes(artists)
 
         return HitMakerInfluenceResponse(
             adjusted_dna=adjusted_dna,
@@ -233,14 +316,17 @@ class HitMakerEngine:
         sections = []
 
         for idx, section in enumerate(blueprint.sections):
+            # The name is lowercased once for all the keyword checks below
+            name_lower = section.name.lower()
+
             # Calculate energy based on section type and BPM
-            energy = self._calculate_section_energy(section.name, blueprint.bpm)
+            energy = self._calculate_section_energy(name_lower, blueprint.bpm)
 
             # Calculate tension based on position (builds toward middle/end)
-            tension = self._calculate_section_tension(idx, len(blueprint.sections), section.name)
+            tension = self._calculate_section_tension(idx, len(blueprint.sections), name_lower)
 
             # Hook density higher for chorus
-            hook_density = 0.8 if "chorus" in section.name.lower() else 0.4
+            hook_density = 0.8 if "chorus" in name_lower else 0.4
 
             sections.append(SectionEnergy(
                 name=section.name,
@@ -248,29 +334,18 @@ class HitMakerEngine:
                 energy=energy,
                 tension=tension,
                 hook_density=hook_density,
-                notes=f"{section.bars} bars, {section.description}" if hasattr(section, 'description') else None,
+                notes=f"{section.bars} bars, {section.description}",
             ))
 
         return sections
 
-    def _calculate_section_energy(self, section_name: str, bpm: int) -> float:
-        """Calculate energy level for a section."""
-        base_energy = 0.5
-
+    def _calculate_section_energy(self, name_lower: str, bpm: int) -> float:
+        """Calculate energy level for a section from its lowercased name."""
         # Section type modifiers
-        name_lower = section_name.lower()
-        if "intro" in name_lower:
-            base_energy = 0.3
-        elif "verse" in name_lower:
-            base_energy = 0.5
-        elif "chorus" in name_lower:
-            base_energy = 0.8
-        elif "bridge" in name_lower:
-            base_energy = 0.6
-        elif "outro" in name_lower:
-            base_energy = 0.4
-        elif "drop" in name_lower:
-            base_energy = 0.9
+        base_energy = next(
+            (energy for keyword, energy in self.SECTION_BASE_ENERGY if keyword in name_lower),
+            0.5,
+        )
 
         # BPM modifier
         if bpm > 140:
@@ -280,8 +355,8 @@ class HitMakerEngine:
 
         return min(1.0, max(0.0, base_energy))
 
-    def _calculate_section_tension(self, index: int, total: int, section_name: str) -> float:
-        """Calculate tension for a section based on position."""
+    def _calculate_section_tension(self, index: int, total: int, name_lower: str) -> float:
+        """Calculate tension for a section (lowercased name) based on position."""
         # Natural arc: builds to 60-70% through song
         if total == 0:
             return 0.5
@@ -293,7 +368,7 @@ class HitMakerEngine:
         base_tension = max(0.1, min(0.9, base_tension))
 
         # Bridge typically has high tension
-        if "bridge" in section_name.lower():
+        if "bridge" in name_lower:
             base_tension = min(1.0, base_tension * 1.3)
 
         return base_tension
@@ -301,13 +376,16 @@ class HitMakerEngine:
     def _infer_mood_from_blueprint(self, blueprint: SongBlueprintResponse) -> str:
         """Infer dominant mood from blueprint."""
         # Check genre and mood fields
-        mood = blueprint.mood.lower() if hasattr(blueprint, 'mood') else "energetic"
+        mood = blueprint.mood.lower()
 
         # Analyze lyrics for emotional content
-        all_lyrics = " ".join([s.lyrics for s in blueprint.sections if hasattr(s, 'lyrics')])
+        all_lyrics = " ".join(blueprint.lyrics.values())
 
-        positive_count = sum(all_lyrics.lower().count(word) for word in self.EMOTIONAL_KEYWORDS["positive"])
-        negative_count = sum(all_lyrics.lower().count(word) for word in self.EMOTIONAL_KEYWORDS["negative"])
+        keyword_counts = Counter(
+            self.KEYWORD_CATEGORIES[word] for word in self.KEYWORD_PATTERN.findall(all_lyrics.lower())
+        )
+        positive_count = keyword_counts["positive"]
+        negative_count = keyword_counts["negative"]
 
         if negative_count > positive_count:
             return "melancholic"
@@ -318,28 +396,19 @@ class HitMakerEngine:
 
     def _infer_genre_from_blueprint(self, blueprint: SongBlueprintResponse) -> str:
         """Infer genre from blueprint."""
-        if hasattr(blueprint, 'genre'):
-            return blueprint.genre.lower()
-
-        # Use BPM to guess
-        bpm = blueprint.bpm
-        for genre, (min_bpm, max_bpm) in self.GENRE_TEMPO_RANGES.items():
-            if min_bpm <= bpm <= max_bpm:
-                return genre
-
-        return "pop"  # default
+        return blueprint.genre.lower()
 
     def _generate_structure_notes_blueprint(
         self,
         blueprint: SongBlueprintResponse,
-        sections: list[SectionEnergy]
+        sections: list[SectionEnergy],
+        chorus_energies: list[float],
     ) -> list[str]:
         """Generate structural observations."""
         notes = []
 
         # Check for chorus
-        has_chorus = any("chorus" in s.name.lower() for s in sections)
-        if not has_chorus:
+        if not chorus_energies:
             notes.append("No clear chorus section detected - consider adding one for catchiness")
 
         # Check for variety
@@ -360,28 +429,29 @@ class HitMakerEngine:
     def _calculate_hitscore_blueprint(
         self,
         blueprint: SongBlueprintResponse,
-        sections: list[SectionEnergy]
+        sections: list[SectionEnergy],
+        energy_curve: list[float],
+        chorus_energies: list[float],
     ) -> HitScoreBreakdown:
         """Calculate hit potential scores for blueprint."""
 
         # Hook strength: based on chorus presence and energy
-        has_chorus = any("chorus" in s.name.lower() for s in sections)
-        chorus_energy = max([s.energy for s in sections if "chorus" in s.name.lower()], default=0.5)
-        hook_strength = (70.0 if has_chorus else 40.0) + (chorus_energy * 20.0)
+        chorus_energy = max(chorus_energies, default=0.5)
+        hook_strength = (70.0 if chorus_energies else 40.0) + (chorus_energy * 20.0)
 
         # Structure: variety and clear arc
         section_variety = min(100.0, len(sections) * 15.0)
-        energy_variance = self._calculate_variance([s.energy for s in sections])
+        energy_variance = self._calculate_variance(energy_curve)
         structure = (section_variety * 0.6) + (energy_variance * 40.0)
 
         # Lyrics emotion: based on keyword analysis
-        all_lyrics = " ".join([s.lyrics for s in blueprint.sections if hasattr(s, 'lyrics')])
+        all_lyrics = " ".join(blueprint.lyrics.values())
         lyrics_emotion = min(100.0, 60.0 + len(all_lyrics.split()) * 0.5)
 
         # Genre fit: based on BPM matching
         genre_fit = 75.0  # baseline
         bpm = blueprint.bpm
-        genre_lower = blueprint.genre.lower() if hasattr(blueprint, 'genre') else ""
+        genre_lower = blueprint.genre.lower()
         if genre_lower in self.GENRE_TEMPO_RANGES:
             min_bpm, max_bpm = self.GENRE_TEMPO_RANGES[genre_lower]
             if min_bpm <= bpm <= max_bpm:
@@ -423,18 +493,21 @@ class HitMakerEngine:
         """Analyze manual project by dividing into sections."""
         # Divide the 16-bar grid into 4-bar sections
         sections = []
-        max_bar = self._get_max_bar(project)
+        # Flatten the track/pattern graph once rather than walking it per section
+        spans = self._pattern_spans(project)
+        max_bar = self._get_max_bar(spans)
         section_size = 4
+        total_sections = (max_bar + section_size - 1) // section_size
+        tallies = self._tally_section_spans(spans, total_sections, section_size)
 
-        for start_bar in range(0, max_bar, section_size):
+        for section_idx, tally in enumerate(tallies):
+            start_bar = section_idx * section_size
             end_bar = min(start_bar + section_size, max_bar)
 
             # Calculate energy based on pattern density in this range
-            energy = self._calculate_manual_section_energy(project, start_bar, end_bar)
+            energy = self._calculate_manual_section_energy(*tally)
 
             # Calculate tension (builds toward middle)
-            section_idx = start_bar // section_size
-            total_sections = (max_bar + section_size - 1) // section_size
             tension = self._calculate_section_tension(section_idx, total_sections, "")
 
             # Hook density based on energy and repetition
@@ -458,32 +531,54 @@ class HitMakerEngine:
             notes="Empty or minimal project",
         )]
 
+    def _pattern_spans(self, project: ManualProjectModel) -> list[tuple[int, int, str, int]]:
+        """List (start_bar, end_bar, instrument_type, note_count) for every pattern."""
+        return [
+            (
+                pattern.start_bar,
+                pattern.start_bar + pattern.length_bars,
+                track.instrument_type,
+                len(pattern.notes),
+            )
+            for track in project.tracks
+            for pattern in track.patterns
+        ]
+
+    def _tally_section_spans(
+        self,
+        spans: list[tuple[int, int, str, int]],
+        total_sections: int,
+        section_size: int,
+    ) -> list[list]:
+        """
+        Tally [pattern_count, total_notes, has_drums, has_lead] for each section.
+
+        Each pattern is added to just the sections its bars overlap, so the
+        spans are walked once rather than once per section.
+        """
+        tallies = [[0, 0, False, False] for _ in range(total_sections)]
+
+        for pattern_start, pattern_end, instrument_type, note_count in spans:
+            is_drums = instrument_type == "drums"
+            is_lead = instrument_type in ["lead", "chords"]
+            first = pattern_start // section_size
+            last = min(total_sections, (pattern_end - 1) // section_size + 1)
+            for tally in tallies[first:last]:
+                tally[0] += 1
+                tally[1] += note_count
+                tally[2] = tally[2] or is_drums
+                tally[3] = tally[3] or is_lead
+
+        return tallies
+
     def _calculate_manual_section_energy(
         self,
-        project: ManualProjectModel,
-        start_bar: int,
-        end_bar: int
+        pattern_count: int,
+        total_notes: int,
+        has_drums: bool,
+        has_lead: bool,
     ) -> float:
-        """Calculate energy for a bar range in manual project."""
-        # Count patterns and notes in this range
-        pattern_count = 0
-        total_notes = 0
-        has_drums = False
-        has_lead = False
-
-        for track in project.tracks:
-            for pattern in track.patterns:
-                # Check if pattern overlaps with this range
-                pattern_end = pattern.start_bar + pattern.length_bars
-                if pattern.start_bar < end_bar and pattern_end > start_bar:
-                    pattern_count += 1
-                    total_notes += len(pattern.notes)
-
-                    if track.instrument_type == "drums":
-                        has_drums = True
-                    elif track.instrument_type in ["lead", "chords"]:
-                        has_lead = True
-
+        """Calculate energy for a bar range from the patterns overlapping it."""
         # Base energy from pattern density
         base_energy = min(1.0, pattern_count * 0.15)
 
@@ -497,14 +592,12 @@ class HitMakerEngine:
 
         return min(1.0, base_energy + note_boost)
 
-    def _get_max_bar(self, project: ManualProjectModel) -> int:
+    def _get_max_bar(self, spans: list[tuple[int, int, str, int]]) -> int:
         """Get the last bar position in the project."""
         max_bar = 16  # default
 
-        for track in project.tracks:
-            for pattern in track.patterns:
-                pattern_end = pattern.start_bar + pattern.length_bars
-                max_bar = max(max_bar, pattern_end)
+        for _, pattern_end, _, _ in spans:
+            max_bar = max(max_bar, pattern_end)
 
         return max_bar
 
@@ -568,16 +661,17 @@ class HitMakerEngine:
     def _calculate_hitscore_manual(
         self,
         project: ManualProjectModel,
-        sections: list[SectionEnergy]
+        sections: list[SectionEnergy],
+        energy_curve: list[float],
     ) -> HitScoreBreakdown:
         """Calculate hit potential scores for manual project."""
 
         # Hook strength: based on pattern repetition and energy
-        max_energy = max([s.energy for s in sections], default=0.5)
+        max_energy = max(energy_curve, default=0.5)
         hook_strength = 50.0 + (max_energy * 40.0)
 
         # Structure: variety in sections
-        energy_variance = self._calculate_variance([s.energy for s in sections])
+        energy_variance = self._calculate_variance(energy_curve)
         structure = 50.0 + (energy_variance * 40.0) + (len(sections) * 5.0)
 
         # Lyrics emotion: N/A for manual, use baseline
@@ -684,53 +778,46 @@ class HitMakerEngine:
 
     # ========== Influence Application ==========
 
+    def _resolve_influences(
+        self,
+        influences: list[InfluenceDescriptor]
+    ) -> list[tuple[InfluenceDescriptor, Optional[str]]]:
+        """Pair each influence with its known artist (see INFLUENCE_ARTISTS), or None."""
+        resolved = []
+        for influence in influences:
+            match = self.INFLUENCE_PATTERN.search(influence.name.lower())
+            resolved.append((influence, self.INFLUENCE_ARTISTS[match.group()] if match else None))
+        return resolved
+
     def _generate_hook_suggestions(
         self,
         blueprint: SongBlueprintResponse,
-        influences: list[InfluenceDescriptor]
+        artists: list[tuple[InfluenceDescriptor, Optional[str]]]
     ) -> list[str]:
-        """Generate hook suggestions based on influences."""
+        """Generate hook suggestions based on resolved influences."""
         suggestions = []
 
-        for influence in influences:
-            name_lower = influence.name.lower()
-
-            if "weeknd" in name_lower:
-                suggestions.append("Use falsetto runs on sustained notes")
-                suggestions.append("Layer dark, atmospheric vocal ad-libs")
-            elif "billie" in name_lower or "eilish" in name_lower:
-                suggestions.append("Whispered, intimate delivery in verses")
-                suggestions.append("Minimal, bass-heavy production")
-            elif "drake" in name_lower:
-                suggestions.append("Melodic rap verses with sung hooks")
-                suggestions.append("Introspective, emotional lyrics")
-            else:
-                suggestions.append(f"Incorporate {influence.name}-inspired melodic motifs")
+        for influence, artist in artists:
+            suggestions.extend(
+                self.HOOK_SUGGESTIONS.get(artist)
+                or [f"Incorporate {influence.name}-inspired melodic motifs"]
+            )
 
         return suggestions if suggestions else ["Focus on memorable, repeating melodic phrases"]
 
     def _generate_chorus_ideas(
         self,
         blueprint: SongBlueprintResponse,
-        influences: list[InfluenceDescriptor]
+        artists: list[tuple[InfluenceDescriptor, Optional[str]]]
     ) -> list[str]:
         """Generate chorus rewrite ideas."""
         ideas = []
 
-        # Get existing chorus if any
-        chorus_sections = [s for s in blueprint.sections if "chorus" in s.name.lower()]
-
-        for influence in influences:
-            name_lower = influence.name.lower()
-
-            if "taylor" in name_lower or "swift" in name_lower:
-                ideas.append("Use storytelling bridge that reveals emotional climax")
-                ideas.append("Add personal, confessional details in pre-chorus")
-            elif "weeknd" in name_lower:
-                ideas.append("Build tension with dark, moody pre-chorus")
-                ideas.append("Release in soaring, melismatic chorus")
-            else:
-                ideas.append(f"Apply {influence.name}'s signature melodic patterns")
+        for influence, artist in artists:
+            ideas.extend(
+                self.CHORUS_IDEAS.get(artist)
+                or [f"Apply {influence.name}'s signature melodic patterns"]
+            )
 
         ideas.append("Repeat chorus title 2-3 times for memorability")
         ideas.append("Simplify chord progression for maximum impact")
@@ -767,24 +854,14 @@ class HitMakerEngine:
 
     def _generate_instrumentation_ideas(
         self,
-        influences: list[InfluenceDescriptor],
+        artists: list[tuple[InfluenceDescriptor, Optional[str]]],
         target_genre: Optional[str] = None
     ) -> list[str]:
         """Generate instrumentation suggestions."""
         ideas = []
 
-        for influence in influences:
-            name_lower = influence.name.lower()
-
-            if "billie" in name_lower or "eilish" in name_lower:
-                ideas.append("Minimal production: sub-bass, sparse beats, intimate vocals")
-            elif "weeknd" in name_lower:
-                ideas.append("80s-inspired synths with modern R&B drums")
-                ideas.append("Heavy reverb and atmospheric pads")
-            elif "drake" in name_lower:
-                ideas.append("Trap-influenced hi-hats with melodic piano")
-            elif "tame" in name_lower or "impala" in name_lower:
-                ideas.append("Psychedelic synths, phaser effects, vintage drum machines")
+        for _, artist in artists:
+            ideas.extend(self.INSTRUMENTATION_IDEAS.get(artist, []))
 
         if target_genre:
             if "edm" in target_genre.lower():
@@ -794,24 +871,18 @@ class HitMakerEngine:
 
         return ideas if ideas else ["Focus on genre-appropriate instrumentation"]
 
-    def _generate_vocal_style_notes(self, influences: list[InfluenceDescriptor]) -> list[str]:
+    def _generate_vocal_style_notes(
+        self,
+        artists: list[tuple[InfluenceDescriptor, Optional[str]]]
+    ) -> list[str]:
         """Generate vocal delivery suggestions."""
         notes = []
 
-        for influence in influences:
-            name_lower = influence.name.lower()
-
-            if "billie" in name_lower or "eilish" in name_lower:
-                notes.append("Breathy, close-mic'd delivery in verses")
-                notes.append("Occasional powerful belts for contrast")
-            elif "weeknd" in name_lower:
-                notes.append("Falsetto runs and melismatic phrases")
-                notes.append("Dark, emotional tone throughout")
-            elif "adele" in name_lower:
-                notes.append("Power vocals with emotional vulnerability")
-                notes.append("Strong belting in chorus")
-            else:
-                notes.append(f"Study {influence.name}'s vocal phrasing and dynamics")
+        for influence, artist in artists:
+            notes.extend(
+                self.VOCAL_STYLE_NOTES.get(artist)
+                or [f"Study {influence.name}'s vocal phrasing and dynamics"]
+            )
 
         return notes if notes else ["Match vocal intensity to energy curve"]
 
@@ -5,7 +5,6 @@ from abc import ABC, abstractmethod
 from typing import Tuple, Optional
 import logging
 import httpx
-import asyncio
 
 from app.core.config import InstrumentalEngineConfig
 
@@ -261,10 +260,11 @@ class ExternalInstrumentalEngine(BaseInstrumentalEngine):
         # Route to specific client based on engine name
         if self.engine_name == "stable_audio_api":
             # Use dedicated Stable Audio API client
+            from app.providers.http_clients import run_sync
             from app.providers.stable_audio_api import generate_stable_audio, StableAudioAPIError
             try:
                 # Run async function in sync context
-                audio_url = asyncio.run(generate_stable_audio(
+                audio_url = run_sync(generate_stable_audio(
                     engine_config=self.engine_config,
                     prompt=prompt,
                     duration_seconds=duration_seconds,
@@ -276,12 +276,13 @@ class ExternalInstrumentalEngine(BaseInstrumentalEngine):
 
         elif self.engine_name == "replicate_musicgen":
             # Use dedicated Replicate MusicGen client
+            from app.providers.http_clients import run_sync
             from app.providers.replicate_musicgen import ReplicateMusicGenClient, ReplicateMusicGenError
             from app.core.config import settings
             try:
                 client = ReplicateMusicGenClient(settings=settings)
                 # Run async function in sync context
-                audio_url = asyncio.run(client.generate_audio(
+                audio_url = run_sync(client.generate_audio(
                     prompt=prompt,
                     duration_seconds=duration_seconds,
                 ))
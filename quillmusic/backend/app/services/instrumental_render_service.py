@@ -2,17 +2,16 @@
 Instrumental render service - orchestrates rendering jobs
 """
 import uuid
-import json
 import logging
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.schemas.instrumental import InstrumentalRenderRequest, InstrumentalRenderStatus
 from app.schemas.song import SongBlueprintResponse
 from app.schemas.manual import ManualProject
 from app.models.instrumental import InstrumentalJobModel
 from app.models.blueprint import SongBlueprintModel
-from app.models.manual import ManualProjectModel
+from app.models.manual import ManualProjectModel, TrackModel
 from app.services.instrumental_engine import (
     get_instrumental_engine,
     ConfigurationError,
@@ -70,7 +69,6 @@ def create_instrumental_job(
         job.duration_seconds = duration_seconds
         job.updated_at = datetime.utcnow()
         db.commit()
-        db.refresh(job)
 
         logger.info(f"Instrumental job {job_id} completed successfully")
 
@@ -78,37 +76,34 @@ def create_instrumental_job(
         logger.error(f"Instrumental job {job_id} configuration error: {str(exc)}")
 
         # Update job to "failed"
-        job = db.query(InstrumentalJobModel).filter(InstrumentalJobModel.id == job_id).first()
+        job = db.get(InstrumentalJobModel, job_id)
         if job:
             job.status = "failed"
             job.error_message = f"Configuration error: {str(exc)}"
             job.updated_at = datetime.utcnow()
             db.commit()
-            db.refresh(job)
 
     except ExternalAudioError as exc:
         logger.error(f"Instrumental job {job_id} audio provider error: {str(exc)}")
 
         # Update job to "failed"
-        job = db.query(InstrumentalJobModel).filter(InstrumentalJobModel.id == job_id).first()
+        job = db.get(InstrumentalJobModel, job_id)
         if job:
             job.status = "failed"
             job.error_message = f"Audio provider error: {str(exc)}"
             job.updated_at = datetime.utcnow()
             db.commit()
-            db.refresh(job)
 
     except Exception as exc:
         logger.error(f"Instrumental job {job_id} unexpected error: {str(exc)}")
 
         # Update job to "failed"
-        job = db.query(InstrumentalJobModel).filter(InstrumentalJobModel.id == job_id).first()
+        job = db.get(InstrumentalJobModel, job_id)
         if job:
             job.status = "failed"
             job.error_message = f"Unexpected error: {str(exc)}"
             job.updated_at = datetime.utcnow()
             db.commit()
-            db.refresh(job)
 
     # Convert to response schema
     return _job_model_to_status(job)
@@ -128,7 +123,7 @@ def get_instrumental_job(job_id: str, db: Session) -> InstrumentalRenderStatus:
     Raises:
         ValueError: If job not found
     """
-    job = db.query(InstrumentalJobModel).filter(InstrumentalJobModel.id == job_id).first()
+    job = db.get(InstrumentalJobModel, job_id)
 
     if not job:
         raise ValueError(f"Instrumental job {job_id} not found")
@@ -155,40 +150,31 @@ def _render_instrumental(request: InstrumentalRenderRequest, db: Session) -> tup
 
     if request.source_type == "blueprint":
         # Load blueprint from database
-        blueprint_model = db.query(SongBlueprintModel).filter(
-            SongBlueprintModel.id == request.source_id
-        ).first()
+        blueprint_model = db.get(SongBlueprintModel, request.source_id)
 
         if not blueprint_model:
             raise ValueError(f"Blueprint {request.source_id} not found")
 
-        # Deserialize blueprint JSON
-        blueprint_data = json.loads(blueprint_model.blueprint_json)
-        blueprint = SongBlueprintResponse(**blueprint_data)
+        blueprint = SongBlueprintResponse.model_validate_json(blueprint_model.blueprint_json)
 
         # Render from blueprint
         audio_url, duration = engine.render_from_blueprint(blueprint)
 
     elif request.source_type == "manual_project":
         # Load manual project
-        project_model = db.query(ManualProjectModel).filter(
-            ManualProjectModel.id == request.source_id
-        ).first()
+        # Tracks and their patterns are loaded up front in two IN queries
+        # rather than one query per track; notes are not needed for rendering
+        project_model = db.get(
+            ManualProjectModel,
+            request.source_id,
+            options=[selectinload(ManualProjectModel.tracks).selectinload(TrackModel.patterns)],
+        )
 
         if not project_model:
             raise ValueError(f"Manual project {request.source_id} not found")
 
         # Convert to schema
-        project = ManualProject(
-            id=project_model.id,
-            name=project_model.name,
-            tempo_bpm=project_model.tempo_bpm,
-            time_signature=project_model.time_signature,
-            key=project_model.key,
-            description=project_model.description,
-            created_at=project_model.created_at,
-            updated_at=project_model.updated_at,
-        )
+        project = ManualProject.model_validate(project_model)
 
         # Get tracks and patterns
         tracks = project_model.tracks
@@ -0,0 +1,63 @@
+"""
+Vocal Preview Cache Service
+
+Redis cache for generated vocal preview audio, keyed by a hash of the exact
+(text, voice_id, model_id) request. Users iterating in the UI often request
+the same line again, and a hit saves both the TTS latency and the API spend.
+Redis is optional: if it is unreachable every call degrades to a miss.
+"""
+import hashlib
+import logging
+from typing import Optional
+
+import redis
+
+from app.core.dependencies import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+VOCAL_PREVIEW_CACHE_TTL_SECONDS = 86400
+# Longer previews are streamed but not cached
+VOCAL_PREVIEW_CACHE_MAX_BYTES = 5 * 1024 * 1024
+
+
+def preview_key(text: str, voice_id: str, model_id: str) -> str:
+    """Build the cache key for a preview request."""
+    digest = hashlib.sha256(f"{voice_id}|{model_id}|{text}".encode("utf-8")).hexdigest()
+    return f"tts:{digest}"
+
+
+async def get_preview_audio(key: str) -> Optional[bytes]:
+    """
+    Get cached preview audio.
+
+    Args:
+        key: Key from preview_key()
+
+    Returns:
+        The MP3 bytes, or None on a miss or Redis failure
+    """
+    try:
+        return await get_async_redis(decode_responses=False).get(key)
+    except redis.RedisError as exc:
+        logger.debug("Vocal preview cache unavailable: %s", exc)
+        return None
+
+
+async def cache_preview_audio(key: str, audio: bytes) -> None:
+    """
+    Store generated preview audio.
+
+    Args:
+        key: Key from preview_key()
+        audio: The complete MP3 bytes
+    """
+    if len(audio) > VOCAL_PREVIEW_CACHE_MAX_BYTES:
+        return
+
+    try:
+        await get_async_redis(decode_responses=False).set(
+            key, audio, ex=VOCAL_PREVIEW_CACHE_TTL_SECONDS
+        )
+    except redis.RedisError as exc:
+        logger.debug("Vocal preview cache unavailable: %s", exc)
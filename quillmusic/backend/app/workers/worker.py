@@ -11,8 +11,9 @@ Usage:
     To run multiple workers:
     $ rq worker renders blueprints --url redis://localhost:6379/0
 """
+from redis import Redis
 from rq import Worker, Queue, Connection
-from app.core.dependencies import get_redis
+from app.core.config import settings
 
 
 def process_render_job(song_id: str, render_type: str):
@@ -82,7 +83,9 @@ def start_worker(queues: list[str] = None):
     if queues is None:
         queues = ["renders", "blueprints"]
 
-    redis_conn = get_redis()
+    # A dedicated connection: the shared client's short socket timeout would
+    # cut off the worker's long blocking dequeue
+    redis_conn = Redis.from_url(settings.REDIS_URL)
 
     with Connection(redis_conn):
         worker = Worker(list(map(Queue, queues)))
@@ -1,15 +1,27 @@
 """
 Tests for ElevenLabs TTS integration
 """
+import asyncio
+import json
+
+import httpx
 import pytest
 from unittest.mock import patch, Mock, AsyncMock
 from fastapi.testclient import TestClient
+from app.core.dependencies import get_elevenlabs_client
+from app.api.routes.vocals import _stream_and_cache
 from app.main import app
 from app.providers.elevenlabs_tts import ElevenLabsClient, ElevenLabsTTSError
 
 client = TestClient(app)
 
 
+def _mock_async_client(handler):
+    """Build an httpx.AsyncClient factory that routes requests to handler."""
+    real_async_client = httpx.AsyncClient
+    return lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+
 @pytest.mark.asyncio
 async def test_elevenlabs_client_success():
     """Test successful ElevenLabs TTS generation."""
@@ -20,33 +32,24 @@ async def test_elevenlabs_client_success():
         default_model="eleven_turbo_v2_5",
     )
 
-    # Mock httpx.AsyncClient
-    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"FAKE_AUDIO_BYTES"
-        mock_client.post = AsyncMock(return_value=mock_response)
-
+    def handler(request):
+        # Verify API call
+        assert str(request.url) == "https://api.elevenlabs.io/v1/text-to-speech/test-voice-id"
+        assert request.headers["xi-api-key"] == "test-api-key"
+        body = json.loads(request.content)
+        assert body["model_id"] == "eleven_turbo_v2_5"
+        assert body["text"] == "Hello world"
+        return httpx.Response(200, content=b"FAKE_AUDIO_BYTES")
+
+    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient", _mock_async_client(handler)):
         # Call generate_speech
         audio_bytes = await tts_client.generate_speech(
             text="Hello world",
             voice_id="test-voice-id",
         )
 
-        # Verify result
-        assert audio_bytes == b"FAKE_AUDIO_BYTES"
-
-        # Verify API call
-        mock_client.post.assert_called_once()
-        call_args = mock_client.post.call_args
-        assert call_args[0][0] == "https://api.elevenlabs.io/v1/text-to-speech/test-voice-id"
-        assert call_args[1]["headers"]["xi-api-key"] == "test-api-key"
-        assert call_args[1]["json"]["model_id"] == "eleven_turbo_v2_5"
-        assert call_args[1]["json"]["text"] == "Hello world"
+    # Verify result
+    assert audio_bytes == b"FAKE_AUDIO_BYTES"
 
 
 @pytest.mark.asyncio
@@ -58,25 +61,18 @@ async def test_elevenlabs_client_custom_model():
         default_model="eleven_turbo_v2_5",
     )
 
-    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b"AUDIO"
-        mock_client.post = AsyncMock(return_value=mock_response)
+    def handler(request):
+        # Verify custom model was used
+        assert json.loads(request.content)["model_id"] == "eleven_multilingual_v2"
+        return httpx.Response(200, content=b"AUDIO")
 
+    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient", _mock_async_client(handler)):
         await tts_client.generate_speech(
             text="Test",
             voice_id="voice-123",
             model_id="eleven_multilingual_v2",
         )
 
-        # Verify custom model was used
-        call_args = mock_client.post.call_args
-        assert call_args[1]["json"]["model_id"] == "eleven_multilingual_v2"
-
 
 @pytest.mark.asyncio
 async def test_elevenlabs_client_empty_text():
@@ -119,16 +115,10 @@ async def test_elevenlabs_client_http_error():
         default_model="eleven_turbo_v2_5",
     )
 
-    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        # Mock error response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized: Invalid API key"
-        mock_client.post = AsyncMock(return_value=mock_response)
+    def handler(request):
+        return httpx.Response(401, content=b"Unauthorized: Invalid API key")
 
+    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient", _mock_async_client(handler)):
         with pytest.raises(ElevenLabsTTSError, match="status 401"):
             await tts_client.generate_speech(
                 text="Hello",
@@ -136,104 +126,267 @@ async def test_elevenlabs_client_http_error():
             )
 
 
-def test_vocal_preview_endpoint_missing_api_key():
-    """Test vocal preview endpoint returns 500 when API key not configured."""
-    with patch("app.api.routes.vocals.settings") as mock_settings:
-        mock_settings.ELEVENLABS_API_KEY = None
+def test_elevenlabs_client_stream_speech():
+    """Test streaming TTS yields the audio in chunks from the stream endpoint."""
+    tts_client = ElevenLabsClient(api_key="test-api-key")
 
-        response = client.post(
-            "/api/vocals/preview",
-            json={
-                "text": "Hello world",
-                "voice_id": "test-voice",
-            },
-        )
+    def handler(request):
+        assert request.url.path == "/v1/text-to-speech/test-voice-id/stream"
+        assert request.headers["xi-api-key"] == "test-api-key"
+        return httpx.Response(200, content=b"A" * 20000)
 
-        assert response.status_code == 500
-        assert "API key not configured" in response.json()["detail"]
+    async def collect():
+        return [
+            chunk async for chunk in tts_client.stream_speech(
+                text="Hello world", voice_id="test-voice-id", chunk_size=8192
+            )
+        ]
 
+    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient", _mock_async_client(handler)):
+        chunks = asyncio.run(collect())
 
-def test_vocal_preview_endpoint_success():
-    """Test successful vocal preview generation."""
-    with patch("app.api.routes.vocals.settings") as mock_settings:
+    assert b"".join(chunks) == b"A" * 20000
+    assert len(chunks) == 3
+
+
+def test_elevenlabs_client_stream_speech_error():
+    """Test streaming TTS raises before yielding when the API rejects the request."""
+    tts_client = ElevenLabsClient(api_key="bad-key")
+
+    def handler(request):
+        return httpx.Response(401, content=b"Unauthorized: Invalid API key")
+
+    async def first_chunk():
+        return await tts_client.stream_speech(text="Hello", voice_id="voice-123").__anext__()
+
+    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient", _mock_async_client(handler)):
+        with pytest.raises(ElevenLabsTTSError, match="401"):
+            asyncio.run(first_chunk())
+
+
+def test_elevenlabs_client_retries_transient_errors():
+    """Test TTS requests are retried after a transient upstream failure."""
+    tts_client = ElevenLabsClient(api_key="test-api-key")
+    statuses = [503, 200]
+
+    def handler(request):
+        status = statuses.pop(0)
+        return httpx.Response(status, content=b"AUDIO" if status == 200 else b"busy")
+
+    async def collect():
+        return [chunk async for chunk in tts_client.stream_speech(text="Hello", voice_id="voice-123")]
+
+    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient", _mock_async_client(handler)), \
+            patch("app.providers.http_clients.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        chunks = asyncio.run(collect())
+
+    assert b"".join(chunks) == b"AUDIO"
+    assert statuses == []
+    mock_sleep.assert_awaited_once()
+
+
+def test_elevenlabs_client_does_not_resend_possibly_processed_requests():
+    """Test TTS POSTs are only retried when they never reached the server."""
+    tts_client = ElevenLabsClient(api_key="test-api-key")
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async def collect():
+        return [chunk async for chunk in tts_client.stream_speech(text="Hello", voice_id="voice-123")]
+
+    with patch("app.providers.elevenlabs_tts.httpx.AsyncClient", _mock_async_client(handler)), \
+            patch("app.providers.http_clients.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        with pytest.raises(ElevenLabsTTSError):
+            asyncio.run(collect())
+
+    # The refused connection was retried, the timed-out request was not
+    assert len(attempts) == 2
+    mock_sleep.assert_awaited_once()
+
+
+def test_get_elevenlabs_client_is_shared():
+    """Test one ElevenLabs client is built at startup and closed on shutdown."""
+    request = Mock()
+
+    with patch("app.core.dependencies.settings") as mock_settings:
         mock_settings.ELEVENLABS_API_KEY = "test-key"
         mock_settings.ELEVENLABS_BASE_URL = "https://api.elevenlabs.io"
         mock_settings.ELEVENLABS_DEFAULT_MODEL = "eleven_turbo_v2_5"
 
-        # Mock the ElevenLabs client
-        with patch("app.api.routes.vocals.ElevenLabsClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
+        try:
+            with patch.object(ElevenLabsClient, "aclose", new=AsyncMock()) as mock_aclose, \
+                    TestClient(app):
+                request.app.state = app.state
+                first = asyncio.run(get_elevenlabs_client(request))
+                second = asyncio.run(get_elevenlabs_client(request))
+        finally:
+            app.state.elevenlabs_client = None
+
+    assert isinstance(first, ElevenLabsClient)
+    assert first is second
+    assert first.api_key == "test-key"
+    mock_aclose.assert_awaited_once()
 
-            # Mock async method
-            async def mock_generate(*args, **kwargs):
-                return b"FAKE_AUDIO_DATA"
 
-            mock_client.generate_speech = mock_generate
+def test_vocal_preview_endpoint_missing_api_key():
+    """Test vocal preview endpoint returns 500 when API key not configured."""
+    with patch("app.core.dependencies.settings") as mock_settings:
+        mock_settings.ELEVENLABS_API_KEY = None
 
-            response = client.post(
+        # Run the lifespan, where the client would be built
+        with TestClient(app) as lifespan_client:
+            response = lifespan_client.post(
                 "/api/vocals/preview",
                 json={
-                    "text": "Hello world, this is a test",
-                    "voice_id": "test-voice-id",
+                    "text": "Hello world",
+                    "voice_id": "test-voice",
                 },
             )
 
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "audio/mpeg"
-            assert response.content == b"FAKE_AUDIO_DATA"
+        assert response.status_code == 500
+        assert "API key not configured" in response.json()["detail"]
 
 
-def test_vocal_preview_endpoint_validation():
-    """Test vocal preview endpoint validates input."""
-    with patch("app.api.routes.vocals.settings") as mock_settings:
-        mock_settings.ELEVENLABS_API_KEY = "test-key"
+def test_vocal_preview_endpoint_success():
+    """Test successful vocal preview generation."""
+    # Mock the shared ElevenLabs client
+    mock_client = Mock()
 
-        # Empty text
-        response = client.post(
-            "/api/vocals/preview",
-            json={
-                "text": "",
-                "voice_id": "voice-123",
-            },
-        )
-        assert response.status_code == 422  # Validation error
+    # Mock streaming method
+    async def mock_stream(*args, **kwargs):
+        yield b"FAKE_AUDIO"
+        yield b"_DATA"
 
-        # Missing voice_id
+    mock_client.stream_speech = mock_stream
+
+    app.dependency_overrides[get_elevenlabs_client] = lambda: mock_client
+    try:
         response = client.post(
             "/api/vocals/preview",
             json={
-                "text": "Hello",
+                "text": "Hello world, this is a test",
+                "voice_id": "test-voice-id",
             },
         )
-        assert response.status_code == 422  # Validation error
+    finally:
+        app.dependency_overrides.pop(get_elevenlabs_client)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.content == b"FAKE_AUDIO_DATA"
+
+
+def test_vocal_preview_endpoint_caches_audio():
+    """Test that generated previews are cached and repeats skip ElevenLabs."""
+    mock_client = Mock()
+
+    async def mock_stream(*args, **kwargs):
+        yield b"FAKE_AUDIO"
+        yield b"_DATA"
+
+    mock_client.stream_speech = Mock(side_effect=mock_stream)
+    fake_redis = Mock()
+    fake_redis.get = AsyncMock(return_value=None)
+    fake_redis.set = AsyncMock()
+    payload = {"text": "Hello again", "voice_id": "test-voice-id", "model_id": "test-model"}
+
+    app.dependency_overrides[get_elevenlabs_client] = lambda: mock_client
+    try:
+        with patch("app.services.vocal_preview_cache.get_async_redis", return_value=fake_redis):
+            response = client.post("/api/vocals/preview", json=payload)
+            assert response.content == b"FAKE_AUDIO_DATA"
+
+            key = fake_redis.set.call_args.args[0]
+            assert key.startswith("tts:")
+            assert fake_redis.set.call_args.args[1] == b"FAKE_AUDIO_DATA"
+
+            fake_redis.get.return_value = b"FAKE_AUDIO_DATA"
+            cached_response = client.post("/api/vocals/preview", json=payload)
+    finally:
+        app.dependency_overrides.pop(get_elevenlabs_client)
+
+    assert cached_response.status_code == 200
+    assert cached_response.headers["content-type"] == "audio/mpeg"
+    assert cached_response.content == b"FAKE_AUDIO_DATA"
+    fake_redis.get.assert_called_with(key)
+    assert mock_client.stream_speech.call_count == 1
+    assert mock_client.stream_speech.call_args.kwargs["model_id"] == "test-model"
+
+
+def test_vocal_preview_stream_closes_upstream_on_disconnect():
+    """Test an abandoned preview stream closes the ElevenLabs stream and skips caching."""
+    closed = []
+
+    async def upstream():
+        try:
+            yield b"_DATA"
+            yield b"_MORE"
+        finally:
+            closed.append(True)
+
+    async def disconnect_after_first_chunk():
+        stream = _stream_and_cache(b"FAKE_AUDIO", upstream(), "tts:test")
+        assert await stream.__anext__() == b"FAKE_AUDIO"
+        assert await stream.__anext__() == b"_DATA"
+        await stream.aclose()
+        # Closed with the response stream, not left to garbage collection
+        assert closed == [True]
+
+    with patch("app.api.routes.vocals.vocal_preview_cache.cache_preview_audio", new=AsyncMock()) as mock_cache:
+        asyncio.run(disconnect_after_first_chunk())
+
+    mock_cache.assert_not_awaited()
+
+
+def test_vocal_preview_endpoint_validation():
+    """Test vocal preview endpoint validates input."""
+    # Empty text
+    response = client.post(
+        "/api/vocals/preview",
+        json={
+            "text": "",
+            "voice_id": "voice-123",
+        },
+    )
+    assert response.status_code == 422  # Validation error
+
+    # Missing voice_id
+    response = client.post(
+        "/api/vocals/preview",
+        json={
+            "text": "Hello",
+        },
+    )
+    assert response.status_code == 422  # Validation error
 
 
 def test_vocal_preview_endpoint_tts_error():
     """Test vocal preview endpoint handles TTS errors gracefully."""
-    with patch("app.api.routes.vocals.settings") as mock_settings:
-        mock_settings.ELEVENLABS_API_KEY = "test-key"
-        mock_settings.ELEVENLABS_BASE_URL = "https://api.elevenlabs.io"
-        mock_settings.ELEVENLABS_DEFAULT_MODEL = "eleven_turbo_v2_5"
-
-        with patch("app.api.routes.vocals.ElevenLabsClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
+    mock_client = Mock()
 
-            # Mock async method that raises error
-            async def mock_generate(*args, **kwargs):
-                from app.providers.elevenlabs_tts import ElevenLabsTTSError
-                raise ElevenLabsTTSError("API quota exceeded")
+    # Mock streaming method that raises error before the first chunk
+    async def mock_stream(*args, **kwargs):
+        raise ElevenLabsTTSError("API quota exceeded")
+        yield b""
 
-            mock_client.generate_speech = mock_generate
+    mock_client.stream_speech = mock_stream
 
-            response = client.post(
-                "/api/vocals/preview",
-                json={
-                    "text": "Test text",
-                    "voice_id": "voice-123",
-                },
-            )
+    app.dependency_overrides[get_elevenlabs_client] = lambda: mock_client
+    try:
+        response = client.post(
+            "/api/vocals/preview",
+            json={
+                "text": "Test text",
+                "voice_id": "voice-123",
+            },
+        )
+    finally:
+        app.dependency_overrides.pop(get_elevenlabs_client)
 
-            assert response.status_code == 502
-            assert "Failed to generate vocals" in response.json()["detail"]
+    assert response.status_code == 502
+    assert "Failed to generate vocals" in response.json()["detail"]
@@ -3,8 +3,8 @@ Tests for song blueprint engine factory and dependency injection
 """
 import pytest
 from unittest.mock import patch, MagicMock
-from app.core.config import Settings
-from app.core.dependencies import get_song_blueprint_engine
+from app.core.config import Settings, get_settings, settings as module_settings
+from app.core.dependencies import get_async_redis, get_redis, get_song_blueprint_engine
 from app.services.song_blueprint_service import (
     FakeSongBlueprintEngine,
     LLMSongBlueprintEngine,
@@ -106,6 +106,20 @@ def test_settings_validation():
     assert settings_llm.LLM_MODEL_NAME == "gpt-4"
 
 
+def test_get_settings_returns_shared_instance():
+    """Test that settings are parsed once and shared."""
+    assert get_settings() is get_settings()
+    assert get_settings() is module_settings
+
+
+def test_redis_clients_bound_their_waits():
+    """Test that the shared Redis clients give up quickly so caches fall back to the DB."""
+    for pool in (get_redis().connection_pool, get_async_redis().connection_pool):
+        assert pool.connection_kwargs["socket_connect_timeout"] == module_settings.REDIS_CONNECT_TIMEOUT
+        assert pool.connection_kwargs["socket_timeout"] == module_settings.REDIS_SOCKET_TIMEOUT
+    assert get_redis().connection_pool.timeout == module_settings.REDIS_POOL_TIMEOUT
+
+
 def test_settings_with_env_prefix():
     """Test that settings use QUILLMUSIC_ prefix correctly."""
     import os
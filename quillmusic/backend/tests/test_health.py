@@ -34,3 +34,42 @@ def test_root_endpoint(client):
         assert "text/html" in content_type or content_type == ""
         # Just verify we got some content
         assert len(response.content) > 0
+
+
+def test_health_check_etag_not_modified(client):
+    """Test that a matching If-None-Match returns 304 with no body."""
+    response = client.get("/api/health")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=30, stale-while-revalidate=300"
+
+    cached_response = client.get("/api/health", headers={"If-None-Match": etag})
+    assert cached_response.status_code == 304
+    assert cached_response.content == b""
+    assert cached_response.headers["etag"] == etag
+
+
+def test_config_etag_not_modified(client):
+    """Test that /config honours If-None-Match and ignores stale tags."""
+    response = client.get("/api/config/")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    cached_response = client.get("/api/config/", headers={"If-None-Match": etag})
+    assert cached_response.status_code == 304
+    assert cached_response.content == b""
+
+    stale_response = client.get("/api/config/", headers={"If-None-Match": '"stale"'})
+    assert stale_response.status_code == 200
+    assert stale_response.json() == response.json()
+
+
+def test_cors_preflight(client):
+    """Test that CORS allows Replit preview domains and the API's methods."""
+    headers = {"Origin": "https://quill.replit.dev", "Access-Control-Request-Method": "PATCH"}
+    response = client.options("/api/health", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://quill.replit.dev"
+
+    headers["Origin"] = "https://quill.replit.dev.example.com"
+    response = client.options("/api/health", headers=headers)
+    assert response.status_code == 400
@@ -6,6 +6,8 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.schemas.song import SectionSchema, SongBlueprintResponse, VocalStyleSchema
+from app.services.hitmaker_engine import HitMakerEngine
 
 
 client = TestClient(app)
@@ -173,3 +175,31 @@ def test_hitscore_ranges_valid():
         # All scores should be 0-100
         for key, value in score.items():
             assert 0 <= value <= 100, f"{key} score {value} out of range for {genre}"
+
+
+def test_blueprint_lyrics_drive_mood_and_lyrics_score():
+    """Test mood and lyrics emotion are read from the blueprint's lyrics."""
+    blueprint = SongBlueprintResponse(
+        song_id="song_lyrics_test",
+        title="Fading Lights",
+        genre="pop",
+        mood="energetic",
+        bpm=110,
+        key="Am",
+        sections=[
+            SectionSchema(id="verse_1", type="verse", name="Verse 1", bars=8, mood="moody", description="Sparse verse"),
+            SectionSchema(id="chorus_1", type="chorus", name="Chorus", bars=8, mood="big", description="Full chorus"),
+        ],
+        lyrics={
+            "verse_1": "I walk alone in the dark",
+            "chorus_1": "Broken hearts fade away tonight",
+        },
+        vocal_style=VocalStyleSchema(gender="female", tone="airy", energy="medium"),
+    )
+
+    analysis = HitMakerEngine().analyze_blueprint(blueprint)
+
+    # "alone", "dark", "broken" and "fade" outweigh no positive words
+    assert analysis.dna.dominant_mood == "melancholic"
+    # 60 + 0.5 per lyric word (11 words)
+    assert analysis.score.lyrics_emotion == 65.5
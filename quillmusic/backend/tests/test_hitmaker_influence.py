@@ -131,8 +131,25 @@ def test_influence_weight_validation():
         },
     )
 
-    assert response.status_code == 400
-    assert "weight" in response.json()["detail"].lower()
+    # Rejected by request validation, before any database lookup
+    assert response.status_code == 422
+    assert "weight" in str(response.json()["detail"]).lower()
+
+
+def test_influence_weight_validation_unknown_source():
+    """Test that weight validation runs even when the source does not exist."""
+    response = client.post(
+        "/api/hitmaker/influence/manual",
+        json={
+            "source_manual_project_id": "nonexistent-project",
+            "influences": [
+                {"name": "Artist A", "weight": 0.8},
+                {"name": "Artist B", "weight": 0.6},
+            ],
+        },
+    )
+
+    assert response.status_code == 422
 
 
 def test_influence_blueprint_not_found():
@@ -171,3 +188,64 @@ def test_influence_missing_source_id():
     )
 
     assert response.status_code == 400
+
+
+def test_unified_endpoint_dispatches_on_kind():
+    """Test the unified /hitmaker/analyze endpoint for analysis and influence requests."""
+    blueprint_response = client.post(
+        "/api/song/blueprint",
+        json={
+            "prompt": "Moody synthwave track",
+            "genre": "electronic",
+            "mood": "dark",
+            "duration_seconds": 180,
+        },
+    )
+    assert blueprint_response.status_code == 200
+    blueprint_id = blueprint_response.json()["song_id"]
+
+    # Analysis
+    response = client.post(
+        "/api/hitmaker/analyze",
+        json={"kind": "analyze_blueprint", "blueprint_id": blueprint_id},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["dna"]["blueprint_id"] == blueprint_id
+    assert "score" in data
+
+    # Influence
+    response = client.post(
+        "/api/hitmaker/analyze",
+        json={
+            "kind": "influence_blueprint",
+            "source_blueprint_id": blueprint_id,
+            "influences": [{"name": "The Weeknd", "weight": 0.7}],
+            "target_mood": "dark",
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["adjusted_dna"]["dominant_mood"] == "dark"
+    assert len(data["hook_suggestions"]) > 0
+
+
+def test_unified_endpoint_validation():
+    """Test that the unified endpoint rejects unknown kinds and missing sources."""
+    response = client.post(
+        "/api/hitmaker/analyze",
+        json={"kind": "remix", "blueprint_id": "abc"},
+    )
+    assert response.status_code == 422
+
+    response = client.post(
+        "/api/hitmaker/analyze",
+        json={"kind": "influence_manual", "influences": [{"name": "Someone", "weight": 0.5}]},
+    )
+    assert response.status_code == 422
+
+    response = client.post(
+        "/api/hitmaker/analyze",
+        json={"kind": "analyze_manual", "manual_project_id": "nonexistent"},
+    )
+    assert response.status_code == 404
@@ -3,6 +3,7 @@ Tests for HitMaker analysis of Manual Creator projects.
 """
 
 import pytest
+from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -128,6 +129,58 @@ def test_analyze_empty_manual_project():
     assert score["overall"] < 70  # Empty projects should score lower
 
 
+def test_analyze_manual_project_cached_until_edited():
+    """Test analyses are served from cache until the project is edited."""
+    store = {}
+    fake_redis = Mock()
+    fake_redis.get = Mock(side_effect=store.get)
+    fake_redis.set = Mock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value))
+
+    project_id = client.post(
+        "/api/manual/projects",
+        json={"name": "Cached Song", "tempo_bpm": 120, "time_signature": "4/4"},
+    ).json()["id"]
+
+    def analyze():
+        response = client.post(
+            "/api/hitmaker/analyze/manual",
+            params={"manual_project_id": project_id},
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    with patch("app.services.hitmaker_cache.get_redis", return_value=fake_redis):
+        first = analyze()
+        assert analyze() == first
+        # Only the first request computed and stored an analysis
+        assert fake_redis.set.call_count == 1
+
+        # Adding a track bumps the project's updated_at, so the next analysis is fresh
+        client.post(
+            f"/api/manual/projects/{project_id}/tracks",
+            json={"name": "Drums", "instrument_type": "drums", "channel_index": 0},
+        )
+        analyze()
+        assert fake_redis.set.call_count == 2
+        assert len(store) == 2
+
+        # Influences start from the cached analysis of the unchanged project,
+        # without loading its tracks, patterns and notes
+        with patch("app.api.routes.hitmaker._load_manual_project") as mock_load:
+            response = client.post(
+                "/api/hitmaker/influence/manual",
+                json={
+                    "source_manual_project_id": project_id,
+                    "influences": [{"name": "Drake", "weight": 0.8}],
+                    "target_mood": "introspective",
+                },
+            )
+        assert response.status_code == 200
+        assert response.json()["adjusted_dna"]["dominant_mood"] == "introspective"
+        assert fake_redis.set.call_count == 2
+        mock_load.assert_not_called()
+
+
 def test_analyze_manual_not_found():
     """Test analyzing non-existent project."""
     response = client.post(
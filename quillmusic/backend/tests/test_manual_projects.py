@@ -1,9 +1,15 @@
 """
 Tests for Manual Creator API endpoints
 """
+import base64
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.core.database import SessionLocal
+from app.models.manual import NoteModel
+from app.schemas.manual import NOTE_RECORD, NOTE_STEP_MAX
 
 client = TestClient(app)
 
@@ -111,11 +117,17 @@ def test_update_track():
         },
     )
     assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
     data = response.json()
     assert data["volume"] == 0.6
     assert data["pan"] == -0.5
     assert data["muted"] is True
 
+    # Fields not sent by the client are left untouched
+    assert data["name"] == "Bass"
+    assert data["channel_index"] == 1
+    assert data["solo"] is False
+
 
 def test_create_pattern():
     """Test creating a pattern for a track."""
@@ -225,6 +237,14 @@ def test_bulk_replace_notes():
     assert data[1]["pitch"] == 64
     assert data[2]["pitch"] == 67
 
+    # Invalid notes are rejected like any other request body
+    response = client.post(
+        f"/api/manual/patterns/{pattern_id}/notes/bulk",
+        json=[{"pattern_id": pattern_id, "step_index": 0, "pitch": 128, "velocity": 100}],
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 0, "pitch"]
+
 
 def test_get_pattern_notes():
     """Test retrieving notes for a pattern."""
@@ -262,6 +282,16 @@ def test_get_pattern_notes():
     assert data[0]["pitch"] == 36
     assert data[1]["pitch"] == 38
 
+    # Get notes as NDJSON stream
+    response = client.get(
+        f"/api/manual/patterns/{pattern_id}/notes",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["pitch"] for line in lines] == [36, 38]
+
 
 def test_get_project_detail():
     """Test getting complete project detail with all related data."""
@@ -347,6 +377,150 @@ def test_get_project_detail():
     assert len(data["notes"]) == 3
 
 
+def test_get_project_detail_columnar_notes():
+    """Test project detail can return notes as parallel columns."""
+    project_id = client.post(
+        "/api/manual/projects",
+        json={"name": "Columnar Test", "tempo_bpm": 120},
+    ).json()["id"]
+    track_id = client.post(
+        f"/api/manual/projects/{project_id}/tracks",
+        json={"name": "Lead", "instrument_type": "lead", "channel_index": 0},
+    ).json()["id"]
+    pattern_id = client.post(
+        f"/api/manual/tracks/{track_id}/patterns",
+        json={"name": "Riff", "length_bars": 1, "start_bar": 0},
+    ).json()["id"]
+    client.post(
+        f"/api/manual/patterns/{pattern_id}/notes/bulk",
+        json=[
+            {"pattern_id": pattern_id, "step_index": 4, "pitch": 64, "velocity": 80},
+            {"pattern_id": pattern_id, "step_index": 0, "pitch": 60, "velocity": 100},
+        ],
+    )
+
+    response = client.get(
+        f"/api/manual/projects/{project_id}",
+        params={"notes_layout": "columnar"},
+    )
+    assert response.status_code == 200
+    notes = response.json()["notes"]
+
+    assert notes["pattern_id"] == [pattern_id, pattern_id]
+    assert notes["step_index"] == [0, 4]
+    assert notes["pitch"] == [60, 64]
+    assert notes["velocity"] == [100, 80]
+    assert len(notes["id"]) == 2
+
+
+def test_get_project_detail_packed_notes():
+    """Test project detail can return notes packed into binary records."""
+    project_id = client.post(
+        "/api/manual/projects",
+        json={"name": "Packed Test", "tempo_bpm": 120},
+    ).json()["id"]
+    track_id = client.post(
+        f"/api/manual/projects/{project_id}/tracks",
+        json={"name": "Bass", "instrument_type": "bass", "channel_index": 0},
+    ).json()["id"]
+    pattern_id = client.post(
+        f"/api/manual/tracks/{track_id}/patterns",
+        json={"name": "Line", "length_bars": 64, "start_bar": 0},
+    ).json()["id"]
+    client.post(
+        f"/api/manual/patterns/{pattern_id}/notes/bulk",
+        json=[
+            {"pattern_id": pattern_id, "step_index": 1000, "pitch": 127, "velocity": 1},
+            {"pattern_id": pattern_id, "step_index": 0, "pitch": 40, "velocity": 110},
+        ],
+    )
+
+    response = client.get(
+        f"/api/manual/projects/{project_id}",
+        params={"notes_layout": "packed"},
+    )
+    assert response.status_code == 200
+    notes = response.json()["notes"]
+
+    records = list(NOTE_RECORD.iter_unpack(base64.b64decode(notes["records"])))
+    assert records == [(0, 40, 110), (1000, 127, 1)]
+    assert notes["pattern_id"] == [pattern_id, pattern_id]
+    assert len(notes["id"]) == 2
+
+
+def test_get_project_detail_packed_large_step_index():
+    """Test notes stored beyond 16-bit steps still pack, and larger steps are rejected."""
+    project_id = client.post(
+        "/api/manual/projects",
+        json={"name": "Long Packed Test", "tempo_bpm": 120},
+    ).json()["id"]
+    track_id = client.post(
+        f"/api/manual/projects/{project_id}/tracks",
+        json={"name": "Pad", "instrument_type": "chords", "channel_index": 0},
+    ).json()["id"]
+    pattern_id = client.post(
+        f"/api/manual/tracks/{track_id}/patterns",
+        json={"name": "Drone", "length_bars": 4, "start_bar": 0},
+    ).json()["id"]
+
+    # A note written before step_index was bounded
+    db = SessionLocal()
+    try:
+        db.add(NoteModel(pattern_id=pattern_id, step_index=70000, pitch=60, velocity=90))
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(
+        f"/api/manual/projects/{project_id}",
+        params={"notes_layout": "packed"},
+    )
+    assert response.status_code == 200
+    records = list(NOTE_RECORD.iter_unpack(base64.b64decode(response.json()["notes"]["records"])))
+    assert records == [(70000, 60, 90)]
+
+    response = client.post(
+        f"/api/manual/patterns/{pattern_id}/notes/bulk",
+        json=[{"pattern_id": pattern_id, "step_index": NOTE_STEP_MAX + 1, "pitch": 60, "velocity": 90}],
+    )
+    assert response.status_code == 422
+
+
+def test_get_project_detail_streamed():
+    """Test streamed project detail matches the regular response."""
+    project_id = client.post(
+        "/api/manual/projects",
+        json={"name": "Stream Test", "tempo_bpm": 120},
+    ).json()["id"]
+    for channel_index, name in [(1, "Bass"), (0, "Drums")]:
+        track_id = client.post(
+            f"/api/manual/projects/{project_id}/tracks",
+            json={"name": name, "instrument_type": "drums", "channel_index": channel_index},
+        ).json()["id"]
+        pattern_id = client.post(
+            f"/api/manual/tracks/{track_id}/patterns",
+            json={"name": "Beat", "length_bars": 1, "start_bar": 0},
+        ).json()["id"]
+        client.post(
+            f"/api/manual/patterns/{pattern_id}/notes/bulk",
+            json=[
+                {"pattern_id": pattern_id, "step_index": 8, "pitch": 38, "velocity": 90},
+                {"pattern_id": pattern_id, "step_index": 0, "pitch": 36, "velocity": 100},
+            ],
+        )
+
+    streamed = client.get(f"/api/manual/projects/{project_id}", params={"stream": True})
+    assert streamed.status_code == 200
+    assert streamed.json() == client.get(f"/api/manual/projects/{project_id}").json()
+    assert len(streamed.json()["notes"]) == 4
+
+    response = client.get(
+        f"/api/manual/projects/{project_id}",
+        params={"stream": True, "notes_layout": "packed"},
+    )
+    assert response.status_code == 400
+
+
 def test_delete_project():
     """Test deleting a project cascades to all related data."""
     # Create project with tracks, patterns, and notes
@@ -376,6 +550,10 @@ def test_delete_project():
     get_response = client.get(f"/api/manual/projects/{project_id}")
     assert get_response.status_code == 404
 
+    # Verify the cascade removed its patterns too
+    get_pattern_response = client.get(f"/api/manual/patterns/{pattern_id}/notes")
+    assert get_pattern_response.status_code == 404
+
 
 def test_delete_track():
     """Test deleting a track cascades to patterns and notes."""
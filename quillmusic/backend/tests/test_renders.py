@@ -31,8 +31,8 @@ def test_create_render_job(client):
     assert data["audio_url"] is not None
     assert ".mp3" in data["audio_url"]
 
-    # Should not have error
-    assert data["error"] is None
+    # Should not have error; unset fields are omitted
+    assert "error" not in data
 
 
 def test_get_render_status(client):
@@ -1,10 +1,16 @@
 """
 Tests for Replicate MusicGen integration
 """
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import pytest
 from unittest.mock import patch, Mock, AsyncMock
 from fastapi.testclient import TestClient
 from app.main import app
+from app.providers.http_clients import aclose_http_clients, run_sync
 from app.providers.replicate_musicgen import ReplicateMusicGenClient, ReplicateMusicGenError
 from app.core.config import Settings, InstrumentalEngineConfig
 
@@ -25,32 +31,32 @@ async def test_replicate_musicgen_success():
     # Mock httpx.AsyncClient
     with patch("app.providers.replicate_musicgen.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         # Mock prediction creation response
         mock_create_response = Mock()
         mock_create_response.status_code = 201
-        mock_create_response.json.return_value = {
+        mock_create_response.content = orjson.dumps({
             "id": "pred_abc123",
             "status": "starting",
-        }
+        })
 
         # Mock first poll: still processing
         mock_poll_response_1 = Mock()
         mock_poll_response_1.status_code = 200
-        mock_poll_response_1.json.return_value = {
+        mock_poll_response_1.content = orjson.dumps({
             "id": "pred_abc123",
             "status": "processing",
-        }
+        })
 
         # Mock second poll: succeeded
         mock_poll_response_2 = Mock()
         mock_poll_response_2.status_code = 200
-        mock_poll_response_2.json.return_value = {
+        mock_poll_response_2.content = orjson.dumps({
             "id": "pred_abc123",
             "status": "succeeded",
             "output": "https://replicate.delivery/test-music.wav",
-        }
+        })
 
         # Set up mock responses in sequence
         mock_client.post = AsyncMock(return_value=mock_create_response)
@@ -71,9 +77,10 @@ async def test_replicate_musicgen_success():
         create_call_args = mock_client.post.call_args
         assert create_call_args[0][0] == "https://api.replicate.com/v1/predictions"
         assert create_call_args[1]["headers"]["Authorization"] == "Token r8_test_token"
-        assert create_call_args[1]["json"]["version"] == "test-version-123"
-        assert create_call_args[1]["json"]["input"]["prompt"] == "upbeat electronic dance music"
-        assert create_call_args[1]["json"]["input"]["duration"] == 30
+        body = json.loads(create_call_args[1]["content"])
+        assert body["version"] == "test-version-123"
+        assert body["input"]["prompt"] == "upbeat electronic dance music"
+        assert body["input"]["duration"] == 30
 
         # Verify polling occurred (2 GET calls)
         assert mock_client.get.call_count == 2
@@ -91,23 +98,23 @@ async def test_replicate_musicgen_output_list():
 
     with patch("app.providers.replicate_musicgen.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         mock_create_response = Mock()
         mock_create_response.status_code = 201
-        mock_create_response.json.return_value = {
+        mock_create_response.content = orjson.dumps({
             "id": "pred_xyz789",
             "status": "starting",
-        }
+        })
 
         # Mock poll response with output as list
         mock_poll_response = Mock()
         mock_poll_response.status_code = 200
-        mock_poll_response.json.return_value = {
+        mock_poll_response.content = orjson.dumps({
             "id": "pred_xyz789",
             "status": "succeeded",
             "output": ["https://replicate.delivery/music-track.mp3"],  # List format
-        }
+        })
 
         mock_client.post = AsyncMock(return_value=mock_create_response)
         mock_client.get = AsyncMock(return_value=mock_poll_response)
@@ -156,23 +163,23 @@ async def test_replicate_musicgen_prediction_failed():
 
     with patch("app.providers.replicate_musicgen.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         mock_create_response = Mock()
         mock_create_response.status_code = 201
-        mock_create_response.json.return_value = {
+        mock_create_response.content = orjson.dumps({
             "id": "pred_fail",
             "status": "starting",
-        }
+        })
 
         # Mock poll response with failed status
         mock_poll_response = Mock()
         mock_poll_response.status_code = 200
-        mock_poll_response.json.return_value = {
+        mock_poll_response.content = orjson.dumps({
             "id": "pred_fail",
             "status": "failed",
             "error": "Model inference failed: out of memory",
-        }
+        })
 
         mock_client.post = AsyncMock(return_value=mock_create_response)
         mock_client.get = AsyncMock(return_value=mock_poll_response)
@@ -196,22 +203,22 @@ async def test_replicate_musicgen_timeout():
 
     with patch("app.providers.replicate_musicgen.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         mock_create_response = Mock()
         mock_create_response.status_code = 201
-        mock_create_response.json.return_value = {
+        mock_create_response.content = orjson.dumps({
             "id": "pred_timeout",
             "status": "starting",
-        }
+        })
 
         # Mock poll response that stays in processing state
         mock_poll_response = Mock()
         mock_poll_response.status_code = 200
-        mock_poll_response.json.return_value = {
+        mock_poll_response.content = orjson.dumps({
             "id": "pred_timeout",
             "status": "processing",
-        }
+        })
 
         mock_client.post = AsyncMock(return_value=mock_create_response)
         mock_client.get = AsyncMock(return_value=mock_poll_response)
@@ -224,6 +231,95 @@ async def test_replicate_musicgen_timeout():
             )
 
 
+def test_replicate_musicgen_poll_backoff():
+    """Test polling backs off geometrically and honours Retry-After."""
+    settings = Settings(
+        REPLICATE_API_TOKEN="r8_test_token",
+        REPLICATE_MUSICGEN_VERSION="test-version-123",
+    )
+
+    replicate_client = ReplicateMusicGenClient(settings=settings)
+
+    def poll_response(status, retry_after=None):
+        response = Mock()
+        response.status_code = 200
+        response.headers = {"Retry-After": retry_after} if retry_after else {}
+        response.content = orjson.dumps({"id": "pred_backoff", "status": status, "output": "https://x/a.wav"})
+        return response
+
+    with patch("app.providers.replicate_musicgen.httpx.AsyncClient") as mock_client_class, \
+            patch("app.providers.replicate_musicgen.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        mock_create_response = Mock()
+        mock_create_response.status_code = 201
+        mock_create_response.content = orjson.dumps({"id": "pred_backoff", "status": "starting"})
+        mock_client.post = AsyncMock(return_value=mock_create_response)
+        mock_client.get = AsyncMock(side_effect=[
+            poll_response("starting"),
+            poll_response("processing"),
+            poll_response("processing", retry_after="3"),
+            poll_response("succeeded"),
+        ])
+
+        audio_url = asyncio.run(replicate_client.generate_audio(prompt="test prompt"))
+
+    assert audio_url == "https://x/a.wav"
+    waits = [call.args[0] for call in mock_sleep.call_args_list]
+    assert waits == pytest.approx([0.5, 0.75, 3.0])
+
+
+def test_replicate_musicgen_concurrent_renders_limited():
+    """Test concurrent sync renders share one prediction-creation limit."""
+    settings = Settings(
+        REPLICATE_API_TOKEN="r8_test_token",
+        REPLICATE_MUSICGEN_VERSION="test-version-123",
+        REPLICATE_MAX_CONCURRENT=1,
+    )
+    replicate_client = ReplicateMusicGenClient(settings=settings)
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create_prediction(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        response = Mock()
+        response.status_code = 201
+        response.content = orjson.dumps({"id": "pred_limit", "status": "starting"})
+        return response
+
+    poll_response = Mock()
+    poll_response.status_code = 200
+    poll_response.content = orjson.dumps({"id": "pred_limit", "status": "succeeded", "output": "https://x/a.wav"})
+
+    # Start from fresh shared clients so the mocked client class is used
+    run_sync(aclose_http_clients())
+    try:
+        with patch("app.providers.replicate_musicgen.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.is_closed = False
+            mock_client.post = AsyncMock(side_effect=create_prediction)
+            mock_client.get = AsyncMock(return_value=poll_response)
+            mock_client_class.return_value = mock_client
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                urls = list(pool.map(
+                    lambda _: run_sync(replicate_client.generate_audio(prompt="test prompt")),
+                    range(2),
+                ))
+    finally:
+        run_sync(aclose_http_clients())
+
+    assert urls == ["https://x/a.wav", "https://x/a.wav"]
+    assert mock_client.post.call_count == 2
+    assert max_in_flight == 1
+
+
 @pytest.mark.asyncio
 async def test_replicate_musicgen_http_error():
     """Test Replicate MusicGen handles HTTP errors."""
@@ -236,7 +332,7 @@ async def test_replicate_musicgen_http_error():
 
     with patch("app.providers.replicate_musicgen.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         # Mock 401 Unauthorized response
         mock_response = Mock()
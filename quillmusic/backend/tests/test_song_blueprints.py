@@ -1,6 +1,10 @@
 """
 Tests for song blueprint generation
 """
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.database import engine
+from app.services import blueprint_cache
 
 
 def test_create_song_blueprint(client):
@@ -112,3 +116,119 @@ def test_create_song_blueprint_different_genres(client):
         data = response.json()
         assert data["genre"] == genre
         assert len(data["sections"]) > 0
+
+
+def test_list_blueprints_gzip(client):
+    """Test that large JSON responses are gzip-compressed when accepted."""
+    for genre in ["Pop", "Rock", "Jazz"]:
+        client.post("/api/song/blueprint", json={"prompt": f"A {genre} song", "genre": genre, "mood": "Happy"})
+
+    response = client.get("/api/song/blueprints", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) >= 3
+
+
+def test_blueprint_stored_compressed(client):
+    """Test that blueprints are stored compressed and read back as JSON."""
+    response = client.post("/api/song/blueprint", json={"prompt": "A stored song", "genre": "Pop", "mood": "Happy"})
+    song_id = response.json()["song_id"]
+
+    with engine.connect() as conn:
+        raw = conn.exec_driver_sql(
+            "SELECT blueprint_json FROM song_blueprints WHERE id = ?", (song_id,)
+        ).scalar()
+    assert isinstance(raw, bytes)
+    assert len(raw) < len(response.text)
+
+    get_response = client.get(f"/api/song/blueprints/{song_id}")
+    assert get_response.status_code == 200
+    assert get_response.json() == response.json()
+
+
+def test_create_blueprint_fails_when_not_stored(client):
+    """Test that a blueprint is only returned once it is committed to the database."""
+    with patch("app.api.routes.song_blueprints._persist_blueprints", side_effect=RuntimeError("disk full")), \
+            patch("app.services.blueprint_cache.store_blueprint_json") as mock_store:
+        response = client.post("/api/song/blueprint", json={"prompt": "An unsaved song", "genre": "Pop", "mood": "Happy"})
+
+    assert response.status_code == 500
+    assert "Failed to store blueprint" in response.json()["detail"]
+    mock_store.assert_not_called()
+
+
+def test_get_blueprint_served_from_cache(client):
+    """Test that a cached blueprint is returned without touching the database."""
+    response = client.post("/api/song/blueprint", json={"prompt": "A cached song", "genre": "Pop", "mood": "Happy"})
+    blueprint_json = response.text
+
+    fake_redis = MagicMock()
+    fake_redis.get = AsyncMock(return_value=blueprint_json)
+    with patch("app.services.blueprint_cache.get_async_redis", return_value=fake_redis):
+        cached_response = client.get("/api/song/blueprints/song_only_in_cache")
+
+    assert cached_response.status_code == 200
+    assert cached_response.json() == response.json()
+    fake_redis.get.assert_called_once_with("bp:song_only_in_cache")
+
+
+def test_list_blueprints_served_from_redis_index(client):
+    """Test that listings follow the Redis recency index."""
+    response = client.post("/api/song/blueprint", json={"prompt": "An indexed song", "genre": "Pop", "mood": "Happy"})
+    blueprint_json = response.text
+
+    fake_redis = MagicMock()
+    fake_redis.zrevrange.return_value = ["song_only_in_redis"]
+    fake_redis.mget.return_value = [blueprint_json]
+    with patch("app.services.blueprint_cache.get_redis", return_value=fake_redis):
+        list_response = client.get("/api/song/blueprints?limit=1")
+
+    assert list_response.status_code == 200
+    assert list_response.json() == [response.json()]
+    fake_redis.zrevrange.assert_called_once_with("bp:index", 0, 0)
+    fake_redis.mget.assert_called_once_with(["bp:song_only_in_redis"])
+
+
+def test_list_blueprints_backfills_partial_index(client):
+    """Test that a partly filled Redis index is completed from the database."""
+    song_ids = [
+        client.post(
+            "/api/song/blueprint", json={"prompt": f"A backfilled song {i}", "genre": "Pop", "mood": "Happy"}
+        ).json()["song_id"]
+        for i in range(3)
+    ]
+
+    fake_redis = MagicMock()
+    # Only the newest blueprint was re-indexed after a Redis flush
+    fake_redis.zrevrange.return_value = [song_ids[-1]]
+    fake_redis.mget.side_effect = lambda keys: [None] * len(keys)
+    with patch("app.services.blueprint_cache.get_redis", return_value=fake_redis):
+        list_response = client.get("/api/song/blueprints?limit=3")
+
+    assert list_response.status_code == 200
+    assert [bp["song_id"] for bp in list_response.json()] == song_ids[::-1]
+    indexed = fake_redis.zadd.call_args.args[1]
+    assert set(song_ids) <= set(indexed)
+
+
+def test_stored_blueprint_expires_and_index_is_trimmed():
+    """Test that new blueprints are cached with a TTL and the index stays bounded."""
+    fake_redis = MagicMock()
+    pipe = fake_redis.pipeline.return_value
+    with patch("app.services.blueprint_cache.get_redis", return_value=fake_redis):
+        blueprint_cache.store_blueprint_json("song_new", '{"song_id": "song_new"}', 1700000000.0)
+
+    pipe.setex.assert_called_once_with(
+        "bp:song_new", blueprint_cache.BLUEPRINT_CACHE_TTL_SECONDS, '{"song_id": "song_new"}'
+    )
+    pipe.zadd.assert_called_once_with("bp:index", {"song_new": 1700000000.0})
+    pipe.zremrangebyrank.assert_called_once_with(
+        "bp:index", 0, -blueprint_cache.BLUEPRINT_INDEX_SIZE - 1
+    )
+    pipe.execute.assert_called_once()
+
+
+def test_list_blueprints_limit_bounded_by_index(client):
+    """Test that listings cannot ask for more than the index keeps."""
+    response = client.get(f"/api/song/blueprints?limit={blueprint_cache.BLUEPRINT_INDEX_SIZE + 1}")
+    assert response.status_code == 422
@@ -1,10 +1,14 @@
 """
 Tests for Stable Audio API integration
 """
+import json
+
+import orjson
 import pytest
 from unittest.mock import patch, Mock, AsyncMock
 from fastapi.testclient import TestClient
 from app.main import app
+from app.providers.http_clients import aclose_http_clients, get_http_client, run_sync
 from app.providers.stable_audio_api import generate_stable_audio, StableAudioAPIError
 from app.core.config import InstrumentalEngineConfig
 
@@ -26,15 +30,15 @@ async def test_stable_audio_api_success():
     # Mock httpx.AsyncClient
     with patch("app.providers.stable_audio_api.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         # Mock successful response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "status": "ready",
             "audio_url": "https://cdn.stableaudio.com/test-track.wav",
-        }
+        })
         mock_client.post = AsyncMock(return_value=mock_response)
 
         # Call generate_stable_audio
@@ -52,9 +56,10 @@ async def test_stable_audio_api_success():
         call_args = mock_client.post.call_args
         assert call_args[0][0] == "https://api.stableaudio.com/v2/generate/audio"
         assert call_args[1]["headers"]["Authorization"] == "Bearer sk-test-key"
-        assert call_args[1]["json"]["model"] == "stable-audio-1.0"
-        assert call_args[1]["json"]["prompt"] == "epic orchestral battle music"
-        assert call_args[1]["json"]["seconds_total"] == 30
+        body = json.loads(call_args[1]["content"])
+        assert body["model"] == "stable-audio-1.0"
+        assert body["prompt"] == "epic orchestral battle music"
+        assert body["seconds_total"] == 30
 
 
 @pytest.mark.asyncio
@@ -111,7 +116,7 @@ async def test_stable_audio_api_http_error():
 
     with patch("app.providers.stable_audio_api.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         # Mock error response
         mock_response = Mock()
@@ -141,15 +146,15 @@ async def test_stable_audio_api_invalid_response():
 
     with patch("app.providers.stable_audio_api.httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         # Mock response with unexpected format
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "status": "pending",  # Not "ready"
             # Missing audio_url
-        }
+        })
         mock_client.post = AsyncMock(return_value=mock_response)
 
         with pytest.raises(StableAudioAPIError, match="unexpected response"):
@@ -160,6 +165,23 @@ async def test_stable_audio_api_invalid_response():
             )
 
 
+def test_provider_http_client_shared_and_closed():
+    """Test provider HTTP clients are reused across run_sync calls until closed."""
+    async def get_client():
+        return get_http_client("stable_audio")
+
+    first = run_sync(get_client())
+    second = run_sync(get_client())
+
+    assert first is second
+    assert not first.is_closed
+
+    run_sync(aclose_http_clients())
+    assert first.is_closed
+    assert run_sync(get_client()) is not first
+    run_sync(aclose_http_clients())
+
+
 def test_config_endpoint_includes_stable_audio_api():
     """Test config endpoint includes Stable Audio API when configured."""
     with patch("app.api.routes.config.settings") as mock_settings:
@@ -240,14 +262,14 @@ def test_instrumental_render_with_stable_audio_api():
         # Mock the async API call
         with patch("app.providers.stable_audio_api.httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {
+            mock_response.content = orjson.dumps({
                 "status": "ready",
                 "audio_url": "https://cdn.stableaudio.com/epic-orchestral.wav",
-            }
+            })
             mock_client.post = AsyncMock(return_value=mock_response)
 
             # Render with stable_audio_api engine
@@ -1,4 +1,8 @@
 #!/bin/bash
 redis-server --daemonize yes
 cd quillmusic/backend
-uvicorn app.main:app --host 0.0.0.0 --port 5000
+# uvloop + httptools come with uvicorn[standard]. Worker count follows
+# WEB_CONCURRENCY (default 1): render jobs are tracked in process memory.
+uvicorn app.main:app --host 0.0.0.0 --port 5000 \
+  --loop uvloop --http httptools \
+  --limit-concurrency 1000 --timeout-keep-alive 30